@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-19 06:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0013_businessblockcomponent_catalogmenucomponent_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='layout',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Дата изменения'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2 on 2026-10-19 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('garpix_page', '0030_formcomponent_form_description_de_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formcomponent',
+            name='duplicate_window',
+            field=models.PositiveIntegerField(default=0, help_text='Повторная отправка с тем же ключом идемпотентности или теми же данными в течение окна возвращает исходный ответ. 0 - отключено', verbose_name='Окно защиты от дублей (сек)'),
+        ),
+        migrations.AddField(
+            model_name='formcomponent',
+            name='rate_limit',
+            field=models.PositiveIntegerField(default=0, help_text='Сколько отправок разрешено с одного IP/сессии за период. 0 - без ограничений', verbose_name='Лимит отправок'),
+        ),
+        migrations.AddField(
+            model_name='formcomponent',
+            name='rate_limit_period',
+            field=models.PositiveIntegerField(default=60, verbose_name='Период лимита (сек)'),
+        ),
+    ]
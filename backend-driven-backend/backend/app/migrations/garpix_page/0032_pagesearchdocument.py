@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-19 05:20
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_vector_index(apps, schema_editor):
+    # GIN-индекс по tsvector есть только в PostgreSQL, в остальных БД поиск идет по тексту документа
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX garpix_page_pagesearchdocument_vector_gin '
+            'ON garpix_page_pagesearchdocument USING gin (vector)'
+        )
+
+
+def drop_vector_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS garpix_page_pagesearchdocument_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('garpix_page', '0031_formcomponent_rate_limit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=10, verbose_name='Язык')),
+                ('title', models.TextField(blank=True, default='', verbose_name='Заголовок')),
+                ('body', models.TextField(blank=True, default='', verbose_name='Текст')),
+                ('vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='garpix_page.basepage', verbose_name='Страница')),
+            ],
+            options={
+                'verbose_name': 'Поисковый документ | Search document',
+                'verbose_name_plural': 'Поисковые документы | Search documents',
+                'unique_together': {('page', 'language')},
+            },
+        ),
+        migrations.RunPython(create_vector_index, drop_vector_index),
+    ]
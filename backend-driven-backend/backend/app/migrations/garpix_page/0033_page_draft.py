@@ -0,0 +1,83 @@
+# Generated by Django 4.2 on 2026-10-19 05:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from garpix_page.utils.json_patch import apply_patch, make_patch
+
+
+def move_draft_data(apps, schema_editor):
+    BasePage = apps.get_model('garpix_page', 'BasePage')
+    BaseComponent = apps.get_model('garpix_page', 'BaseComponent')
+    PageDraft = apps.get_model('garpix_page', 'PageDraft')
+    ComponentDraft = apps.get_model('garpix_page', 'ComponentDraft')
+
+    PageDraft.objects.bulk_create([
+        PageDraft(page_id=pk, patch=make_patch({}, draft_data), revision=1)
+        for pk, draft_data in BasePage.objects.filter(draft_data__isnull=False).values_list('pk', 'draft_data')
+    ])
+    ComponentDraft.objects.bulk_create([
+        ComponentDraft(component_id=pk, patch=make_patch({}, draft_data), revision=1)
+        for pk, draft_data in BaseComponent.objects.filter(draft_data__isnull=False).values_list('pk', 'draft_data')
+    ])
+
+
+def restore_draft_data(apps, schema_editor):
+    BasePage = apps.get_model('garpix_page', 'BasePage')
+    BaseComponent = apps.get_model('garpix_page', 'BaseComponent')
+    PageDraft = apps.get_model('garpix_page', 'PageDraft')
+    ComponentDraft = apps.get_model('garpix_page', 'ComponentDraft')
+
+    for draft in PageDraft.objects.all():
+        BasePage.objects.filter(pk=draft.page_id).update(draft_data=apply_patch({}, draft.patch))
+    for draft in ComponentDraft.objects.all():
+        BaseComponent.objects.filter(pk=draft.component_id).update(draft_data=apply_patch({}, draft.patch))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('garpix_page', '0032_pagesearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageDraft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('patch', models.JSONField(default=list, verbose_name='Изменения (JSON Patch)')),
+                ('revision', models.PositiveIntegerField(default=0, verbose_name='Ревизия')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+                ('page', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='draft', to='garpix_page.basepage', verbose_name='Страница')),
+            ],
+            options={
+                'verbose_name': 'Черновик страницы | Page draft',
+                'verbose_name_plural': 'Черновики страниц | Page drafts',
+            },
+        ),
+        migrations.CreateModel(
+            name='ComponentDraft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('patch', models.JSONField(default=list, verbose_name='Изменения (JSON Patch)')),
+                ('revision', models.PositiveIntegerField(default=0, verbose_name='Ревизия')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+                ('component', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='draft', to='garpix_page.basecomponent', verbose_name='Компонент')),
+            ],
+            options={
+                'verbose_name': 'Черновик компонента | Component draft',
+                'verbose_name_plural': 'Черновики компонентов | Component drafts',
+            },
+        ),
+        migrations.RunPython(move_draft_data, restore_draft_data),
+        migrations.RemoveField(
+            model_name='basecomponent',
+            name='draft_data',
+        ),
+        migrations.RemoveField(
+            model_name='basepage',
+            name='draft_data',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-19 05:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('garpix_page', '0033_page_draft'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='garpixpagesiteconfiguration',
+            name='home_page',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='garpix_page.basepage', verbose_name='Главная страница'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from garpix_page.models import BaseComponent
+from garpix_page.utils.menu_tree import get_menu_tree
 
 
 class CatalogMenuComponent(BaseComponent):
@@ -28,6 +29,11 @@ class CatalogMenuComponent(BaseComponent):
 
     template = 'pages/components/catalog_menu.html'
 
+    def get_context(self, request):
+        context = super().get_context(request)
+        context['menu'] = get_menu_tree(self.menu_code, self.max_depth)
+        return context
+
     class Meta:
         verbose_name = 'Меню каталога'
         verbose_name_plural = 'Меню каталога'
@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.db import models
 from garpix_page.models import BaseComponent
+from garpix_page.utils.menu_tree import get_menu_tree
 
 
 class HeaderNavComponent(BaseComponent):
@@ -32,6 +34,15 @@ class HeaderNavComponent(BaseComponent):
 
     template = 'pages/components/header_nav.html'
 
+    # пункты верхнего меню из garpix-menu
+    menu_code = settings.MENU_TYPE_HEADER_MENU
+    menu_max_depth = 2
+
+    def get_context(self, request):
+        context = super().get_context(request)
+        context['menu'] = get_menu_tree(self.menu_code, self.menu_max_depth)
+        return context
+
     class Meta:
         verbose_name = 'Верхнее меню'
         verbose_name_plural = 'Верхнее меню'
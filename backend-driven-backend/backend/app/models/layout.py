@@ -9,6 +9,7 @@ class Layout(models.Model):
         verbose_name='Код',
         help_text='Уникальный код раскладки (slug)'
     )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Дата изменения')
 
     class Meta:
         verbose_name = 'Раскладка'
@@ -8,6 +8,8 @@ class ProductPage(BasePage):
     """
 
     template = 'pages/product.html'
+    # корзины и заказы при клонировании товара не копируются
+    clone_exclude_relations = ('cartitem', 'orderitem')
     product_category = models.ForeignKey(
         'app.Category',
         on_delete=models.SET_NULL,
@@ -23,6 +25,15 @@ class ProductPage(BasePage):
     )
     description = models.TextField('Описание', blank=True, default='')
 
+    def get_context(self, request=None, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        if kwargs.get('api', False):
+            from app.serializers import ProductImageSerializer
+            context['images'] = ProductImageSerializer(
+                self.images.all(), many=True, context={'request': request}
+            ).data
+        return context
+
     class Meta:
         verbose_name = 'Товар'
         verbose_name_plural = 'Товары'
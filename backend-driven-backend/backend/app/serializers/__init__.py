@@ -6,6 +6,7 @@ from .components import (
     FavoriteTeaserItemSerializer,
     FooterLinkGroupSerializer, FooterLinkItemSerializer,
     FooterLinksComponentSerializer,
+    ProductImageSerializer,
     RecommendationItemSerializer,
     RecommendationsComponentSerializer,
     ServiceItemSerializer,
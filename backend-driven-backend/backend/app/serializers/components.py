@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from garpix_page.serializers import ImageSrcsetField
+from app.models import ProductImage
 from app.models.components import (
     CategoryTilesComponent,
     CategoryTileItem,
@@ -16,6 +18,14 @@ from app.models.components import (
 )
 
 
+class ProductImageSerializer(serializers.ModelSerializer):
+    image_srcset = ImageSrcsetField(source='image')
+
+    class Meta:
+        model = ProductImage
+        fields = ('image', 'image_srcset', 'alt', 'sort')
+
+
 class CategoryTileItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = CategoryTileItem
@@ -35,12 +45,15 @@ class CategoryTilesComponentSerializer(serializers.ModelSerializer):
 
 
 class RecommendationItemSerializer(serializers.ModelSerializer):
+    image_srcset = ImageSrcsetField(source='image')
+
     class Meta:
         model = RecommendationItem
         fields = (
             'title',
             'url',
             'image',
+            'image_srcset',
             'price_value',
             'price_currency',
             'address',
@@ -135,12 +148,15 @@ class ServicesAndFeaturesComponentSerializer(serializers.ModelSerializer):
 
 
 class FavoriteTeaserItemSerializer(serializers.ModelSerializer):
+    image_srcset = ImageSrcsetField(source='image')
+
     class Meta:
         model = FavoriteTeaserItem
         fields = (
             'title',
             'url',
             'image',
+            'image_srcset',
             'price_value',
             'price_currency',
             'address',
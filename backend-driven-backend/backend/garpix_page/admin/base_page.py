@@ -60,7 +60,6 @@ class PageAdmin(TabbedModelAdmin, TabbedTranslationAdmin, PolymorphicMPTTChildMo
     raw_id_fields = ('parent',)
 
     readonly_fields = ('url', 'created_at', 'updated_at')
-    exclude = ('draft_data',)
 
     def get_form(self, request, *args, **kwargs):
         form = super().get_form(request, *args, **kwargs)
@@ -191,7 +190,6 @@ class RealPageAdmin(DraggableMPTTAdmin, TabbedTranslationAdmin, PolymorphicMPTTP
     list_editable = ('is_active',)
 
     readonly_fields = ('created_at', 'updated_at', 'model_name')
-    exclude = ('draft_data',)
 
     def delete_queryset(self, cls, request, queryset):
         events = []
@@ -236,7 +234,7 @@ class RealPageAdmin(DraggableMPTTAdmin, TabbedTranslationAdmin, PolymorphicMPTTP
         for obj in queryset:
             obj = obj.get_real_instance()
 
-            len_old_title = obj.__class__.objects.filter(title__icontains=obj.title).count()
+            len_old_title = obj.get_clone_count()
             title = f"{obj.title} ({len_old_title})"
             slug = f"{obj.slug}-{len_old_title}"
             obj.title = title
@@ -283,7 +281,7 @@ class RealPageAdmin(DraggableMPTTAdmin, TabbedTranslationAdmin, PolymorphicMPTTP
             obj = self.get_object(request, pk)
             obj = obj.get_real_instance()
             title = request.POST.get('title', None)
-            len_old_title = obj.__class__.objects.filter(title__icontains=obj.title).count()
+            len_old_title = obj.get_clone_count()
             if not title:
                 title = f"{obj.title} ({len_old_title})" if len_old_title > 0 else obj.title
             slug = f"{obj.slug}-{len_old_title}"
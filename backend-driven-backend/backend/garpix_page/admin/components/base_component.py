@@ -20,9 +20,6 @@ class BaseComponentAdmin(PolymorphicChildModelAdmin, TabbedTranslationAdmin, Cre
     base_form = BaseComponentForm
     list_display = ('title', 'model_name')
     search_fields = ('title', 'pages__title')
-    exclude = ('draft_data',)
-    
-    # Поля черновиков больше не используются
 
     filter_horizontal = (
         'pages',
@@ -92,7 +89,6 @@ class RealBaseComponentAdmin(PolymorphicParentModelAdmin, TabbedTranslationAdmin
     search_fields = ('title', 'pages__title')
     list_editable = ('is_active',)
     actions = ('clone_object', 'soft_delete_queryset', 'restore_queryset')
-    exclude = ('draft_data',)
 
     def get_actions(self, request):
         actions = super().get_actions(request)
@@ -140,7 +136,7 @@ class RealBaseComponentAdmin(PolymorphicParentModelAdmin, TabbedTranslationAdmin
 
             obj = obj.get_real_instance()
 
-            len_old_title = obj.__class__.objects.filter(title__icontains=obj.title).count()
+            len_old_title = obj.get_clone_count()
             title = f"{obj.title} ({len_old_title})" if len_old_title > 0 else obj.title
 
             new_obj = obj.clone_object(title=title)
@@ -174,7 +170,7 @@ class RealBaseComponentAdmin(PolymorphicParentModelAdmin, TabbedTranslationAdmin
             title = request.POST.get('title', None)
 
             if not title:
-                len_old_title = obj.__class__.objects.filter(title__icontains=obj.title).count()
+                len_old_title = obj.get_clone_count()
                 title = f"{obj.title} ({len_old_title})" if len_old_title > 0 else obj.title
 
             new_obj = obj.clone_object(title=title)
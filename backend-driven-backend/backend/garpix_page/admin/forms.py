@@ -124,7 +124,7 @@ class PageForm(PolymorpicMPTTAdminForm):
 
         languages = [x[0] for x in settings.LANGUAGES]
 
-        pages = BasePage.objects.filter(url=self.instance.url).exclude(pk=self.instance.pk)
+        pages = BasePage.objects.filter(url=self.instance.url).exclude(pk=self.instance.pk).prefetch_related('sites')
 
         for page in pages:
             if page.absolute_url == self.instance.url and any(set(sites) & set(page.sites.all())):
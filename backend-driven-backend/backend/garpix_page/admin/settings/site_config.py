@@ -6,4 +6,4 @@ from garpix_page.models.settings import GarpixPageSiteConfiguration
 
 @admin.register(GarpixPageSiteConfiguration)
 class GarpixPageSiteConfigurationAdmin(GarpixSiteConfigurationAdmin):
-    pass
+    readonly_fields = ('home_page',)
@@ -7,3 +7,6 @@ class GarpixPageConfig(AppConfig):
 
     def ready(self):
         import garpix_page.signals  # noqa
+        from garpix_page.utils.translation_fields import build_translation_fields
+
+        build_translation_fields()
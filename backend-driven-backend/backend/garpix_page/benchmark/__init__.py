@@ -0,0 +1,2 @@
+from .seed import seed  # noqa
+from .runner import compare_results, get_scenarios, run_scenario  # noqa
@@ -0,0 +1,130 @@
+import statistics
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.permissions import AllowAny
+
+from garpix_page.models import BasePage, PageDraft
+from garpix_page.utils.json_patch import make_patch
+
+
+PERMISSION_CHECKS = 1000
+
+
+class Scenario:
+    """
+    Замеряемая операция: setup выполняется перед каждым повтором и в замер не входит.
+    """
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def get_scenarios(data):
+    client = Client()
+    api_url = f'/{settings.API_URL}'
+    leaf, root = data.leaf, data.root
+
+    def set_draft(i):
+        patch = make_patch({}, {'page_data': {'title': f'Benchmark draft {i}'}})
+        PageDraft.objects.update_or_create(page_id=leaf.pk, defaults={'patch': patch})
+
+    # проверка прав вызывается во view один-два раза на запрос, замеряется PERMISSION_CHECKS запросов подряд
+    requests = []
+
+    def make_requests(i):
+        factory = RequestFactory()
+        requests[:] = [factory.get(leaf.url) for _ in range(PERMISSION_CHECKS)]
+
+    def check_permissions(page):
+        for request in requests:
+            page.has_permission_required(request)
+            page.has_permission_required(request)
+
+    page_with_permissions = BasePage.objects.get(pk=leaf.pk).get_real_instance()
+    page_with_permissions.permissions = [AllowAny]
+
+    def move_slug(i):
+        page = BasePage.objects.get(pk=root.pk).get_real_instance()
+        page.slug = f'benchmark-moved-{i}'
+        page.save()
+
+    return [
+        Scenario('page_api', lambda i: client.get(f'{api_url}/page{leaf.url}')),
+        Scenario('page_view', lambda i: client.get(leaf.url)),
+        Scenario('pages_list_create', lambda i: client.get(f'{api_url}/admin/pages/')),
+        Scenario('page_layout', lambda i: client.get(f'{api_url}/admin/pages/{leaf.pk}/layout/')),
+        Scenario('page_publish', lambda i: client.post(f'{api_url}/admin/pages/{leaf.pk}/publish/'), setup=set_draft),
+        Scenario('form_submit', lambda i: client.post(
+            f'{api_url}/forms/{data.form.pk}/submit/',
+            {'email': f'user{i}@example.com', 'message': f'Benchmark message {i}'},
+            content_type='application/json',
+        )),
+        Scenario('slug_move_cascade', move_slug),
+        Scenario('permission_check', lambda i: check_permissions(leaf), setup=make_requests),
+        Scenario('permission_check_required', lambda i: check_permissions(page_with_permissions),
+                 setup=make_requests),
+    ]
+
+
+def run_scenario(scenario, iterations, warmup=1):
+    durations, queries, errors = [], [], 0
+
+    for i in range(warmup):
+        if scenario.setup:
+            scenario.setup(-i - 1)
+        scenario.run(-i - 1)
+
+    for i in range(iterations):
+        if scenario.setup:
+            scenario.setup(i)
+        with CaptureQueriesContext(connection) as context:
+            started_at = time.perf_counter()
+            response = scenario.run(i)
+            durations.append((time.perf_counter() - started_at) * 1000)
+        queries.append(len(context.captured_queries))
+        if response is not None and response.status_code >= 400:
+            errors += 1
+
+    # аллокации меряются отдельным прогоном, tracemalloc сильно замедляет выполнение
+    if scenario.setup:
+        scenario.setup(iterations)
+    tracemalloc.start()
+    scenario.run(iterations)
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    durations.sort()
+    return {
+        'iterations': iterations,
+        'errors': errors,
+        'median_ms': round(statistics.median(durations), 3),
+        'p95_ms': round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+        'mean_ms': round(statistics.mean(durations), 3),
+        'min_ms': round(durations[0], 3),
+        'queries': int(statistics.median(queries)),
+        'alloc_peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare_results(results, baseline, threshold):
+    """
+    Возвращает список регрессий относительно baseline: рост медианы больше чем на threshold
+    или рост числа запросов к БД.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result['median_ms'] > base['median_ms'] * (1 + threshold):
+            regressions.append(f"{name}: median {base['median_ms']} -> {result['median_ms']} ms")
+        if result['queries'] > base['queries']:
+            regressions.append(f"{name}: queries {base['queries']} -> {result['queries']}")
+    return regressions
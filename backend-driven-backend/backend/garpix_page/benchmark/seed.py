@@ -0,0 +1,142 @@
+import math
+
+from django.contrib.sites.models import Site
+from django.db.models import ForeignKey
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.test import RequestFactory
+from model_bakery import baker, random_gen
+from model_bakery.generators import default_mapping
+
+from garpix_page.fields.grapes_js_html import GrapesJsHtmlField
+from garpix_page.models import BaseComponent, BaseListPage, BasePage, BaseSearchPage
+from garpix_page.models.components.base_component import PageComponent
+from garpix_page.models.components.form_component import FormComponent
+from garpix_page.utils.get_garpix_page_models import get_garpix_page_component_models, get_garpix_page_models
+
+default_mapping[GrapesJsHtmlField] = random_gen.gen_text
+
+
+class SeedData:
+    """
+    Созданные для замеров страницы и компоненты.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.components = []
+        self.component_models = []
+        self.skipped_component_models = []
+        self.form = None
+
+    @property
+    def root(self):
+        return self.pages[0]
+
+    @property
+    def leaf(self):
+        return self.pages[-1]
+
+
+def _has_template(model):
+    try:
+        get_template(model.template)
+    except (TemplateDoesNotExist, AttributeError):
+        return False
+    return True
+
+
+def get_page_model():
+    """
+    Обычная страница без доступа по правам, подпадежных url и со своим шаблоном.
+    """
+    for model in get_garpix_page_models():
+        if issubclass(model, (BaseListPage, BaseSearchPage)) or getattr(model, 'login_required', False):
+            continue
+        if model.permissions or len(model.url_patterns()) > 1 or not _has_template(model):
+            continue
+        return model
+    raise ValueError('No page model suitable for benchmark')
+
+
+def get_item_relations(component_model):
+    """
+    Внешние ключи дочерних элементов (карточек, ссылок и т.п.) на компонент.
+    """
+    return [
+        relation for relation in component_model._meta.related_objects
+        if isinstance(relation.field, ForeignKey) and not issubclass(relation.related_model, BaseComponent)
+        and relation.related_model is not PageComponent and relation.field.model._meta.app_label != 'garpix_page'
+    ]
+
+
+def _make_component(model, items):
+    component = baker.make(model, title=f'{model.__name__}', is_active=True)
+    for relation in get_item_relations(model):
+        baker.make(relation.related_model, _quantity=items, **{relation.field.name: component})
+    return component
+
+
+def get_component_models(page, items):
+    """
+    Модели компонентов, которые отдаются через API страницы. Остальные пропускаются и попадают в отчет.
+    """
+    request = RequestFactory().get('/')
+    models, skipped = [], []
+    for model in get_garpix_page_component_models():
+        if model is FormComponent:
+            continue
+        try:
+            component = _make_component(model, items)
+            PageComponent.objects.create(page=page, component=component, view_order=0)
+            component.get_api_context_data(request)
+            component.get_context_data(request)
+        except Exception:
+            skipped.append(model)
+        else:
+            models.append(model)
+        finally:
+            PageComponent.objects.filter(page=page).delete()
+    return models, skipped
+
+
+def seed(pages=100, depth=3, components=5, items=5):
+    """
+    Создает дерево из pages страниц глубиной depth, на каждой странице - components компонентов
+    с items дочерними элементами, и форму для отправки.
+    """
+    data = SeedData()
+    sites = Site.objects.all()
+    page_model = get_page_model()
+
+    branch = max(2, math.ceil(pages ** (1 / max(depth, 1))))
+    levels = {}
+    for i in range(pages):
+        parent = data.pages[(i - 1) // branch] if i else None
+        level = levels[parent.pk] + 1 if parent is not None else 0
+        if level >= depth:
+            parent = data.root
+            level = 1
+        page = baker.make(page_model, title=f'Benchmark page {i}', slug=f'benchmark-{i}', parent=parent, sites=sites)
+        levels[page.pk] = level
+        data.pages.append(page)
+    # baker заполняет поля mptt случайными значениями, дерево строится заново
+    BasePage.objects.rebuild()
+
+    data.component_models, data.skipped_component_models = get_component_models(data.root, items)
+    if data.component_models:
+        for page_index, page in enumerate(data.pages):
+            page_components = []
+            for i in range(components):
+                model = data.component_models[(page_index + i) % len(data.component_models)]
+                component = _make_component(model, items)
+                page_components.append(PageComponent(page=page, component=component, view_order=i))
+                data.components.append(component)
+            PageComponent.objects.bulk_create(page_components)
+
+    data.form = baker.make(FormComponent, title='Benchmark form', is_active=True, rate_limit=0,
+                           duplicate_window=0, form_config={'fields': [
+                               {'name': 'email', 'type': 'email', 'label': 'Email', 'required': True},
+                               {'name': 'message', 'type': 'text', 'label': 'Message'},
+                           ]})
+    return data
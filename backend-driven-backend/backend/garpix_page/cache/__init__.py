@@ -1 +1,10 @@
 from .page import cache_service  # noqa
+from .form import form_submit_cache_service  # noqa
+from .search import search_cache_service  # noqa
+from .sitemap import sitemap_cache_service  # noqa
+from .string_handling import string_handling_cache_service  # noqa
+from .draft import draft_cache_service  # noqa
+from .image_variant import image_variant_cache_service  # noqa
+from .breadcrumbs import breadcrumbs_cache_service  # noqa
+from .global_context import global_context_cache_service  # noqa
+from .menu import menu_cache_service  # noqa
@@ -0,0 +1,37 @@
+from django.core.cache import cache
+
+from garpix_page.settings import BREADCRUMBS_CACHE_TIMEOUT
+
+
+class BreadcrumbsCacheService:
+    """
+    Кеш хлебных крошек страниц. Ключи содержат общую версию, которая увеличивается при изменении url,
+    заголовка или родителя любой страницы, поэтому крошки потомков не нужно искать и удалять по одной.
+    """
+    cache_version_key = 'breadcrumbs_version'
+    cache_breadcrumbs_prefix = 'breadcrumbs_'
+
+    def get_version(self):
+        version = cache.get(self.cache_version_key)
+        if version is None:
+            cache.add(self.cache_version_key, 1, None)
+            version = cache.get(self.cache_version_key, 1)
+        return version
+
+    def bump_version(self):
+        try:
+            cache.incr(self.cache_version_key)
+        except ValueError:
+            cache.set(self.cache_version_key, 2, None)
+
+    def _get_breadcrumbs_key(self, page_id, language):
+        return f'{self.cache_breadcrumbs_prefix}{self.get_version()}_{language}_{page_id}'
+
+    def get_breadcrumbs(self, page_id, language):
+        return cache.get(self._get_breadcrumbs_key(page_id, language))
+
+    def set_breadcrumbs(self, page_id, language, breadcrumbs):
+        cache.set(self._get_breadcrumbs_key(page_id, language), breadcrumbs, BREADCRUMBS_CACHE_TIMEOUT)
+
+
+breadcrumbs_cache_service = BreadcrumbsCacheService()
@@ -0,0 +1,26 @@
+import hashlib
+
+from django.core.cache import cache
+
+from garpix_page.settings import DRAFT_PREVIEW_CACHE_TIMEOUT
+
+
+class DraftCacheService:
+    """
+    Кеш ответов предпросмотра черновика. Ключ содержит версию черновика (ревизию), поэтому
+    после сохранения черновика старый предпросмотр просто перестает читаться.
+    """
+    cache_preview_prefix = 'draft_preview_'
+
+    def _get_preview_key(self, page_id, version, language, user_id, path):
+        path_hash = hashlib.md5(path.encode()).hexdigest()
+        return f'{self.cache_preview_prefix}{page_id}_{version}_{language}_{user_id}_{path_hash}'
+
+    def get_preview(self, page_id, version, language, user_id, path):
+        return cache.get(self._get_preview_key(page_id, version, language, user_id, path))
+
+    def set_preview(self, page_id, version, language, user_id, path, data):
+        cache.set(self._get_preview_key(page_id, version, language, user_id, path), data, DRAFT_PREVIEW_CACHE_TIMEOUT)
+
+
+draft_cache_service = DraftCacheService()
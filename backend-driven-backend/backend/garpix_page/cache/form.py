@@ -0,0 +1,86 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+
+from garpix_page.settings import FORM_IDEMPOTENCY_HEADER
+
+
+class FormSubmitCacheService:
+    """
+    Ограничение частоты и защита от повторных отправок форм.
+    Состояние хранится в общем кеше, поэтому работает между воркерами.
+    """
+    cache_rate_limit_prefix = 'form_rate_'
+    cache_submit_prefix = 'form_submit_'
+    pending = '__pending__'
+
+    @staticmethod
+    def get_client_key(request):
+        session = getattr(request, 'session', None)
+        session_key = getattr(session, 'session_key', None)
+        if session_key:
+            return f'session_{session_key}'
+        return f"ip_{request.META.get('REMOTE_ADDR', '')}"
+
+    def consume_token(self, form, client_key):
+        """
+        Учитывает отправку в счетчике (form, client_key) за текущий период.
+        Счетчик увеличивается атомарно (cache.add + cache.incr), поэтому одновременные
+        отправки не превышают лимит. Возвращает 0, если отправка разрешена, иначе - сколько секунд ждать.
+        """
+        if not form.rate_limit or not form.rate_limit_period:
+            return 0
+
+        period = form.rate_limit_period
+        now = time.time()
+        window = int(now // period)
+        cache_key = f'{self.cache_rate_limit_prefix}{form.pk}_{client_key}_{window}'
+
+        cache.add(cache_key, 0, period)
+        try:
+            count = cache.incr(cache_key)
+        except ValueError:
+            # ключ истек между add и incr
+            cache.add(cache_key, 1, period)
+            count = 1
+
+        if count > form.rate_limit:
+            return int((window + 1) * period - now) + 1
+        return 0
+
+    @staticmethod
+    def get_idempotency_key(request, client_key):
+        """
+        Ключ отправки в рамках клиента: заголовок идемпотентности или хеш данных формы.
+        Одинаковый заголовок от разных клиентов не дает доступа к чужому ответу.
+        """
+        key = request.META.get(FORM_IDEMPOTENCY_HEADER)
+        if key:
+            return 'key_' + hashlib.sha256(f'{client_key}:{key}'.encode()).hexdigest()
+        payload = json.dumps(request.data, sort_keys=True, default=str)
+        return 'hash_' + hashlib.sha256(f'{client_key}:{payload}'.encode()).hexdigest()
+
+    def start_submit(self, form, idempotency_key):
+        """
+        Помечает отправку как начатую. Если отправка с таким ключом уже была в окне,
+        возвращает сохраненный ответ (или `pending`, если она еще обрабатывается).
+        """
+        if not form.duplicate_window:
+            return None
+        cache_key = f'{self.cache_submit_prefix}{form.pk}_{idempotency_key}'
+        if cache.add(cache_key, self.pending, form.duplicate_window):
+            return None
+        return cache.get(cache_key, self.pending)
+
+    def finish_submit(self, form, idempotency_key, response_data):
+        if not form.duplicate_window:
+            return
+        cache.set(f'{self.cache_submit_prefix}{form.pk}_{idempotency_key}', response_data, form.duplicate_window)
+
+    def cancel_submit(self, form, idempotency_key):
+        cache.delete(f'{self.cache_submit_prefix}{form.pk}_{idempotency_key}')
+
+
+form_submit_cache_service = FormSubmitCacheService()
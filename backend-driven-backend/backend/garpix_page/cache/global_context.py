@@ -0,0 +1,36 @@
+from django.core.cache import cache
+
+
+class GlobalContextCacheService:
+    """
+    Кеш частей общего контекста. У каждого провайдера своя версия, которая увеличивается
+    при изменении моделей, от которых он зависит; ключи значений содержат версию и значения областей.
+    """
+    cache_version_prefix = 'global_context_version_'
+    cache_context_prefix = 'global_context_'
+
+    def get_versions(self, keys):
+        version_keys = {f'{self.cache_version_prefix}{key}': key for key in keys}
+        versions = cache.get_many(version_keys)
+        for version_key in version_keys.keys() - versions.keys():
+            cache.add(version_key, 1, None)
+            versions[version_key] = cache.get(version_key, 1)
+        return {key: versions[version_key] for version_key, key in version_keys.items()}
+
+    def bump_version(self, key):
+        try:
+            cache.incr(f'{self.cache_version_prefix}{key}')
+        except ValueError:
+            cache.set(f'{self.cache_version_prefix}{key}', 2, None)
+
+    def get_context_key(self, key, version, scope_values):
+        return '_'.join([f'{self.cache_context_prefix}{key}', str(version), *(str(value) for value in scope_values)])
+
+    def get_many(self, context_keys):
+        return cache.get_many(context_keys)
+
+    def set(self, context_key, value, timeout):
+        cache.set(context_key, value, timeout)
+
+
+global_context_cache_service = GlobalContextCacheService()
@@ -0,0 +1,33 @@
+import hashlib
+
+from django.core.cache import cache
+
+from garpix_page.settings import IMAGE_VARIANT_PENDING_TIMEOUT
+
+
+class ImageVariantCacheService:
+    """
+    Манифесты вариантов изображений (размеры оригинала и пути вариантов по ширине) и отметки о том,
+    что генерация вариантов уже поставлена в очередь. Манифест не меняется, пока не изменится файл с тем же именем.
+    """
+    cache_manifest_prefix = 'image_variant_manifest_'
+    cache_pending_prefix = 'image_variant_pending_'
+
+    @staticmethod
+    def _get_name_hash(name):
+        return hashlib.md5(name.encode()).hexdigest()
+
+    def get_manifest(self, name):
+        return cache.get(f'{self.cache_manifest_prefix}{self._get_name_hash(name)}')
+
+    def set_manifest(self, name, manifest):
+        cache.set(f'{self.cache_manifest_prefix}{self._get_name_hash(name)}', manifest, None)
+
+    def add_pending(self, name):
+        """
+        True, если генерация еще не была запрошена за последние IMAGE_VARIANT_PENDING_TIMEOUT секунд.
+        """
+        return cache.add(f'{self.cache_pending_prefix}{self._get_name_hash(name)}', True, IMAGE_VARIANT_PENDING_TIMEOUT)
+
+
+image_variant_cache_service = ImageVariantCacheService()
@@ -0,0 +1,37 @@
+from django.core.cache import cache
+
+from garpix_page.settings import MENU_TREE_CACHE_TIMEOUT
+
+
+class MenuCacheService:
+    """
+    Кеш деревьев меню garpix-menu. Ключи содержат общую версию, которая увеличивается при изменении
+    любого пункта меню или url страниц, на которые ведут пункты.
+    """
+    cache_version_key = 'menu_tree_version'
+    cache_tree_prefix = 'menu_tree_'
+
+    def get_version(self):
+        version = cache.get(self.cache_version_key)
+        if version is None:
+            cache.add(self.cache_version_key, 1, None)
+            version = cache.get(self.cache_version_key, 1)
+        return version
+
+    def bump_version(self):
+        try:
+            cache.incr(self.cache_version_key)
+        except ValueError:
+            cache.set(self.cache_version_key, 2, None)
+
+    def _get_tree_key(self, menu_code, max_depth, language, site_id):
+        return f'{self.cache_tree_prefix}{self.get_version()}_{site_id}_{language}_{max_depth}_{menu_code}'
+
+    def get_tree(self, menu_code, max_depth, language, site_id):
+        return cache.get(self._get_tree_key(menu_code, max_depth, language, site_id))
+
+    def set_tree(self, menu_code, max_depth, language, site_id, tree):
+        cache.set(self._get_tree_key(menu_code, max_depth, language, site_id), tree, MENU_TREE_CACHE_TIMEOUT)
+
+
+menu_cache_service = MenuCacheService()
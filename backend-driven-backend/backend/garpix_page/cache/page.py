@@ -1,39 +1,54 @@
-from django.conf import settings
 from django.core.cache import cache
 
 from garpix_page.utils.all_sites import get_all_sites
+from garpix_page.utils.current_site import get_current_site_id
+from garpix_page.utils.instrumentation import record_cache
 
 
 class PageCacheService:
     cache_url_prefix = 'url_page_'
     cache_instance_prefix = 'instance_page_'
+    cache_home_page_prefix = 'home_page_'
 
     def get_url(self, pk, current_language_code_url_prefix):
-        current_site = getattr(settings, 'SITE_ID', 1)
+        current_site = get_current_site_id()
         cache_key = f'{self.cache_url_prefix}{pk}_{current_site}_{current_language_code_url_prefix}'
         url_cache = cache.get(cache_key)
+        record_cache('get_url', url_cache is not None)
         if url_cache is not None:
             return url_cache
         return None
 
     def set_url(self, pk, current_language_code_url_prefix, result):
-        current_site = getattr(settings, 'SITE_ID', 1)
+        current_site = get_current_site_id()
         cache_key = f'{self.cache_url_prefix}{pk}_{current_site}_{current_language_code_url_prefix}'
         cache.set(cache_key, result)
 
     def get_instance_by_url(self, url):
-        current_site = getattr(settings, 'SITE_ID', 1)
+        current_site = get_current_site_id()
         cache_key = f'{self.cache_instance_prefix}_{current_site}_{url}'
         url_cache = cache.get(cache_key)
+        record_cache('get_instance_by_url', url_cache is not None)
         if url_cache is not None:
             return url_cache
         return None
 
     def set_instance_by_url(self, url, result):
-        current_site = getattr(settings, 'SITE_ID', 1)
+        current_site = get_current_site_id()
         cache_key = f'{self.cache_instance_prefix}_{current_site}_{url}'
         cache.set(cache_key, result)
 
+    def get_home_page_id(self, site_id):
+        """
+        id главной страницы сайта, 0 - главной страницы нет, None - значение не закешировано.
+        """
+        home_page_id = cache.get(f'{self.cache_home_page_prefix}{site_id}')
+        record_cache('get_home_page_id', home_page_id is not None)
+        return home_page_id
+
+    def set_home_page_id(self, site_id, home_page_id):
+        cache.set(f'{self.cache_home_page_prefix}{site_id}', home_page_id or 0)
+
     def set_seo_by_page(self, pk, field_name, result, site):
         cache_key = f'page_{field_name}_{site}_{pk}'
         cache.set(cache_key, result)
@@ -41,6 +56,7 @@ class PageCacheService:
     def get_seo_by_page(self, pk, field_name, site):
         cache_key = f'page_{field_name}_{site}_{pk}'
         seo_cache = cache.get(cache_key)
+        record_cache('get_seo_by_page', seo_cache is not None)
         if seo_cache is not None:
             return seo_cache
         return None
@@ -49,15 +65,16 @@ class PageCacheService:
         from garpix_page.models import BasePage
         seo_fields = [field_name for field in BasePage._meta.get_fields() if (field_name := field.name)[:4] == 'seo_']
         keys = []
+        sites = get_all_sites()
         if pk:
             for seo_field in seo_fields:
-                for site in get_all_sites():
+                for site in sites:
                     keys.append(f'page_{seo_field}_{site}_{pk}')
         else:
-            for page in BasePage.objects.all():
+            for page_pk in BasePage.objects.values_list('pk', flat=True):
                 for seo_field in seo_fields:
-                    for site in get_all_sites():
-                        keys.append(f'page_{seo_field}_{site}_{page.pk}')
+                    for site in sites:
+                        keys.append(f'page_{seo_field}_{site}_{page_pk}')
 
         cache.delete_many(keys=keys)
 
@@ -69,7 +86,7 @@ class PageCacheService:
 
     def reset_url_info_by_page(self, instance, current_language_code_url_prefix):
         pk, old_url = instance.pk, instance.get_absolute_url()
-        current_site = getattr(settings, 'SITE_ID', 1)
+        current_site = get_current_site_id()
         url_cache_key = f'{self.cache_url_prefix}{pk}_{current_site}_{current_language_code_url_prefix}'
         instance_cache_key = f'{self.cache_instance_prefix}_{current_site}_{old_url}'
         cache.delete(url_cache_key)
@@ -0,0 +1,40 @@
+import hashlib
+
+from django.core.cache import cache
+
+from garpix_page.settings import SEARCH_RESULTS_CACHE_TIMEOUT
+
+
+class SearchCacheService:
+    """
+    Кеш ранжированных результатов поиска. Все ключи содержат версию поискового индекса,
+    поэтому при любом изменении страниц достаточно увеличить версию.
+    """
+    cache_version_key = 'search_index_version'
+    cache_results_prefix = 'search_results_'
+
+    def get_version(self):
+        version = cache.get(self.cache_version_key)
+        if version is None:
+            cache.add(self.cache_version_key, 1, None)
+            version = cache.get(self.cache_version_key, 1)
+        return version
+
+    def bump_version(self):
+        try:
+            cache.incr(self.cache_version_key)
+        except ValueError:
+            cache.set(self.cache_version_key, 2, None)
+
+    def _get_results_key(self, site_id, language, query):
+        query_hash = hashlib.md5(query.encode()).hexdigest()
+        return f'{self.cache_results_prefix}{self.get_version()}_{site_id}_{language}_{query_hash}'
+
+    def get_result_ids(self, site_id, language, query):
+        return cache.get(self._get_results_key(site_id, language, query))
+
+    def set_result_ids(self, site_id, language, query, result_ids):
+        cache.set(self._get_results_key(site_id, language, query), result_ids, SEARCH_RESULTS_CACHE_TIMEOUT)
+
+
+search_cache_service = SearchCacheService()
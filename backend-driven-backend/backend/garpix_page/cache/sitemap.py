@@ -0,0 +1,41 @@
+from django.core.cache import cache
+
+from garpix_page.settings import SITEMAP_CACHE_TIMEOUT
+from garpix_page.utils.current_site import get_current_site_id
+
+
+class SitemapCacheService:
+    """
+    Кеш готовых секций карты сайта. Ключ содержит валидатор секции,
+    поэтому после изменения страниц из секции устаревшая запись просто перестает читаться.
+    url потомков пересчитываются через bulk_update без изменения updated_at, поэтому в валидатор
+    входит еще и общая версия, которая увеличивается после такого пересчета.
+    """
+    cache_version_key = 'sitemap_version'
+    cache_section_prefix = 'sitemap_section_'
+
+    def get_version(self):
+        version = cache.get(self.cache_version_key)
+        if version is None:
+            cache.add(self.cache_version_key, 1, None)
+            version = cache.get(self.cache_version_key, 1)
+        return version
+
+    def bump_version(self):
+        try:
+            cache.incr(self.cache_version_key)
+        except ValueError:
+            cache.set(self.cache_version_key, 2, None)
+
+    def _get_section_key(self, section, language, protocol, validator):
+        current_site = get_current_site_id()
+        return f'{self.cache_section_prefix}{current_site}_{protocol}_{language}_{section}_{validator}'
+
+    def get_section(self, section, language, protocol, validator):
+        return cache.get(self._get_section_key(section, language, protocol, validator))
+
+    def set_section(self, section, language, protocol, validator, content):
+        cache.set(self._get_section_key(section, language, protocol, validator), content, SITEMAP_CACHE_TIMEOUT)
+
+
+sitemap_cache_service = SitemapCacheService()
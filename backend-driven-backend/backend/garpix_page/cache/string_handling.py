@@ -0,0 +1,27 @@
+import hashlib
+
+from django.core.cache import cache
+
+from garpix_page.settings import STRING_HANDLING_CACHE_TIMEOUT, STRING_HANDLING_CACHE_VERSION
+
+
+class StringHandlingCacheService:
+    """
+    Кеш html полей GrapesJS после обработки тегов. Ключ - хеш исходного значения и версия обработчиков,
+    после изменения обработчиков или используемых в тегах шаблонных тегов достаточно увеличить
+    GARPIX_PAGE_STRING_HANDLING_CACHE_VERSION.
+    """
+    cache_html_prefix = 'string_handling_'
+
+    def _get_html_key(self, string, method):
+        string_hash = hashlib.md5(string.encode()).hexdigest()
+        return f'{self.cache_html_prefix}{STRING_HANDLING_CACHE_VERSION}_{method}_{string_hash}'
+
+    def get_html(self, string, method):
+        return cache.get(self._get_html_key(string, method))
+
+    def set_html(self, string, method, html):
+        cache.set(self._get_html_key(string, method), html, STRING_HANDLING_CACHE_TIMEOUT)
+
+
+string_handling_cache_service = StringHandlingCacheService()
@@ -1,2 +1,5 @@
+from garpix_page.contexts.providers import global_context_registry
+
+
 def global_context(request, page):
-    return {}
+    return global_context_registry.get_context(request)
@@ -0,0 +1,119 @@
+from django.apps import apps
+from django.utils.module_loading import import_string
+from django.utils.translation import get_language
+
+from garpix_page.cache import global_context_cache_service
+from garpix_page.settings import GLOBAL_CONTEXT_CACHE_TIMEOUT, GLOBAL_CONTEXT_PROVIDERS
+from garpix_page.utils.current_site import get_current_site_id
+
+
+class GlobalContextProvider:
+    """
+    Часть общего контекста страниц (меню, настройки сайта, данные шапки и подвала).
+    Значение кешируется отдельно для каждого сочетания областей scope ('site', 'language', 'user')
+    и сбрасывается при сохранении или удалении объектов моделей models (включая наследников).
+    Значение не должно зависеть от страницы: оно общее и для страниц ошибок.
+    """
+    key = None
+    scope = ('site', 'language')
+    models = ()
+    timeout = GLOBAL_CONTEXT_CACHE_TIMEOUT
+
+    def get_context(self, request):
+        raise NotImplementedError
+
+    def get_scope_values(self, request):
+        values = []
+        for scope in self.scope:
+            if scope == 'site':
+                values.append(get_current_site_id())
+            elif scope == 'language':
+                values.append(get_language())
+            elif scope == 'user':
+                user = getattr(request, 'user', None)
+                values.append(user.pk if user is not None and user.is_authenticated else 0)
+            else:
+                raise ValueError(f'Unknown global context scope {scope!r}')
+        return values
+
+    def get_models(self):
+        return [apps.get_model(model) if isinstance(model, str) else model for model in self.models]
+
+
+class GlobalContextRegistry:
+    """
+    Провайдеры общего контекста из GARPIX_PAGE_GLOBAL_CONTEXT_PROVIDERS и зарегистрированные через register.
+    """
+
+    def __init__(self):
+        self._providers = None
+        self._dependencies = {}
+
+    @property
+    def providers(self):
+        if self._providers is None:
+            self._providers = {}
+            for path in GLOBAL_CONTEXT_PROVIDERS:
+                self.register(import_string(path))
+        return self._providers
+
+    def register(self, provider_class):
+        provider = provider_class()
+        self.providers[provider.key] = provider
+        self._dependencies = {}
+        return provider_class
+
+    def unregister(self, key):
+        self.providers.pop(key, None)
+        self._dependencies = {}
+
+    def get_dependent_keys(self, model):
+        if model not in self._dependencies:
+            self._dependencies[model] = [
+                key for key, provider in self.providers.items()
+                if any(issubclass(model, dependency) for dependency in provider.get_models())
+            ]
+        return self._dependencies[model]
+
+    def invalidate(self, model):
+        keys = self.get_dependent_keys(model)
+        for key in keys:
+            global_context_cache_service.bump_version(key)
+        if keys:
+            from garpix_page.export import schedule_static_export
+            schedule_static_export()
+
+    def get_version(self):
+        """
+        Общая версия всех провайдеров для кешей, построенных поверх общего контекста.
+        """
+        versions = global_context_cache_service.get_versions(sorted(self.providers))
+        return '.'.join(f'{key}{version}' for key, version in versions.items())
+
+    def get_context(self, request):
+        """
+        Общий контекст {key провайдера: значение}: версии и значения всех провайдеров
+        читаются из кеша двумя запросами, отсутствующие значения собираются и кешируются.
+        """
+        providers = self.providers
+        if not providers:
+            return {}
+        versions = global_context_cache_service.get_versions(providers)
+        context_keys = {
+            key: global_context_cache_service.get_context_key(key, versions[key], provider.get_scope_values(request))
+            for key, provider in providers.items()
+        }
+        cached = global_context_cache_service.get_many(context_keys.values())
+
+        context = {}
+        for key, provider in providers.items():
+            context_key = context_keys[key]
+            if context_key in cached:
+                context[key] = cached[context_key]
+            else:
+                context[key] = provider.get_context(request)
+                global_context_cache_service.set(context_key, context[key], provider.timeout)
+        return context
+
+
+global_context_registry = GlobalContextRegistry()
@@ -0,0 +1,2 @@
+from .pages import export_pages, get_page_versions, render_pages  # noqa
+from .schedule import schedule_static_export  # noqa
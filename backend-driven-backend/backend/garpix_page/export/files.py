@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+
+
+def write_atomic(path, content):
+    """
+    Запись файла через временный файл в том же каталоге и os.replace:
+    веб-сервер видит либо старую, либо новую версию целиком.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def remove_file(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def get_manifest_path(root):
+    return os.path.join(root, 'manifest.json')
+
+
+def load_manifest(root):
+    """
+    Манифест выгрузки: {"<site_id>:<page_id>": {"version": ..., "files": [...]}}.
+    """
+    try:
+        with open(get_manifest_path(root)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(root, manifest):
+    write_atomic(get_manifest_path(root), json.dumps(manifest, sort_keys=True).encode())
@@ -0,0 +1,161 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.test import Client
+from django.utils import translation
+
+from garpix_page.cache import menu_cache_service
+from garpix_page.contexts.providers import global_context_registry
+from garpix_page.settings import STATIC_EXPORT_BATCH_SIZE, STATIC_EXPORT_WORKERS
+from garpix_page.utils.current_site import override_site
+from garpix_page.utils.get_current_language_code_url_prefix import get_current_language_code_url_prefix
+from garpix_page.utils.get_languages import get_languages
+from garpix_page.utils.site_registry import site_registry
+from .files import load_manifest, remove_file, save_manifest, write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def get_shared_version():
+    """
+    Версия общих для всех страниц данных: деревьев меню и общего контекста.
+    Версии хранятся в кеше, поэтому после очистки кеша выгрузку нужно перестроить с --force.
+    """
+    return f'{menu_cache_service.get_version()}.{global_context_registry.get_version()}'
+
+
+def get_page_versions(site):
+    """
+    {page_id: (url, версия)} активных страниц сайта. Версия меняется вместе с url и updated_at
+    страницы, ее раскладки, компонентов, предков (хлебные крошки) и дочерних страниц (подстраницы,
+    списки), при удалении компонента или дочерней страницы, а также вместе с get_shared_version.
+    """
+    from garpix_page.models import BasePage
+
+    pages = BasePage.objects.non_polymorphic().order_by()
+    ancestors = pages.filter(
+        tree_id=OuterRef('tree_id'), lft__lt=OuterRef('lft'), rght__gt=OuterRef('rght')
+    ).values('tree_id').annotate(updated_at=Max('updated_at')).values('updated_at')
+    children = pages.filter(parent=OuterRef('pk')).values('parent').annotate(
+        updated_at=Max('updated_at'), count=Count('id')
+    )
+    pages = pages.filter(is_active=True, sites=site).values(
+        'id', 'url', 'updated_at', 'layout__updated_at',
+    ).annotate(
+        components_updated_at=Max('pagecomponent__component__updated_at'),
+        components_count=Count('pagecomponent'),
+        ancestors_updated_at=Subquery(ancestors),
+        children_updated_at=Subquery(children.values('updated_at')),
+        children_count=Subquery(children.values('count')),
+    )
+    shared_version = get_shared_version()
+    versions = {}
+    for page in pages:
+        dates = (page['updated_at'], page['layout__updated_at'], page['components_updated_at'],
+                 page['ancestors_updated_at'], page['children_updated_at'])
+        version = '|'.join([page['url'], *(date.isoformat() if date else '' for date in dates),
+                            str(page['components_count']), str(page['children_count'] or 0), shared_version])
+        versions[page['id']] = (page['url'], version)
+    return versions
+
+
+def get_page_paths(url):
+    """
+    Пути запросов страницы во всех языках: (язык, путь запроса, имя файла).
+    Файлы кладутся по пути запроса, чтобы веб-сервер отдавал их через try_files $uri/index.*.
+    """
+    paths = []
+    for language in get_languages():
+        with translation.override(language):
+            prefix = get_current_language_code_url_prefix()
+        paths.append((language, f'/{settings.API_URL}/page{prefix}{url}', 'index.json'))
+        paths.append((language, f'{prefix}{url}', 'index.html'))
+    return paths
+
+
+def render_pages(site_id, domain, pages, root):
+    """
+    Рендер страниц одного сайта анонимными запросами через обычный стек Django.
+    pages - [(page_id, url)]. Возвращает {page_id: [пути записанных файлов относительно root]}.
+    Ответы со статусом, отличным от 200 (закрытые и недоступные страницы), не выгружаются.
+    """
+    client = Client(HTTP_HOST=domain, raise_request_exception=False)
+    result = {}
+    # запросы активируют язык страницы, после выгрузки возвращаем язык вызывающего кода
+    with override_site(site_id), translation.override(translation.get_language()):
+        for page_id, url in pages:
+            files = []
+            for language, path, filename in get_page_paths(url):
+                response = client.get(path, HTTP_ACCEPT_LANGUAGE=language)
+                if response.status_code != 200:
+                    logger.warning('Static export of %s%s skipped: status %s', domain, path, response.status_code)
+                    continue
+                file_path = os.path.join(domain, path.strip('/'), filename)
+                write_atomic(os.path.join(root, file_path), response.content)
+                files.append(file_path)
+            result[page_id] = files
+    return result
+
+
+def _render_job(job):
+    return render_pages(*job)
+
+
+def run_jobs(jobs, workers):
+    # демонические процессы (prefork-воркеры celery) не могут запускать дочерние
+    if workers <= 1 or len(jobs) <= 1 or multiprocessing.current_process().daemon:
+        return [_render_job(job) for job in jobs]
+    # соединения с БД не должны наследоваться дочерними процессами
+    connections.close_all()
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(_render_job, jobs))
+
+
+def export_pages(root, sites=None, force=False, workers=STATIC_EXPORT_WORKERS, batch_size=STATIC_EXPORT_BATCH_SIZE):
+    """
+    Выгрузка JSON и HTML активных страниц в каталог root/<домен>/<путь запроса>/index.{json,html}.
+    Перерисовываются только страницы, версия которых отличается от записанной в манифесте
+    (или все при force), файлы удаленных и выключенных страниц удаляются.
+    Возвращает число перерисованных страниц.
+    """
+    sites = list(sites if sites is not None else site_registry.get_all())
+    manifest = load_manifest(root)
+    new_manifest = {}
+    jobs = []
+    versions = {}
+    for site in sites:
+        changed = []
+        for page_id, (url, version) in get_page_versions(site).items():
+            key = f'{site.pk}:{page_id}'
+            versions[key] = version
+            entry = manifest.get(key)
+            if not force and entry is not None and entry['version'] == version:
+                new_manifest[key] = entry
+            else:
+                changed.append((page_id, url))
+        for start in range(0, len(changed), batch_size):
+            jobs.append((site.pk, site.domain, changed[start:start + batch_size], root))
+
+    for job, result in zip(jobs, run_jobs(jobs, workers)):
+        site_id = job[0]
+        for page_id, files in result.items():
+            key = f'{site_id}:{page_id}'
+            new_manifest[key] = {'version': versions[key], 'files': files}
+
+    site_ids = {str(site.pk) for site in sites}
+    for key, entry in manifest.items():
+        if key.split(':')[0] not in site_ids:
+            new_manifest.setdefault(key, entry)
+            continue
+        stale = set(entry['files']) - set(new_manifest.get(key, {}).get('files', ()))
+        for file_path in stale:
+            remove_file(os.path.join(root, file_path))
+
+    save_manifest(root, new_manifest)
+    return sum(len(job[2]) for job in jobs)
@@ -0,0 +1,24 @@
+import logging
+
+from django.db import transaction
+
+from garpix_page.settings import STATIC_EXPORT_ROOT
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_static_export():
+    """
+    Инкрементальная выгрузка после фиксации транзакции публикации (если задан STATIC_EXPORT_ROOT).
+    """
+    if not STATIC_EXPORT_ROOT:
+        return
+
+    def _schedule():
+        from garpix_page.tasks import export_static_pages
+        try:
+            export_static_pages.delay()
+        except Exception:
+            logger.exception('Cannot schedule static export')
+
+    transaction.on_commit(_schedule)
@@ -0,0 +1,78 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone, translation
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = 'Benchmark page API, admin API and form submit on a temporary database with synthetic pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=100)
+        parser.add_argument('--depth', type=int, default=3)
+        parser.add_argument('--components', type=int, default=5, help='Components per page')
+        parser.add_argument('--items', type=int, default=5, help='Child items per component')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--scenario', action='append', help='Run only these scenarios')
+        parser.add_argument('--output', help='Write JSON results to this file')
+        parser.add_argument('--baseline', help='JSON results to compare with')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed relative growth of median latency against the baseline')
+        parser.add_argument('--keepdb', action='store_true', help='Keep the temporary database')
+
+    def handle(self, *args, **options):
+        from garpix_page.benchmark import compare_results, get_scenarios, run_scenario, seed
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)['results']
+
+        # каскад url при большом числе дочерних страниц уходит в celery, для замера выполняем его синхронно
+        import_string(settings.GARPIXCMS_CELERY_SETTINGS).conf.task_always_eager = True
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            translation.activate(settings.LANGUAGE_CODE)
+            self.stdout.write('Seeding...')
+            data = seed(options['pages'], options['depth'], options['components'], options['items'])
+            for model in data.skipped_component_models:
+                self.stdout.write(self.style.WARNING(f'Component {model.__name__} is skipped: page API fails on it'))
+
+            results = {}
+            for scenario in get_scenarios(data):
+                if options['scenario'] and scenario.name not in options['scenario']:
+                    continue
+                results[scenario.name] = run_scenario(scenario, options['iterations'])
+                self.stdout.write(f"{scenario.name}: {json.dumps(results[scenario.name])}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        report = {
+            'meta': {
+                'created_at': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'pages': options['pages'],
+                'depth': options['depth'],
+                'components': options['components'],
+                'items': options['items'],
+                'component_models': [model.__name__ for model in data.component_models],
+            },
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+
+        if baseline is not None:
+            regressions = compare_results(results, baseline, options['threshold'])
+            if regressions:
+                raise CommandError('Performance regressions:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS('Done'))
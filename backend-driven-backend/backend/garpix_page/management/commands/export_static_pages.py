@@ -0,0 +1,24 @@
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from garpix_page.export import export_pages
+from garpix_page.settings import STATIC_EXPORT_BATCH_SIZE, STATIC_EXPORT_ROOT, STATIC_EXPORT_WORKERS
+
+
+class Command(BaseCommand):
+    help = 'Pre-render page API json and html of active pages for serving by the web server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', default=STATIC_EXPORT_ROOT, help='Export directory')
+        parser.add_argument('--site', type=int, action='append', help='Export only these site ids')
+        parser.add_argument('--force', action='store_true', help='Re-render all pages ignoring the manifest')
+        parser.add_argument('--workers', type=int, default=STATIC_EXPORT_WORKERS)
+        parser.add_argument('--batch-size', type=int, default=STATIC_EXPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if not options['root']:
+            raise CommandError('Set GARPIX_PAGE_STATIC_EXPORT_ROOT or pass --root')
+        sites = Site.objects.filter(pk__in=options['site']) if options['site'] else None
+        count = export_pages(options['root'], sites=sites, force=options['force'], workers=options['workers'],
+                             batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rendered {count} pages'))
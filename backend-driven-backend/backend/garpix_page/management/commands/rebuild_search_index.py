@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from garpix_page.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild pages search index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        rebuild_search_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS('Done'))
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 
+from garpix_page.cache import sitemap_cache_service
 from garpix_page.models import BasePage
 from garpix_page.utils.set_children_urls import set_children_url
 
@@ -21,5 +22,6 @@ class Command(BaseCommand):
             set_children_url(page, children, pages_to_update)
 
         BasePage.objects.bulk_update(pages_to_update, ['url'])
+        sitemap_cache_service.bump_version()
 
         self.stdout.write(self.style.SUCCESS('Done'))
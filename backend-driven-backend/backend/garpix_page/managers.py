@@ -0,0 +1,28 @@
+from django.db import models
+from garpix_utils.managers import GCurrentSiteManager, GPolymorphicCurrentSiteManager
+
+from garpix_page.utils.current_site import get_current_site_id
+
+
+class CurrentSiteManager(GCurrentSiteManager):
+    """
+    Объекты текущего сайта (get_current_site_id) вместо settings.SITE_ID.
+    """
+
+    def get_queryset(self):
+        return models.Manager.get_queryset(self).filter(**{self._get_field_name() + '__id': get_current_site_id()})
+
+
+class ActiveOnSiteManager(CurrentSiteManager):
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
+class PolymorphicCurrentSiteManager(GPolymorphicCurrentSiteManager):
+
+    def get_queryset(self):
+        qs = self.queryset_class(self.model, using=self._db, hints=self._hints)
+        if self.model._meta.proxy:
+            qs = qs.instance_of(self.model)
+        return qs.filter(**{self._get_field_name() + '__id': get_current_site_id()})
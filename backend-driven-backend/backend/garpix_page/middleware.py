@@ -0,0 +1,38 @@
+import logging
+import random
+from contextlib import ExitStack
+
+from django.db import connections
+
+from garpix_page.settings import INSTRUMENTATION_ENABLED, INSTRUMENTATION_SAMPLE_RATE
+from garpix_page.utils.instrumentation import start_profile
+
+logger = logging.getLogger('garpix_page.instrumentation')
+
+
+class InstrumentationMiddleware:
+    """
+    Собирает метрики рендеринга страниц для части запросов (GARPIX_PAGE_INSTRUMENTATION_SAMPLE_RATE)
+    и отдает их в заголовке Server-Timing и в лог garpix_page.instrumentation.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not INSTRUMENTATION_ENABLED or random.random() >= INSTRUMENTATION_SAMPLE_RATE:
+            return self.get_response(request)
+
+        with start_profile() as profile, ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.execute_wrapper))
+            response = self.get_response(request)
+
+        response['Server-Timing'] = profile.get_server_timing()
+        logger.info('page request profile', extra={
+            'path': request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'profile': profile.as_dict(),
+        })
+        return response
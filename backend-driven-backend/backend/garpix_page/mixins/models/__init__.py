@@ -1 +1,2 @@
 from .clone_mixin import CloneMixin  # noqa
+from .draft_mixin import DraftMixin, is_draft_preview  # noqa
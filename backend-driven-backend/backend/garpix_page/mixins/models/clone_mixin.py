@@ -1,53 +1,152 @@
+from django.db import connections, transaction
+from django.db.models import Q
+from modeltranslation.utils import build_localized_fieldname, get_language
+
+from garpix_page.settings import CLONE_DEPTH
 
 
 class CloneMixin:
+    """
+    Клонирование объекта вместе со связанными объектами.
+
+    Копируются объекты, ссылающиеся внешним ключом на клонируемую модель (карточки, ссылки и т.п.),
+    затем объекты, ссылающиеся на скопированные, и так до глубины clone_depth. Каждый уровень создается
+    одним bulk_create, внешние ключи на уже скопированные объекты переносятся на копии.
+    Связи many-to-many (в том числе через промежуточную модель) копируются для всех скопированных объектов.
+    Связи из clone_exclude_relations (имена обратных связей) не копируются.
+    """
+    clone_depth = CLONE_DEPTH
+    clone_exclude_relations = ()
 
     class Meta:
         abstract = True
 
+    def get_clone_count(self):
+        """
+        Число объектов с таким же заголовком или заголовком копии вида "Заголовок (N)".
+        """
+        title = self.title
+        return self.__class__.objects.filter(
+            Q(title=title) | Q(title__startswith=f'{title} (', title__endswith=')')
+        ).count()
 
     def clone_object(self, **args):  # noqa
+        with transaction.atomic(using=self._state.db):
+            model = self.__class__
+            old_pk = self.pk
 
-        related_objects_to_copy = []
-        relations_to_set = {}
+            self.pk = None
+            self.id = None
 
-        for field in self._meta.get_fields():
-            if field.one_to_many:
-                related_object_manager = getattr(self, field.name, None)
-                if not related_object_manager:
-                    related_object_manager = getattr(self, f'{field.name}_set')
+            for key, value in args.items():
+                if value:
+                    setattr(self, key, value)
+                    # у переводимого поля значение текущего языка хранится в отдельной колонке
+                    localized_key = build_localized_fieldname(key, get_language())
+                    if hasattr(self, localized_key):
+                        setattr(self, localized_key, value)
 
-                related_objects = list(related_object_manager.all())
-                if related_objects:
-                    related_objects_to_copy += related_objects
+            self.save()
 
-            elif field.many_to_many:
-                related_object_manager = getattr(self, field.name)
-                relations = list(related_object_manager.all())
-                if relations:
-                    relations_to_set[field.name] = relations
+            # старый id -> новый id для каждой скопированной модели, по ним переносятся внешние ключи
+            id_map = {}
+            self._add_to_id_map(id_map, model, {old_pk: self.pk})
+            self._clone_many_to_many(model, {old_pk: self.pk}, id_map)
 
-        self.pk = None
-        self.id = None
+            level = [(model, {old_pk: self.pk})]
+            for _ in range(self.clone_depth):
+                next_level = []
+                for level_model, ids in level:
+                    for relation in self._get_clone_relations(level_model):
+                        new_ids = self._clone_relation(relation, ids, id_map)
+                        if new_ids:
+                            next_level.append((relation.related_model, new_ids))
+                level = next_level
 
-        for key, value in args.items():
-            if value:
-                setattr(self, key, value)
+        return self
 
-        self.save()
+    @staticmethod
+    def _add_to_id_map(id_map, model, ids):
+        # при наследовании с отдельными таблицами id потомка совпадает с id родителей
+        for target in (model, *model._meta.get_parent_list()):
+            id_map.setdefault(target._meta.concrete_model, {}).update(ids)
 
-        for related_object in related_objects_to_copy:
-            for related_object_field in related_object._meta.fields:
-                if related_object_field.related_model == self.__class__:
-                    related_object.pk = None
-                    setattr(related_object, related_object_field.name, self)
-                    related_object.save()
+    def _get_clone_relations(self, model):
+        """
+        Обратные внешние ключи, указывающие непосредственно на model.
+        Связи внутри иерархии клонируемой модели (дочерние страницы, черновики) и промежуточные таблицы
+        many-to-many (копируются в _clone_many_to_many) пропускаются.
+        """
+        exclude = getattr(model, 'clone_exclude_relations', ())
+        root = self.__class__
+        while root._meta.parents:
+            root = next(iter(root._meta.parents))
+        through_models = {self._get_through(field)[0] for field in model._meta.get_fields() if field.many_to_many}
+        return [
+            relation for relation in model._meta.related_objects
+            if relation.one_to_many and relation.field.related_model is model and relation.name not in exclude
+            and not issubclass(relation.related_model, root) and relation.related_model not in through_models
+        ]
 
-        for field_name, relations in relations_to_set.items():
-            field = getattr(self, field_name)
-            field.set(relations)
-            text_relations = []
-            for relation in relations:
-                text_relations.append(str(relation))
+    def _clone_relation(self, relation, ids, id_map):
+        related_model = relation.related_model
+        mapped = id_map.get(related_model._meta.concrete_model, {})
+        objects = [
+            obj for obj in related_model._base_manager.filter(**{f'{relation.field.name}__in': list(ids)}).order_by('pk')
+            if obj.pk not in mapped
+        ]
+        if not objects:
+            return {}
 
-        return self
+        old_ids = [obj.pk for obj in objects]
+        for obj in objects:
+            self._remap_foreign_keys(obj, id_map)
+            obj.pk = None
+
+        connection = connections[related_model._base_manager.db]
+        if related_model._meta.parents or not connection.features.can_return_rows_from_bulk_insert:
+            # bulk_create не поддерживает наследование с отдельными таблицами и не везде возвращает id
+            for obj in objects:
+                obj.save(force_insert=True)
+        else:
+            related_model._base_manager.bulk_create(objects)
+
+        new_ids = {old_id: obj.pk for old_id, obj in zip(old_ids, objects)}
+        self._add_to_id_map(id_map, related_model, new_ids)
+        self._clone_many_to_many(related_model, new_ids, id_map)
+        return new_ids
+
+    @staticmethod
+    def _remap_foreign_keys(obj, id_map):
+        for field in obj._meta.concrete_fields:
+            if not field.many_to_one:
+                continue
+            mapping = id_map.get(field.related_model._meta.concrete_model)
+            value = getattr(obj, field.attname)
+            if mapping and value in mapping:
+                setattr(obj, field.attname, mapping[value])
+
+    def _clone_many_to_many(self, model, ids, id_map):
+        """
+        Копирует строки промежуточных таблиц many-to-many, ссылающиеся на скопированные объекты.
+        """
+        for field in model._meta.get_fields():
+            if not field.many_to_many:
+                continue
+            through, source_name = self._get_through(field)
+            source_attname = through._meta.get_field(source_name).attname
+
+            rows = list(through._base_manager.filter(**{f'{source_attname}__in': list(ids)}).order_by('pk'))
+            for row in rows:
+                self._remap_foreign_keys(row, id_map)
+                row.pk = None
+            through._base_manager.bulk_create(rows)
+
+    @staticmethod
+    def _get_through(field):
+        """
+        Промежуточная модель связи many-to-many и имя ее внешнего ключа на модель, которой принадлежит field.
+        """
+        if field.concrete:
+            return field.remote_field.through, field.m2m_field_name()
+        return field.through, field.field.m2m_reverse_field_name()
@@ -0,0 +1,77 @@
+import json
+
+from django.db import transaction
+
+from garpix_page.utils.json_patch import make_patch
+
+# GET параметр предпросмотра черновика
+DRAFT_PREVIEW_PARAM = '__garpix_page_draft'
+
+
+def is_draft_preview(request):
+    return request is not None and request.GET.get(DRAFT_PREVIEW_PARAM, '').lower() in ['true', '1', 'yes']
+
+
+def to_json_data(data):
+    """
+    Приводит данные сериализатора к виду, в котором их присылает клиент (даты и decimal - строками и т.п.).
+    """
+    from garpix_page.serializers.compiled import render_json
+    return json.loads(render_json(data))
+
+
+class DraftMixin:
+    """
+    Черновик хранится в отдельной таблице (обратная связь draft) как JSON Patch относительно
+    данных опубликованного объекта (get_draft_live_data), поэтому при обычных запросах не загружается.
+    """
+
+    class Meta:
+        abstract = True
+
+    def get_draft(self):
+        return getattr(self, 'draft', None)
+
+    def get_draft_live_data(self, request):
+        """
+        Данные опубликованного объекта в виде документа черновика (to_draft_document).
+        """
+        raise NotImplementedError
+
+    def to_draft_document(self, data):
+        """
+        Документ, относительно которого строится patch. Списки в нем сравниваются по позициям,
+        поэтому элементы, которые могут переставляться, стоит хранить в словаре по ключу.
+        """
+        return data
+
+    def from_draft_document(self, document):
+        return document
+
+    def get_draft_data(self, request):
+        """
+        Данные черновика в том виде, в котором они были сохранены, или None.
+        """
+        draft = self.get_draft()
+        if draft is None:
+            return None
+        return self.from_draft_document(draft.get_data(self.get_draft_live_data(request)))
+
+    def save_draft(self, data, request):
+        draft_field = self._meta.get_field('draft')
+        patch = make_patch(self.get_draft_live_data(request), self.to_draft_document(data))
+        with transaction.atomic():
+            draft, _ = draft_field.related_model.objects.select_for_update().get_or_create(
+                **{draft_field.field.name: self}
+            )
+            draft.patch = patch
+            draft.revision += 1
+            draft.save()
+        self.draft = draft
+        return draft
+
+    def delete_draft(self):
+        draft = self.get_draft()
+        if draft is not None:
+            draft.delete()
+        self._state.fields_cache['draft'] = None
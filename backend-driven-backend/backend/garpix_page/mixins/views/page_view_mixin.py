@@ -1,23 +1,23 @@
-import re
-
-from django.urls.resolvers import RoutePattern, _route_to_regex
+from copy import copy
 
 from django.utils.translation import activate
 
-from garpix_page.utils.get_garpix_page_models import get_garpix_page_models
+from garpix_page.utils.get_garpix_page_models import registry
 
 
 class PageViewMixin:
 
-    @classmethod
-    def get_instance_by_slug(cls, slugs, languages_list):
+    @staticmethod
+    def match_slugs(slugs, languages_list):
+        """
+        Разбор пути: язык из префикса (или None) и подходящие под url_patterns модели в порядке registry.
+        """
         slug_list = slugs.split('/')
 
         lang = None
 
         if slug_list[0] in languages_list:
             lang = slug_list.pop(0)
-            activate(lang)
 
         if len(slug_list) == 0:
             slug_list.append('')
@@ -27,33 +27,74 @@ class PageViewMixin:
 
         url = f"/{'/'.join(slug_list)}"
 
-        page_models = get_garpix_page_models()
         active_models = []
-        for el in page_models:
-            for key, value in el.url_patterns().items():
-                pattern = RoutePattern(r'(<url>){}'.format(value['pattern']))
-                pattern.regex = re.compile('^/(?P<url>.*){}$'.format(_route_to_regex(value['pattern'], pattern._is_endpoint)[0][1:]))
-                match = pattern.match(url)
-                if match is not None:
-                    last, _, params = match
-
-                    el_url = f"/{params.pop('url')}"
-
-                    active_models.append({
-                        'model': el,
-                        'params': params,
-                        'pattern': key,
-                        'url': el_url,
-                        'permissions': value.get('permissions', el.permissions)
-                    })
+        for url_pattern in registry.url_patterns:
+            match = url_pattern['pattern'].match(url)
+            if match is not None:
+                last, _, params = match
+
+                el_url = f"/{params.pop('url')}"
+
+                active_models.append({
+                    'model': url_pattern['model'],
+                    'params': params,
+                    'pattern': url_pattern['key'],
+                    'url': el_url,
+                    'permissions': url_pattern['permissions']
+                })
+
+        return lang, active_models
+
+    @staticmethod
+    def set_route(instance, route):
+        instance.subpage_params = route['params']
+        instance.subpage_key = route['pattern']
+        instance.permissions = route['permissions']
+        return instance
+
+    @classmethod
+    def get_instance_by_slug(cls, slugs, languages_list):
+        lang, active_models = cls.match_slugs(slugs, languages_list)
+        if lang is not None:
+            activate(lang)
 
         for model in active_models:
-            instance = model['model'].active_on_site.filter(url=model['url']).first()
+            instance = model['model'].active_on_site.filter(url=model['url']).select_related('draft').first()
 
             if instance:
-                instance.subpage_params = model['params']
-                instance.subpage_key = model['pattern']
-                instance.permissions = model['permissions']
-                return instance
+                return cls.set_route(instance, model)
 
         return None
+
+    @classmethod
+    def get_instances_by_slugs(cls, slugs_list, languages_list):
+        """
+        Страницы для нескольких путей: {slugs: (язык из префикса, страница или None)}.
+        Кандидаты всех путей собираются за один проход по url_patterns и загружаются
+        одним запросом на модель (url__in), затем для каждого пути выбирается первая
+        подходящая модель, как в get_instance_by_slug.
+        """
+        routes = {slugs: cls.match_slugs(slugs, languages_list) for slugs in slugs_list}
+
+        urls_by_model = {}
+        for lang, active_models in routes.values():
+            for model in active_models:
+                urls_by_model.setdefault(model['model'], set()).add(model['url'])
+
+        instances = {}
+        for model, urls in urls_by_model.items():
+            for instance in model.active_on_site.filter(url__in=urls).select_related('draft'):
+                # при совпадении url берется первая страница в порядке модели, как у .first()
+                instances.setdefault((model, instance.url), instance)
+
+        result = {}
+        for slugs, (lang, active_models) in routes.items():
+            page = None
+            for model in active_models:
+                instance = instances.get((model['model'], model['url']))
+                if instance is not None:
+                    # одна страница может быть открыта по нескольким путям с разными параметрами
+                    page = cls.set_route(copy(instance), model)
+                    break
+            result[slugs] = (lang, page)
+        return result
@@ -1,5 +1,7 @@
 from .base_page import BasePage  # noqa
 from .base_list_page import BaseListPage  # noqa
 from .base_search_page import BaseSearchPage  # noqa
+from .search_document import PageSearchDocument  # noqa
 from .components import * # noqa
 from .settings import *  # noqa
+from .draft import PageDraft, ComponentDraft  # noqa
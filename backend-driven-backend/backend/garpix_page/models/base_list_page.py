@@ -1,49 +1,95 @@
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
 from .base_page import BasePage
-from garpix_utils.paginator import GarpixPaginator
 
-from ..pagination import GarpixPagePagination
+from ..pagination import EstimatedCountPaginator, GarpixPagePagination, KeysetPaginator, get_list_count
 from ..serializers import get_serializer
 
 
 class BaseListPage(BasePage):
     paginate_by = 25
+    # размер страницы API по умолчанию, как у GarpixPagePagination
+    api_paginate_by = GarpixPagePagination.page_size
+    max_paginate_by = 100
+    # модель элементов списка для выбора сериализатора, по умолчанию - модель выборки
+    list_model = None
     template = 'garpix_page/default_list.html'
 
+    def get_queryset(self, request=None):
+        return self.children.all()
+
+    def get_list_serializer(self, queryset, object_list):
+        model = self.list_model or queryset.model
+        if model is BasePage and object_list:
+            # дочерние страницы полиморфны, класс берем у уже загруженного объекта
+            model = object_list[0].__class__
+        return get_serializer(model)
+
+    def get_paginate_by(self, request, api=False):
+        try:
+            return min(max(int(request.GET['page_size']), 1), self.max_paginate_by)
+        except (KeyError, ValueError):
+            return self.api_paginate_by if api else self.paginate_by
+
     def get_context(self, request=None, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
 
-        object_list = self.children.filter(is_active=True)
-        paginator = GarpixPaginator(object_list, self.paginate_by)
+        object_list = self.get_queryset(request).filter(is_active=True)
+        paginate_by = self.get_paginate_by(request, kwargs.get('api', False))
+        url = request.build_absolute_uri()
 
         try:
             page = int(request.GET.get('page', 1))
         except ValueError:
             page = 1
 
-        paginated_object_list = paginator.get_page(page)
+        cursor = request.GET.get('after')
+        try:
+            keyset_paginator = KeysetPaginator(object_list, paginate_by) if cursor is not None else None
+        except ValueError:
+            keyset_paginator = None
 
-        api_paginator = GarpixPagePagination()
+        if keyset_paginator is not None:
+            # режим курсора: без OFFSET, количество - по статистике планировщика, если она есть
+            paginated_object_list, next_cursor = keyset_paginator.get_page(cursor)
+            count = get_list_count(object_list)
+            next_link = replace_query_param(url, 'after', next_cursor) if next_cursor else None
+            previous_link = None
+            context.update({
+                'paginated_object_list': paginated_object_list,
+                'next_cursor': next_cursor,
+            })
+        else:
+            paginator = EstimatedCountPaginator(object_list, paginate_by)
+            paginated_object_list = paginator.get_page(page)
+            count = paginator.count
+            next_link = replace_query_param(url, 'page', paginated_object_list.next_page_number()) \
+                if paginated_object_list.has_next() else None
+            previous_link = None
+            if paginated_object_list.has_previous():
+                previous_page = paginated_object_list.previous_page_number()
+                previous_link = replace_query_param(url, 'page', previous_page) if previous_page > 1 \
+                    else remove_query_param(url, 'page')
+            context.update({
+                'paginator': paginator,
+                'paginated_object_list': paginated_object_list,
+                'page': page,
+            })
 
+        # данные API строятся по той же странице, без повторного запроса
+        items = list(paginated_object_list)
+        model_serializer_class = self.get_list_serializer(object_list, items)
         try:
-            model_serializer_class = get_serializer(object_list[0].__class__)
-
-            paginated_children_list = api_paginator.get_paginated_data(queryset=object_list,
-                                                                       serializer=model_serializer_class,
-                                                                       request=request)
+            results = model_serializer_class(items, context={'request': request}, many=True).data
         except Exception:
-            paginated_children_list = {
-                "count": 0,
-                "next": None,
-                "prev": None,
-                "results": []
-            }
-
-        context.update({
-            'paginator': paginator,
-            'paginated_object_list': paginated_object_list,
-            'page': page,
-            'paginated_children_list': paginated_children_list
-        })
+            count, next_link, results = 0, None, []
+
+        context['paginated_children_list'] = {
+            'count': count,
+            'next': next_link,
+            'previous': previous_link,
+            'results': results,
+        }
         return context
 
     class Meta:
@@ -6,22 +6,25 @@ from django.utils.functional import cached_property
 from django.db import models
 from django.urls import reverse
 from django.contrib.sites.models import Site
-from rest_framework.views import APIView
 from garpix_page.utils.all_sites import get_all_sites
 from garpix_page.utils.get_file_path import get_file_path
 from polymorphic_tree.models import PolymorphicMPTTModel, PolymorphicTreeForeignKey, PolymorphicMPTTModelManager
 from django.utils.html import format_html
-from garpix_utils.managers import GCurrentSiteManager, GPolymorphicCurrentSiteManager, ActiveOnSiteManager
-from ..cache import cache_service
-from ..mixins import CloneMixin
+from ..cache import breadcrumbs_cache_service, cache_service, menu_cache_service, sitemap_cache_service
+from ..managers import ActiveOnSiteManager, CurrentSiteManager, PolymorphicCurrentSiteManager
+from ..mixins import CloneMixin, DraftMixin
+from ..mixins.models.draft_mixin import to_json_data
 from garpix_admin_lock.mixins import PageLockViewMixin
 
 from ..tasks import clear_child_cache
 from ..utils.get_current_language_code_url_prefix import get_current_language_code_url_prefix
+from ..utils.instrumentation import measure
+from ..utils.permissions import has_object_permissions
 from ..utils.set_children_urls import set_children_url
+from ..utils.site_registry import site_registry
 
 
-class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
+class BasePage(CloneMixin, DraftMixin, PolymorphicMPTTModel, PageLockViewMixin):
     """
     Базовая страница, на основе которой создаются все прочие страницы.
     """
@@ -52,18 +55,10 @@ class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
         verbose_name='Раскладка'
     )
 
-    # Версионирование и черновики
-    draft_data = models.JSONField(
-        null=True,
-        blank=True,
-        verbose_name='Данные черновика',
-        help_text='JSON с данными черновика страницы и компонентов'
-    )
-
     # objects = models.Manager()
     objects = PolymorphicMPTTModelManager()
-    on_site = GCurrentSiteManager()
-    polymorphic_on_site = GPolymorphicCurrentSiteManager()
+    on_site = CurrentSiteManager()
+    polymorphic_on_site = PolymorphicCurrentSiteManager()
     active_on_site = ActiveOnSiteManager()
 
     template = 'garpix_page/default.html'
@@ -88,7 +83,7 @@ class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
 
     @cached_property
     def _default_site(self):
-        return Site.objects.get(pk=getattr(settings, 'SITE_ID', 1))
+        return site_registry.get_current()
 
     _default_site.short_description = 'Default Site'
 
@@ -137,12 +132,9 @@ class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
 
     @cached_property
     def get_sites(self):
-        res = 'n/a'
-        if self.sites.all().count() > 0:
-            res = ''
-            for site in self.sites.all():
-                res += f'{site.domain} '
-        return res
+        # один запрос к связям страницы (или ни одного при prefetch_related('sites'))
+        sites = self.sites.all()
+        return ''.join(f'{site.domain} ' for site in sites) or 'n/a'
 
     get_sites.short_description = 'Sites'
 
@@ -150,25 +142,40 @@ class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
         return self.template
 
     def get_context(self, request=None, *args, **kwargs):
-
-        return {
-            'object': self,
-            'subpages': self.get_subpages_list(),
-            'components': self.get_components_context(request, api=kwargs.get('api', False))
-        }
+        with measure('base_page_context'):
+            context = {
+                'object': self,
+                'subpages': self.get_subpages_list(),
+                'components': self.get_components_context(request, api=kwargs.get('api', False))
+            }
+            if kwargs.get('api', False):
+                context['breadcrumbs'] = self.get_breadcrumbs_data()
+            return context
 
     @classmethod
     def is_for_page_view(cls):
         return True
 
     def get_breadcrumbs(self):
-        result = []
-        obj = self
-        result.append(obj)
-        while obj.parent is not None:
-            result.insert(0, obj.parent)
-            obj = obj.parent
-        return result
+        """
+        Предки страницы и сама страница одним запросом, без загрузки конкретных моделей.
+        """
+        return list(self.get_ancestors(include_self=True).non_polymorphic())
+
+    def get_breadcrumbs_data(self):
+        """
+        Хлебные крошки для API: [{'id', 'title', 'url'}, ...] от корня к странице.
+        """
+        language = translation.get_language()
+        breadcrumbs = breadcrumbs_cache_service.get_breadcrumbs(self.pk, language)
+        if breadcrumbs is None:
+            prefix = get_current_language_code_url_prefix()
+            breadcrumbs = [
+                {**item, 'url': f"{prefix}{item['url']}" if prefix else item['url']}
+                for item in self.get_ancestors(include_self=True).values('id', 'title', 'url')
+            ]
+            breadcrumbs_cache_service.set_breadcrumbs(self.pk, language, breadcrumbs)
+        return breadcrumbs
 
     def get_admin_url_edit_object(self):
         url = reverse(f'admin:{self._meta.app_label}_{self._meta.model_name}_change', args=[self.id])
@@ -186,31 +193,133 @@ class BasePage(CloneMixin, PolymorphicMPTTModel, PageLockViewMixin):
     model_name.short_description = 'Тип'
 
     def has_permission_required(self, request):
-
-        view = APIView()
-        view.queryset = type(self).objects.filter(id=self.id)
-        if self.permissions is not None:
-            for permission in [permission() for permission in self.permissions]:
-                if not permission.has_object_permission(request, view, self) or not permission.has_permission(request,
-                                                                                                              view):
-                    return False
-        return True
+        # у большинства страниц прав нет, проверка ничего не создает
+        if not self.permissions:
+            return True
+        return has_object_permissions(self, request, self.permissions)
+
+    @staticmethod
+    def prefetch_components(pages):
+        """
+        Активные компоненты нескольких страниц: один запрос связей и одна полиморфная выборка компонентов.
+        """
+        from .components.base_component import BaseComponent, PageComponent
+
+        page_components = list(PageComponent.objects.filter(
+            page__in=pages, component__is_active=True, component__is_deleted=False
+        ).order_by('view_order'))
+        components = BaseComponent.objects.in_bulk({page_component.component_id for page_component in page_components})
+        components_by_page = {page.pk: [] for page in pages}
+        for page_component in page_components:
+            page_component.component = components[page_component.component_id]
+            components_by_page[page_component.page_id].append(page_component)
+        for page in pages:
+            page._prefetched_components = components_by_page[page.pk]
 
     def get_components_context(self, request, api=False):
         context = []
-        components = self.pagecomponent_set.filter(component__is_active=True, component__is_deleted=False).order_by(
-            'view_order')
-        for component in components:
-            component_context = {
-                'view_order': component.view_order
-            }
-            if api:
-                component_context.update(component.component.get_api_context_data(request))
-            else:
-                component_context.update(component.component.get_context_data(request))
-            context.append(component_context)
+        components = getattr(self, '_prefetched_components', None)
+        if components is None:
+            components = self.pagecomponent_set.filter(component__is_active=True, component__is_deleted=False).order_by(
+                'view_order')
+        # данные компонента зависят только от запроса и языка, общий компонент нескольких страниц собирается один раз
+        http_request = getattr(request, '_request', request)
+        components_memo = getattr(http_request, '_garpix_page_components', None)
+        if components_memo is None:
+            components_memo = {}
+            if http_request is not None:
+                http_request._garpix_page_components = components_memo
+        language = translation.get_language()
+        with measure('components'):
+            for component in components:
+                component_context = {
+                    'view_order': component.view_order
+                }
+                with measure(f'component.{component.component.__class__.__name__}'):
+                    if api:
+                        key = (component.component_id, language)
+                        if key not in components_memo:
+                            components_memo[key] = component.component.get_api_context_data(request)
+                        component_context.update(components_memo[key])
+                    else:
+                        component_context.update(component.component.get_context_data(request))
+                context.append(component_context)
         return context
 
+    def get_draft_live_data(self, request):
+        """
+        Опубликованные данные страницы и ее компонентов в формате черновика.
+        """
+        from ..serializers import get_serializer
+        from .components.base_component import BaseComponent, PageComponent
+
+        page_components = list(
+            PageComponent.objects.filter(page=self, component__is_deleted=False).order_by('view_order')
+        )
+        components = BaseComponent.objects.in_bulk({page_component.component_id for page_component in page_components})
+        serializers = {}
+        components_data = []
+        for page_component in page_components:
+            component = components[page_component.component_id]
+            component_class = component.__class__
+            if component_class not in serializers:
+                serializers[component_class] = get_serializer(component_class)
+            components_data.append({
+                **serializers[component_class](component, context={'request': request}).data,
+                'component_type': component_class.__name__,
+                'view_order': page_component.view_order,
+            })
+
+        page_data = get_serializer(self.__class__)(self, context={'request': request}).data
+        return self.to_draft_document(to_json_data({'page_data': page_data, 'components': components_data}))
+
+    def to_draft_document(self, data):
+        """
+        Компоненты хранятся словарем по id (новые - по позиции) и отдельным списком порядка,
+        чтобы изменения черновика применялись к тем же компонентам после перестановки,
+        добавления или удаления опубликованных.
+        """
+        if not isinstance(data.get('components'), list):
+            return data
+        components = {}
+        for index, component in enumerate(data['components']):
+            key = str(component['id']) if component.get('id') else f'new-{index}'
+            if key in components:
+                # один компонент может стоять на странице несколько раз
+                key = f'{key}-{index}'
+            components[key] = component
+        return {**data, 'components': components, 'components_order': list(components)}
+
+    def from_draft_document(self, document):
+        document = dict(document)
+        order = document.pop('components_order', [])
+        components = document.get('components')
+        if isinstance(components, dict):
+            # компоненты, удаленные из опубликованной страницы, пропускаются
+            keys = [key for key in dict.fromkeys(order) if key in components]
+            keys.extend(key for key in components if key not in keys)
+            document['components'] = [components[key] for key in keys]
+        return document
+
+    def get_draft_preview_version(self):
+        """
+        Версия предпросмотра черновика: ревизии черновиков страницы и ее компонентов,
+        а также время изменения опубликованных страницы, раскладки и компонентов.
+        """
+        versions = BasePage.objects.filter(pk=self.pk).aggregate(
+            revision=models.Max('draft__revision'),
+            layout_updated_at=models.Max('layout__updated_at'),
+            components_count=models.Count('pagecomponent'),
+            components_updated_at=models.Max('pagecomponent__component__updated_at'),
+            drafts_count=models.Count('pagecomponent__component__draft'),
+            drafts_updated_at=models.Max('pagecomponent__component__draft__updated_at'),
+        )
+        versions['updated_at'] = self.updated_at
+        return '_'.join(
+            str(value.timestamp() if hasattr(value, 'timestamp') else value or 0)
+            for _, value in sorted(versions.items())
+        )
+
     def get_components(self):
         context = []
         components = self.pagecomponent_set.filter(component__is_active=True, component__is_deleted=False)
@@ -321,7 +430,13 @@ def reset_url(sender, instance: BasePage, update_fields, **kwargs):
 
             cache_service.clear_seo_data(instance.pk)
             old_instance = BasePage.objects.get(pk=instance.pk)
+            title_fields = [field.attname for field in BasePage._meta.concrete_fields if field.name.startswith('title')]
+            if any(getattr(instance, name) != getattr(old_instance, name) for name in title_fields):
+                breadcrumbs_cache_service.bump_version()
+
             if instance.parent != old_instance.parent or instance.slug != old_instance.slug:
+                breadcrumbs_cache_service.bump_version()
+                menu_cache_service.bump_version()
 
                 instance.set_url()
                 children = instance.get_children()
@@ -334,6 +449,7 @@ def reset_url(sender, instance: BasePage, update_fields, **kwargs):
 
                         BasePage.objects.bulk_update(pages_to_update, ['url'])
                         BasePage.objects.rebuild()
+                        sitemap_cache_service.bump_version()
 
         else:
             instance.set_url()
@@ -344,8 +460,11 @@ def update_children_url(sender, instance: BasePage, *args, **kwargs):
     if type(sender) == type(BasePage):
         children = instance.get_children()
         if children:
+            breadcrumbs_cache_service.bump_version()
+            menu_cache_service.bump_version()
             pages_to_update = []
             set_children_url(None, children, pages_to_update)
 
             BasePage.objects.bulk_update(pages_to_update, ['url'])
             BasePage.objects.rebuild()
+            sitemap_cache_service.bump_version()
@@ -1,17 +1,45 @@
+from django.utils import translation
+
 from .base_page import BasePage
-from django.db.models import Q
 from garpix_utils.paginator import GarpixPaginator
+from ..utils.current_site import get_current_site_id
 
 
 class BaseSearchPage(BasePage):
     paginate_by = 25
     template = 'garpix_page/default_search.html'
 
+    @staticmethod
+    def get_search_result_ids(search_query):
+        """
+        Возвращает id найденных страниц в порядке релевантности.
+        Результат кешируется по сайту, языку и нормализованному запросу до изменения поискового индекса.
+        """
+        from ..cache import search_cache_service
+        from ..search import search_pages
+        from ..search.index import normalize_text
+        from ..settings import SEARCH_RESULTS_LIMIT
+        from ..utils.get_languages import get_languages
+
+        languages = get_languages()
+        language = translation.get_language()
+        if language not in languages:
+            language = languages[0]
+        site_id = get_current_site_id()
+        query = normalize_text(search_query)
+
+        result_ids = search_cache_service.get_result_ids(site_id, language, query)
+        if result_ids is None:
+            result_ids = list(
+                search_pages(query, language, site_id).values_list('id', flat=True)[:SEARCH_RESULTS_LIMIT]
+            )
+            search_cache_service.set_result_ids(site_id, language, query, result_ids)
+        return result_ids
+
     def get_context(self, request=None, *args, **kwargs):
-        from ..utils.get_garpix_page_models import get_garpix_page_models
         context = super().get_context(request, *args, **kwargs)
         search_query = request.GET.get('q', None)
-        object_list = BasePage.objects.none()
+        result_ids = []
 
         try:
             page = int(request.GET.get('page', 1))
@@ -19,19 +47,14 @@ class BaseSearchPage(BasePage):
             page = 1
 
         if search_query is not None:
-            ids = []
-            for Model in get_garpix_page_models():
-                q = Q()
-                for searchable_field in Model.searchable_fields:
-                    searchable_dict = {
-                        f'{searchable_field}__icontains': search_query,
-                    }
-                    q |= Q(**searchable_dict)
-                ids += list(Model.on_site.filter(is_active=True).filter(q).values_list('id', flat=True))
-            object_list = BasePage.objects.filter(id__in=ids)
-
-        paginator = GarpixPaginator(object_list, self.paginate_by)
+            result_ids = self.get_search_result_ids(search_query)
+
+        paginator = GarpixPaginator(result_ids, self.paginate_by)
         paginated_object_list = paginator.get_page(page)
+        # из БД загружаются только страницы текущей выборки
+        pages = BasePage.objects.in_bulk(paginated_object_list.object_list)
+        paginated_object_list.object_list = [pages[page_id] for page_id in paginated_object_list.object_list
+                                             if page_id in pages]
         context.update({
             'paginator': paginator,
             'paginated_object_list': paginated_object_list,
@@ -1,14 +1,16 @@
 from django.core.validators import RegexValidator
 from django.db import models
-from django.urls import reverse
+from django.urls import NoReverseMatch, reverse
 from django.utils.html import format_html
 from garpix_utils.managers import AvailableManager
 from polymorphic.managers import PolymorphicManager
 
-from ...mixins import CloneMixin
+from ...mixins import CloneMixin, DraftMixin, is_draft_preview
+from ...mixins.models.draft_mixin import to_json_data
 from ...models import BasePage
 from polymorphic.models import PolymorphicModel
-from ...serializers import get_components_serializer
+from ...serializers import serialize_instance
+from ...utils.instrumentation import measure
 
 
 class PageComponent(models.Model):
@@ -26,7 +28,7 @@ class PageComponent(models.Model):
         verbose_name_plural = 'Компоненты страницы | Pages components'
 
 
-class BaseComponent(CloneMixin, PolymorphicModel):
+class BaseComponent(CloneMixin, DraftMixin, PolymorphicModel):
     """
     Базовый компонент
     """
@@ -60,14 +62,6 @@ class BaseComponent(CloneMixin, PolymorphicModel):
     objects = PolymorphicManager()
     active_objects = AvailableManager()
 
-    # Версионирование и черновики
-    draft_data = models.JSONField(
-        null=True,
-        blank=True,
-        verbose_name='Данные черновика',
-        help_text='JSON с данными черновика компонента'
-    )
-
     class Meta:
         verbose_name = 'Компонент | Component'
         verbose_name_plural = 'Компоненты | Components'
@@ -110,15 +104,30 @@ class BaseComponent(CloneMixin, PolymorphicModel):
                        args=[self.id])
         return format_html('<a class="inlinechangelink" href="{0}">{1}</a>', link, self.title)
 
+    def apply_draft_to_context(self, context, request):
+        """
+        При предпросмотре черновика подменяет данные компонента измененными в черновике значениями.
+        """
+        if not is_draft_preview(request):
+            return
+        draft_data = self.get_draft_data(request)
+        if draft_data is None:
+            return
+        component_data = draft_data.get('component_data', {})
+        for field_name, value in component_data.items():
+            if hasattr(self, field_name):
+                context[field_name] = value
+
+    def get_draft_live_data(self, request):
+        from ...serializers import get_serializer
+        data = get_serializer(self.__class__)(self, context={'request': request}).data
+        return to_json_data({'component_data': data})
+
     def get_context_data(self, request):
         context = self.get_context(request)
 
         # Подменяем данные компонента данными из черновика, если есть
-        if self.draft_data and 'component_data' in self.draft_data:
-            component_data = self.draft_data['component_data']
-            for field_name, value in component_data.items():
-                if hasattr(self, field_name):
-                    context[field_name] = value
+        self.apply_draft_to_context(context, request)
 
         context.update({
             'template': self.get_template()
@@ -126,26 +135,26 @@ class BaseComponent(CloneMixin, PolymorphicModel):
         return context
 
     def get_api_context_data(self, request):
-        context = self.get_context(request)
+        with measure('component_context'):
+            context = self.get_context(request)
         
         # Подменяем данные компонента данными из черновика, если есть
-        if self.draft_data and 'component_data' in self.draft_data:
-            component_data = self.draft_data['component_data']
-            for field_name, value in component_data.items():
-                if hasattr(self, field_name):
-                    context[field_name] = value
-        
+        self.apply_draft_to_context(context, request)
+
         for k, v in context.items():
             if hasattr(v, 'is_for_component_view'):
-                model_serializer_class = get_components_serializer(v.__class__)
-                context[k] = model_serializer_class(v, context={"request": request}).data
+                context[k] = serialize_instance(v, request, components=True)
         return context
 
     def get_serializer(self):
         return None
 
     def get_admin_url_edit_object(self):
-        url = reverse(f'admin:{self._meta.app_label}_{self._meta.model_name}_change', args=[self.id])
+        try:
+            url = reverse(f'admin:{self._meta.app_label}_{self._meta.model_name}_change', args=[self.id])
+        except NoReverseMatch:
+            # компонент без собственной админки редактируется через общий список компонентов
+            url = reverse('admin:garpix_page_basecomponent_change', args=[self.id])
         return url
 
     def delete(self, using=None, keep_parents=False):
@@ -29,7 +29,24 @@ class FormComponent(BaseComponent):
     
     # Настройки сохранения
     save_submissions = models.BooleanField(default=True, verbose_name='Сохранять отправки')
-    
+
+    # Ограничение частоты отправок (счетчик по форме и IP/сессии за период), по умолчанию выключено
+    rate_limit = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Лимит отправок',
+        help_text='Сколько отправок разрешено с одного IP/сессии за период. 0 - без ограничений'
+    )
+    rate_limit_period = models.PositiveIntegerField(
+        default=60,
+        verbose_name='Период лимита (сек)'
+    )
+    duplicate_window = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Окно защиты от дублей (сек)',
+        help_text='Повторная отправка с тем же ключом идемпотентности или теми же данными '
+                  'в течение окна возвращает исходный ответ. 0 - отключено'
+    )
+
     template = 'garpix_page/components/form.html'
     
     class Meta:
@@ -59,4 +76,7 @@ class FormComponent(BaseComponent):
             'email_notifications': self.email_notifications,
             'notification_emails': self.get_notification_emails_list(),
             'save_submissions': self.save_submissions,
+            'rate_limit': self.rate_limit,
+            'rate_limit_period': self.rate_limit_period,
+            'duplicate_window': self.duplicate_window,
         }
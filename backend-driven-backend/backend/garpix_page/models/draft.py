@@ -0,0 +1,45 @@
+from django.db import models
+
+from ..utils.json_patch import apply_patch
+from .base_page import BasePage
+from .components.base_component import BaseComponent
+
+
+class BaseDraft(models.Model):
+    """
+    Черновик: JSON Patch (RFC 6902) относительно опубликованных данных объекта.
+    revision увеличивается при каждом сохранении, по ней кешируется предпросмотр.
+    """
+    patch = models.JSONField(default=list, verbose_name='Изменения (JSON Patch)')
+    revision = models.PositiveIntegerField(default=0, verbose_name='Ревизия')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Дата изменения')
+
+    class Meta:
+        abstract = True
+
+    def get_data(self, live_data):
+        return apply_patch(live_data, self.patch)
+
+
+class PageDraft(BaseDraft):
+    page = models.OneToOneField(BasePage, on_delete=models.CASCADE, related_name='draft', verbose_name='Страница')
+
+    class Meta:
+        verbose_name = 'Черновик страницы | Page draft'
+        verbose_name_plural = 'Черновики страниц | Page drafts'
+
+    def __str__(self):
+        return f'{self.page_id} (rev. {self.revision})'
+
+
+class ComponentDraft(BaseDraft):
+    component = models.OneToOneField(BaseComponent, on_delete=models.CASCADE, related_name='draft',
+                                     verbose_name='Компонент')
+
+    class Meta:
+        verbose_name = 'Черновик компонента | Component draft'
+        verbose_name_plural = 'Черновики компонентов | Component drafts'
+
+    def __str__(self):
+        return f'{self.component_id} (rev. {self.revision})'
@@ -0,0 +1,26 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from .base_page import BasePage
+
+
+class PageSearchDocument(models.Model):
+    """
+    Поисковый документ страницы для одного языка.
+    Строится из searchable_fields страницы, в PostgreSQL дополнительно хранит tsvector.
+    """
+    page = models.ForeignKey(BasePage, on_delete=models.CASCADE, related_name='search_documents',
+                             verbose_name='Страница')
+    language = models.CharField(max_length=10, verbose_name='Язык')
+    title = models.TextField(blank=True, default='', verbose_name='Заголовок')
+    body = models.TextField(blank=True, default='', verbose_name='Текст')
+    vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Дата изменения')
+
+    class Meta:
+        verbose_name = 'Поисковый документ | Search document'
+        verbose_name_plural = 'Поисковые документы | Search documents'
+        unique_together = (('page', 'language'),)
+
+    def __str__(self):
+        return f'{self.page_id} ({self.language})'
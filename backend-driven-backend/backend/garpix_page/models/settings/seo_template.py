@@ -2,11 +2,11 @@ from django.contrib.sites.models import Site
 from django.db import models
 from garpix_utils.file import get_file_path
 from django.utils.translation import gettext as _
-from garpix_utils.managers import GCurrentSiteManager
 from garpix_utils.models import ActiveMixin
 
 from garpix_page.utils.all_sites import get_all_sites
 from garpix_page.cache import cache_service
+from garpix_page.managers import CurrentSiteManager
 
 
 class SeoTemplate(ActiveMixin, models.Model):
@@ -29,7 +29,7 @@ class SeoTemplate(ActiveMixin, models.Model):
     sites = models.ManyToManyField(Site, default=get_all_sites, verbose_name='Сайты для применения')
 
     objects = models.Manager()
-    on_site = GCurrentSiteManager()
+    on_site = CurrentSiteManager()
 
     class Meta:
         verbose_name = 'Шаблон для seo | SEO template'
@@ -26,6 +26,9 @@ class GarpixPageSiteConfiguration(GarpixSiteConfiguration):
                                   default="User-agent: *\nDisallow: /admin/\nDisallow: /api/")
     sitemap_frequency = models.CharField(max_length=7, choices=CHANGEFRAQ.CHOICES, default=CHANGEFRAQ.ALWAYS,
                                          verbose_name='Sitemap changefreq')
+    # обновляется сигналами сохранения и удаления страниц, см. garpix_page.utils.home_page
+    home_page = models.ForeignKey('garpix_page.BasePage', on_delete=models.SET_NULL, null=True, blank=True,
+                                  related_name='+', verbose_name='Главная страница')
 
     class Meta:
         verbose_name = 'Настройки | Settings'
@@ -1 +1,2 @@
 from .page_common_pagination import GarpixPagePagination  # noqa
+from .list_page_pagination import EstimatedCountPaginator, KeysetPaginator, get_estimated_count, get_list_count  # noqa
@@ -0,0 +1,129 @@
+import base64
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from garpix_utils.paginator import GarpixPaginator
+
+from garpix_page.settings import LIST_PAGE_ESTIMATED_COUNT_THRESHOLD
+
+
+def get_estimated_count(queryset):
+    """
+    Оценка количества строк выборки по статистике планировщика PostgreSQL.
+    Для остальных БД возвращает None.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def get_list_count(queryset):
+    """
+    Количество строк выборки: для больших выборок - оценка планировщика, иначе COUNT(*).
+    """
+    estimated_count = get_estimated_count(queryset)
+    if estimated_count is not None and estimated_count >= LIST_PAGE_ESTIMATED_COUNT_THRESHOLD:
+        return estimated_count
+    return queryset.count()
+
+
+class EstimatedCountPaginator(GarpixPaginator):
+    """
+    Для больших выборок вместо COUNT(*) использует оценку планировщика.
+    """
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            return get_list_count(self.object_list)
+        return super().count
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        # isoformat без округления, иначе курсор разойдется со значением в БД
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class KeysetPaginator:
+    """
+    Постраничный вывод по курсору (?after=) без OFFSET и COUNT.
+    Курсор содержит значения полей сортировки последнего объекта страницы,
+    поля сортировки не должны содержать NULL.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.ordering = self.get_ordering(queryset)
+        if self.ordering is None:
+            raise ValueError('Keyset pagination requires ordering by model fields')
+        self.queryset = queryset.order_by(*self.ordering)
+        self.per_page = per_page
+
+    @staticmethod
+    def get_ordering(queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(field, str) and field != '?' for field in ordering):
+            return None
+        if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+            ordering.append('pk')
+        return ordering
+
+    @staticmethod
+    def _get_value(obj, field):
+        for name in field.lstrip('-').split('__'):
+            obj = getattr(obj, name)
+        return obj
+
+    def encode_cursor(self, obj):
+        values = [self._get_value(obj, field) for field in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(values, default=_encode_value).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            return None
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            return None
+        return values
+
+    def get_filter(self, values):
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_page(self, cursor=None):
+        """
+        Возвращает объекты страницы после курсора и курсор следующей страницы.
+        Некорректный курсор означает первую страницу.
+        """
+        queryset = self.queryset
+        values = self.decode_cursor(cursor) if cursor else None
+        if values is not None:
+            queryset = queryset.filter(self.get_filter(values))
+        object_list = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return object_list, next_cursor
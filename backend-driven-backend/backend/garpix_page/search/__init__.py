@@ -0,0 +1,3 @@
+from .index import update_page_search_documents, rebuild_search_index  # noqa
+from .query import search_pages  # noqa
+from .suggest import suggestion_index  # noqa
@@ -0,0 +1,100 @@
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connection, transaction
+from django.db.models import Case, When
+from django.utils import translation
+from django.utils.html import strip_tags
+
+from garpix_page.cache import search_cache_service
+from garpix_page.settings import SEARCH_CONFIGS
+from garpix_page.utils.get_languages import get_languages
+
+
+def normalize_text(value):
+    return ' '.join(strip_tags(str(value)).lower().split())
+
+
+def get_search_config(language):
+    return SEARCH_CONFIGS.get(language, 'simple')
+
+
+def _get_field_value(obj, path):
+    for name in path.split('__'):
+        obj = getattr(obj, name, None)
+        # пропускаем пустые значения и связи "многие"
+        if obj is None or hasattr(obj, 'all'):
+            return ''
+    return obj
+
+
+def build_page_search_documents(page):
+    """
+    Собирает поисковые документы страницы по всем языкам из searchable_fields.
+    Поле title попадает в заголовок документа (больший вес), остальные - в текст.
+    """
+    from garpix_page.models import PageSearchDocument
+
+    documents = []
+    for language in get_languages():
+        with translation.override(language):
+            values = {field: _get_field_value(page, field) for field in page.searchable_fields}
+        title = values.pop('title', '')
+        documents.append(PageSearchDocument(
+            page=page,
+            language=language,
+            title=normalize_text(title),
+            body=normalize_text(' '.join(str(value) for value in values.values() if value)),
+        ))
+    return documents
+
+
+def update_search_vectors(queryset):
+    """
+    Пересчитывает tsvector документов одним запросом (только PostgreSQL).
+    """
+    if connection.vendor != 'postgresql':
+        return
+
+    def _vector(config):
+        return SearchVector('title', config=config, weight='A') + SearchVector('body', config=config, weight='B')
+
+    queryset.update(vector=Case(
+        *[When(language=language, then=_vector(get_search_config(language))) for language in get_languages()],
+        default=_vector('simple'),
+        output_field=SearchVectorField(),
+    ))
+
+
+def update_page_search_documents(page):
+    """
+    Обновляет поисковые документы страницы. Если текст не изменился, в БД ничего не пишется.
+    """
+    from garpix_page.models import PageSearchDocument
+
+    documents = build_page_search_documents(page)
+    existing = set(PageSearchDocument.objects.filter(page=page).values_list('language', 'title', 'body'))
+    if existing == {(document.language, document.title, document.body) for document in documents}:
+        return
+
+    with transaction.atomic():
+        PageSearchDocument.objects.filter(page=page).delete()
+        PageSearchDocument.objects.bulk_create(documents)
+        update_search_vectors(PageSearchDocument.objects.filter(page=page))
+
+
+def rebuild_search_index(batch_size=500):
+    """
+    Полностью перестраивает поисковый индекс всех страниц.
+    """
+    from garpix_page.models import BasePage, PageSearchDocument
+
+    with transaction.atomic():
+        PageSearchDocument.objects.all().delete()
+        documents = []
+        for page in BasePage.objects.all().iterator(chunk_size=batch_size):
+            documents += build_page_search_documents(page)
+            if len(documents) >= batch_size:
+                PageSearchDocument.objects.bulk_create(documents)
+                documents = []
+        PageSearchDocument.objects.bulk_create(documents)
+        update_search_vectors(PageSearchDocument.objects.all())
+    search_cache_service.bump_version()
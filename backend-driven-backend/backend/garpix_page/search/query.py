@@ -0,0 +1,49 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Case, F, FilteredRelation, IntegerField, Q, Value, When
+from django.utils import translation
+
+from garpix_page.utils.current_site import get_current_site_id
+from garpix_page.utils.get_languages import get_languages
+from .index import get_search_config, normalize_text
+
+
+def search_pages(query, language=None, site_id=None):
+    """
+    Возвращает активные страницы сайта, найденные по поисковому индексу,
+    отсортированные по релевантности (аннотация search_rank).
+    В PostgreSQL используется полнотекстовый поиск по tsvector, в остальных БД - поиск подстрок.
+    """
+    from garpix_page.models import BasePage
+
+    languages = get_languages()
+    language = language or translation.get_language()
+    if language not in languages:
+        language = languages[0]
+    site_id = site_id or get_current_site_id()
+
+    queryset = BasePage.objects.filter(is_active=True, sites__id=site_id).annotate(
+        search_document=FilteredRelation('search_documents', condition=Q(search_documents__language=language))
+    )
+
+    if connection.vendor == 'postgresql':
+        search_query = SearchQuery(query, config=get_search_config(language), search_type='websearch')
+        return queryset.filter(search_document__vector=search_query).annotate(
+            search_rank=SearchRank(F('search_document__vector'), search_query)
+        ).order_by('-search_rank', 'id')
+
+    terms = normalize_text(query).split()
+    if not terms:
+        return queryset.none()
+
+    condition = Q()
+    rank = Value(0)
+    for term in terms:
+        condition &= Q(search_document__title__contains=term) | Q(search_document__body__contains=term)
+        rank += Case(
+            When(search_document__title__contains=term, then=Value(2)),
+            When(search_document__body__contains=term, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    return queryset.filter(condition).annotate(search_rank=rank).order_by('-search_rank', 'id')
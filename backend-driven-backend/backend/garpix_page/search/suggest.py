@@ -0,0 +1,112 @@
+import time
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+
+from django.utils import translation
+
+from garpix_page.cache import search_cache_service
+from garpix_page.settings import SEARCH_SUGGEST_CHECK_INTERVAL
+from .index import normalize_text
+
+
+def get_trigrams(value):
+    value = f'  {value} '
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+class SuggestionIndex:
+    """
+    Индекс заголовков активных страниц сайта для одного языка.
+    Поиск по префиксам слов, при нехватке результатов - по триграммам.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.tokens = []
+        self.trigrams = {}
+        for position, entry in enumerate(entries):
+            normalized_title = normalize_text(entry['title'])
+            for token in set(normalized_title.split()):
+                self.tokens.append((token, position))
+            for trigram in get_trigrams(normalized_title):
+                self.trigrams.setdefault(trigram, []).append(position)
+        self.tokens.sort()
+
+    def _find_by_prefix(self, prefix):
+        found = []
+        start = bisect_left(self.tokens, (prefix, -1))
+        for token, position in self.tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            found.append(position)
+        return found
+
+    def suggest(self, query, limit=10):
+        words = normalize_text(query).split()
+        if not words:
+            return []
+
+        # каждое слово запроса должно быть префиксом какого-либо слова заголовка
+        positions = set(self._find_by_prefix(words[0]))
+        for word in words[1:]:
+            positions &= set(self._find_by_prefix(word))
+        result = sorted(positions)
+
+        if len(result) < limit:
+            query_trigrams = get_trigrams(' '.join(words))
+            scores = Counter()
+            for trigram in query_trigrams:
+                scores.update(self.trigrams.get(trigram, ()))
+            threshold = len(query_trigrams) / 2
+            result += [position for position, score in scores.most_common()
+                       if score >= threshold and position not in result]
+
+        return [self.entries[position] for position in result[:limit]]
+
+
+class SuggestionIndexRegistry:
+    """
+    Держит индексы подсказок в памяти процесса по ключу (сайт, язык).
+    Индексы перестраиваются после изменения версии поискового индекса.
+    """
+
+    def __init__(self):
+        self.indexes = {}
+        self.version = None
+        self.checked_at = 0
+        self.lock = Lock()
+
+    def _check_version(self):
+        now = time.monotonic()
+        if now - self.checked_at < SEARCH_SUGGEST_CHECK_INTERVAL:
+            return
+        self.checked_at = now
+        version = search_cache_service.get_version()
+        if version != self.version:
+            self.indexes = {}
+            self.version = version
+
+    @staticmethod
+    def _build(site_id, language):
+        from garpix_page.models import BasePage
+
+        pages = BasePage.objects.non_polymorphic().filter(is_active=True, sites__id=site_id).order_by('title')
+        with translation.override(language):
+            entries = [{'id': page.id, 'title': page.title, 'url': page.absolute_url}
+                       for page in pages.iterator()]
+        return SuggestionIndex(entries)
+
+    def get_index(self, site_id, language):
+        with self.lock:
+            self._check_version()
+            key = (site_id, language)
+            if key not in self.indexes:
+                self.indexes[key] = self._build(site_id, language)
+            return self.indexes[key]
+
+    def suggest(self, query, site_id, language, limit=10):
+        return self.get_index(site_id, language).suggest(query, limit)
+
+
+suggestion_index = SuggestionIndexRegistry()
@@ -1 +1,3 @@
 from .serializer import get_serializer, get_components_serializer  # noqa
+from .compiled import serialize_instance, can_render_json, render_json  # noqa
+from .fields import ImageSrcsetField  # noqa
@@ -0,0 +1,160 @@
+import threading
+from operator import attrgetter
+
+from rest_framework import fields, relations
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+from garpix_page.settings import COMPILED_SERIALIZERS
+from garpix_page.utils.instrumentation import measure
+from .serializer import get_components_serializer, get_serializer
+
+# поля, для которых to_representation возвращает значение модели без изменений
+IDENTITY_FIELDS = (fields.ReadOnlyField, fields.JSONField)
+STRING_FIELDS = (fields.CharField, fields.SlugField, fields.EmailField, fields.URLField)
+INTEGER_FIELDS = (fields.IntegerField,)
+
+_local = threading.local()
+
+
+def _identity(value):
+    return value
+
+
+class CompiledSerializer:
+    """
+    Плоский сериализатор, собранный из полей ModelSerializer.
+    Простые поля читаются напрямую из атрибутов объекта, внешние ключи - из attname без загрузки связанного
+    объекта, остальные поля обрабатываются как в DRF. Результат совпадает с serializer.data.
+    """
+
+    def __init__(self, serializer_class):
+        # поля привязаны к этому экземпляру, через его _context они получают request
+        self.serializer = serializer_class(context={})
+        self.extractors = [self._compile_field(field) for field in self.serializer._readable_fields]
+
+    def _compile_field(self, field):
+        model = self.serializer.Meta.model
+        source = field.source
+        field_class = type(field)
+
+        if field_class is relations.PrimaryKeyRelatedField and field.pk_field is None and len(field.source_attrs) == 1:
+            model_field = model._meta.get_field(source)
+            return field.field_name, attrgetter(model_field.attname), _identity
+
+        if len(field.source_attrs) != 1 or source == '*':
+            return field.field_name, None, field
+
+        if field_class is fields.ReadOnlyField and callable(getattr(model, source, None)):
+            def getter(instance, name=source):
+                return getattr(instance, name)()
+            return field.field_name, getter, _identity
+
+        if not self._is_concrete_field(model, source):
+            return field.field_name, None, field
+
+        if field_class in STRING_FIELDS:
+            converter = str
+        elif field_class in INTEGER_FIELDS:
+            converter = int
+        elif field_class in IDENTITY_FIELDS and not getattr(field, 'binary', False):
+            converter = _identity
+        else:
+            converter = field.to_representation
+        return field.field_name, attrgetter(source), converter
+
+    @staticmethod
+    def _is_concrete_field(model, name):
+        try:
+            model_field = model._meta.get_field(name)
+        except Exception:
+            return False
+        return model_field.concrete and not model_field.is_relation
+
+    def to_representation(self, instance):
+        ret = {}
+        for name, getter, converter in self.extractors:
+            if getter is None:
+                # поле обрабатывается так же, как в Serializer.to_representation
+                field = converter
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[name] = None if check_for_none is None else field.to_representation(attribute)
+                continue
+            value = getter(instance)
+            ret[name] = None if value is None else converter(value)
+        return ret
+
+    def serialize(self, instance, request, many=False):
+        self.serializer._context = {'request': request}
+        try:
+            if many:
+                return [self.to_representation(item) for item in instance]
+            return self.to_representation(instance)
+        finally:
+            self.serializer._context = {}
+
+
+def get_compiled_serializer(model, components=False):
+    """
+    Возвращает скомпилированный сериализатор модели или None, если у модели свой сериализатор.
+    Сериализаторы кешируются в пределах потока.
+    """
+    cache = getattr(_local, 'serializers', None)
+    if cache is None:
+        cache = _local.serializers = {}
+    key = (model, components)
+    if key not in cache:
+        if model.get_serializer(model) is not None:
+            cache[key] = None
+        else:
+            serializer_class = get_components_serializer(model) if components else get_serializer(model)
+            cache[key] = CompiledSerializer(serializer_class)
+    return cache[key]
+
+
+def serialize_instance(instance, request, many=False, components=False):
+    """
+    Сериализует объект страницы или компонента (при many=True - список объектов одной модели).
+    При включенном GARPIX_PAGE_COMPILED_SERIALIZERS используется скомпилированный сериализатор,
+    для моделей со своим сериализатором - DRF.
+    """
+    model = instance[0].__class__ if many else instance.__class__
+    with measure('serializer'):
+        if COMPILED_SERIALIZERS:
+            compiled_serializer = get_compiled_serializer(model, components)
+            if compiled_serializer is not None:
+                return compiled_serializer.serialize(instance, request, many)
+        serializer_class = get_components_serializer(model) if components else get_serializer(model)
+        return serializer_class(instance, context={'request': request}, many=many).data
+
+
+_json_renderer = JSONRenderer()
+_json_encoder = encoders.JSONEncoder(
+    ensure_ascii=_json_renderer.ensure_ascii,
+    allow_nan=not _json_renderer.strict,
+    separators=(',', ':') if _json_renderer.compact else (', ', ': '),
+)
+
+
+def can_render_json(request):
+    """
+    Ответ можно отдать через render_json, если согласован обычный JSONRenderer без параметров (indent и т.п.).
+    """
+    renderer = getattr(request, 'accepted_renderer', None)
+    return type(renderer) is JSONRenderer and request.accepted_media_type == renderer.media_type
+
+
+def render_json(data):
+    """
+    Кодирует данные в байты так же, как JSONRenderer, но без согласования и контекста рендерера.
+    """
+    ret = _json_encoder.encode(data)
+    if '\u2028' in ret or '\u2029' in ret:
+        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+    return ret.encode()
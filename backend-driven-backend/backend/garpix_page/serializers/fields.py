@@ -0,0 +1,23 @@
+from rest_framework.fields import Field
+
+from garpix_page.utils.image_variants import image_variant_service
+
+
+class ImageSrcsetField(Field):
+    """
+    srcset webp вариантов изображения из манифеста image_variant_service.
+    Пока варианты не созданы (или файл не растровый), возвращает None.
+
+        image_srcset = ImageSrcsetField(source='image')
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        name = getattr(value, 'name', value)
+        if not name:
+            return None
+        request = self.context.get('request', None)
+        return image_variant_service.get_srcset(name, request.build_absolute_uri if request is not None else None)
@@ -1,4 +1,5 @@
 from garpix_page.utils.get_exclude_fields import get_exclude_fields
+from garpix_page.serializers.fields import ImageSrcsetField
 from rest_framework.fields import ReadOnlyField
 from rest_framework.serializers import ModelSerializer
 
@@ -36,6 +37,7 @@ def get_serializer(model):
         'seo_description': ReadOnlyField(source='get_seo_description'),
         'seo_author': ReadOnlyField(source='get_seo_author'),
         'seo_og_type': ReadOnlyField(source='get_seo_og_type'),
+        'seo_image_srcset': ImageSrcsetField(source='get_seo_image'),
         **extra_fields,
         'Meta': type('Meta', (object,), {
             'model': model,
@@ -58,3 +58,93 @@ STRING_HANDLERS = [
     'garpix_page.utils.tags.render.ApplyRenderTag',
     *getattr(settings, 'STRING_HANDLERS', [])
 ]
+
+# request header with the client-provided idempotency key for form submissions
+FORM_IDEMPOTENCY_HEADER = getattr(settings, 'GARPIX_PAGE_FORM_IDEMPOTENCY_HEADER', 'HTTP_IDEMPOTENCY_KEY')
+
+# postgres text search configuration per language, others fall back to 'simple'
+SEARCH_CONFIGS = {
+    'ru': 'russian',
+    'en': 'english',
+    'de': 'german',
+    **getattr(settings, 'GARPIX_PAGE_SEARCH_CONFIGS', {})
+}
+
+# ranked search results are cached as id lists, at most SEARCH_RESULTS_LIMIT ids per query
+SEARCH_RESULTS_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_SEARCH_RESULTS_CACHE_TIMEOUT', 60 * 60)
+SEARCH_RESULTS_LIMIT = getattr(settings, 'GARPIX_PAGE_SEARCH_RESULTS_LIMIT', 1000)
+
+# how often (in seconds) the in-memory suggestion index checks the search index version
+SEARCH_SUGGEST_CHECK_INTERVAL = getattr(settings, 'GARPIX_PAGE_SEARCH_SUGGEST_CHECK_INTERVAL', 5)
+
+# list pages use the postgres planner estimate instead of COUNT(*) above this number of rows
+LIST_PAGE_ESTIMATED_COUNT_THRESHOLD = getattr(settings, 'GARPIX_PAGE_LIST_PAGE_ESTIMATED_COUNT_THRESHOLD', 10000)
+
+# sitemap sections cover fixed id ranges of one page model, at most SITEMAP_SECTION_SIZE urls each
+SITEMAP_SECTION_SIZE = min(getattr(settings, 'GARPIX_PAGE_SITEMAP_SECTION_SIZE', 10000), 50000)
+SITEMAP_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_SITEMAP_CACHE_TIMEOUT', 60 * 60 * 24)
+
+# serialize page api objects with compiled flat serializers and render json without drf renderer machinery
+COMPILED_SERIALIZERS = getattr(settings, 'GARPIX_PAGE_COMPILED_SERIALIZERS', False)
+
+# garpix_page.middleware.InstrumentationMiddleware profiles this share of requests (0.0 - 1.0)
+INSTRUMENTATION_ENABLED = getattr(settings, 'GARPIX_PAGE_INSTRUMENTATION', False)
+INSTRUMENTATION_SAMPLE_RATE = getattr(settings, 'GARPIX_PAGE_INSTRUMENTATION_SAMPLE_RATE', 1.0)
+
+# compiled django templates of <render> and <makeup> tags kept in memory (LRU by source hash)
+TAG_TEMPLATE_CACHE_SIZE = getattr(settings, 'GARPIX_PAGE_TAG_TEMPLATE_CACHE_SIZE', 256)
+
+# processed grapesjs html is cached by value hash, bump the version after changing STRING_HANDLERS or template tags
+STRING_HANDLING_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_STRING_HANDLING_CACHE_TIMEOUT', 60 * 60 * 24)
+STRING_HANDLING_CACHE_VERSION = getattr(settings, 'GARPIX_PAGE_STRING_HANDLING_CACHE_VERSION', 1)
+
+# how many levels of related objects (items, nested items, ...) CloneMixin.clone_object copies
+CLONE_DEPTH = getattr(settings, 'GARPIX_PAGE_CLONE_DEPTH', 3)
+
+# rendered draft previews (?__garpix_page_draft=1) are cached per draft revision
+DRAFT_PREVIEW_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_DRAFT_PREVIEW_CACHE_TIMEOUT', 60 * 10)
+
+# uploaded grapesjs assets are stored once per content hash under UPLOAD_CONTENT_DIR
+UPLOAD_CONTENT_DIR = getattr(settings, 'GARPIX_PAGE_UPLOAD_CONTENT_DIR', 'uploads/content')
+# files of one upload request are hashed and stored in parallel threads
+UPLOAD_WORKERS = getattr(settings, 'GARPIX_PAGE_UPLOAD_WORKERS', 4)
+
+# webp variants of images are generated in celery for these widths (only those smaller than the original)
+# and stored under IMAGE_VARIANT_DIR with paths derived from the original file name
+IMAGE_VARIANT_WIDTHS = getattr(settings, 'GARPIX_PAGE_IMAGE_VARIANT_WIDTHS', (480, 960, 1920))
+IMAGE_VARIANT_DIR = getattr(settings, 'GARPIX_PAGE_IMAGE_VARIANT_DIR', 'variants')
+IMAGE_VARIANT_QUALITY = getattr(settings, 'GARPIX_PAGE_IMAGE_VARIANT_QUALITY', 82)
+# variant manifests kept in process memory, a missing manifest schedules generation at most once per timeout
+IMAGE_VARIANT_MANIFEST_CACHE_SIZE = getattr(settings, 'GARPIX_PAGE_IMAGE_VARIANT_MANIFEST_CACHE_SIZE', 4096)
+IMAGE_VARIANT_PENDING_TIMEOUT = getattr(settings, 'GARPIX_PAGE_IMAGE_VARIANT_PENDING_TIMEOUT', 60 * 10)
+
+# page breadcrumbs ({id, title, url} of ancestors) are cached per page and language until any page url or title changes
+BREADCRUMBS_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_BREADCRUMBS_CACHE_TIMEOUT', 60 * 60 * 24)
+
+# parsed Accept-Language headers -> negotiated language, kept in a per-process LRU
+ACCEPT_LANGUAGE_CACHE_SIZE = getattr(settings, 'GARPIX_PAGE_ACCEPT_LANGUAGE_CACHE_SIZE', 512)
+
+# page bundle endpoint ({API_URL}/pages/?slug=a&slug=b) resolves at most this many pages per request
+PAGE_BUNDLE_MAX_SLUGS = getattr(settings, 'GARPIX_PAGE_PAGE_BUNDLE_MAX_SLUGS', 20)
+
+# published pages are pre-rendered (page api json and html) into this directory, None disables the export on publish
+STATIC_EXPORT_ROOT = getattr(settings, 'GARPIX_PAGE_STATIC_EXPORT_ROOT', None)
+# pages are rendered in batches by a pool of worker processes
+STATIC_EXPORT_WORKERS = getattr(settings, 'GARPIX_PAGE_STATIC_EXPORT_WORKERS', 4)
+STATIC_EXPORT_BATCH_SIZE = getattr(settings, 'GARPIX_PAGE_STATIC_EXPORT_BATCH_SIZE', 50)
+# a running export holds a cache lock, exports scheduled meanwhile are retried after the countdown
+STATIC_EXPORT_LOCK_TIMEOUT = getattr(settings, 'GARPIX_PAGE_STATIC_EXPORT_LOCK_TIMEOUT', 60 * 30)
+STATIC_EXPORT_RETRY_COUNTDOWN = getattr(settings, 'GARPIX_PAGE_STATIC_EXPORT_RETRY_COUNTDOWN', 30)
+
+# global context providers (dotted paths to GlobalContextProvider subclasses), see garpix_page.contexts.providers
+GLOBAL_CONTEXT_PROVIDERS = getattr(settings, 'GARPIX_PAGE_GLOBAL_CONTEXT_PROVIDERS', ())
+GLOBAL_CONTEXT_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_GLOBAL_CONTEXT_CACHE_TIMEOUT', 60 * 60 * 24)
+
+# garpix-menu trees (catalog and header menus of components) are cached per menu code, depth, language and site
+MENU_TREE_CACHE_TIMEOUT = getattr(settings, 'GARPIX_PAGE_MENU_TREE_CACHE_TIMEOUT', 60 * 60 * 24)
+
+# sites are kept in process memory, reset by Site signals in the same process and reloaded after the timeout
+SITE_REGISTRY_TIMEOUT = getattr(settings, 'GARPIX_PAGE_SITE_REGISTRY_TIMEOUT', 60 * 5)
+
+# admin list endpoints with ?stream=1 read ids with a chunked iterator and serialize rows in batches of this size
+STREAMING_JSON_BATCH_SIZE = getattr(settings, 'GARPIX_PAGE_STREAMING_JSON_BATCH_SIZE', 200)
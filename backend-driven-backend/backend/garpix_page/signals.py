@@ -1,11 +1,93 @@
-from django.db.models.signals import post_delete
+from django.apps import apps
+from django.contrib.sites.models import Site
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from garpix_page.cache import cache_service
+from garpix_page.cache import cache_service, menu_cache_service, search_cache_service
 
-from garpix_page.models import SeoTemplate
+from garpix_page.contexts.providers import global_context_registry
+from garpix_page.export import schedule_static_export
+from garpix_page.models import BasePage, SeoTemplate
+from garpix_page.search import update_page_search_documents
+from garpix_page.utils.home_page import refresh_home_pages
+from garpix_page.utils.site_registry import site_registry
 
 
 @receiver(post_delete, sender=SeoTemplate)
 def clean_seo_cache(sender, *args, **kwargs):
     cache_service.clear_seo_data()
+
+
+@receiver(post_save)
+def update_search_documents(sender, instance, raw=False, **kwargs):
+    if raw or not issubclass(sender, BasePage):
+        return
+    if type(instance) is BasePage:
+        instance = instance.get_real_instance()
+    update_page_search_documents(instance)
+    search_cache_service.bump_version()
+
+
+@receiver(post_delete)
+def reset_search_cache(sender, instance, **kwargs):
+    if issubclass(sender, BasePage):
+        search_cache_service.bump_version()
+
+
+@receiver(m2m_changed, sender=BasePage.sites.through)
+def reset_search_cache_on_sites_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        search_cache_service.bump_version()
+
+
+@receiver(post_save)
+def update_home_page_on_save(sender, instance, raw=False, **kwargs):
+    if not raw and issubclass(sender, BasePage):
+        refresh_home_pages(instance)
+
+
+@receiver(post_delete)
+def update_home_page_on_delete(sender, instance, **kwargs):
+    if issubclass(sender, BasePage):
+        refresh_home_pages(instance)
+
+
+@receiver(m2m_changed, sender=BasePage.sites.through)
+def update_home_page_on_sites_change(sender, instance, action, reverse, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear') and not reverse:
+        refresh_home_pages(instance)
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def reset_site_registry(sender, **kwargs):
+    site_registry.clear()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def reset_global_context(sender, **kwargs):
+    global_context_registry.invalidate(sender)
+
+
+@receiver(m2m_changed)
+def reset_global_context_on_m2m_change(sender, instance, action, model, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        for changed_model in {sender, type(instance), model}:
+            global_context_registry.invalidate(changed_model)
+
+
+if apps.is_installed('garpix_menu'):
+    from garpix_menu.models import MenuItem
+
+    @receiver(post_save, sender=MenuItem)
+    @receiver(post_delete, sender=MenuItem)
+    def reset_menu_cache(sender, **kwargs):
+        menu_cache_service.bump_version()
+        schedule_static_export()
+
+    @receiver(m2m_changed, sender=MenuItem.sites.through)
+    def reset_menu_cache_on_sites_change(sender, action, **kwargs):
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            menu_cache_service.bump_version()
+            schedule_static_export()
@@ -1 +1,3 @@
 from .update_child_urls import clear_child_cache  # noqa
+from .image_variants import generate_image_variants  # noqa
+from .static_export import export_static_pages  # noqa
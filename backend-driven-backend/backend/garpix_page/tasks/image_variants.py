@@ -0,0 +1,11 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+celery_app = import_string(settings.GARPIXCMS_CELERY_SETTINGS)
+
+
+@celery_app.task()
+def generate_image_variants(name):
+    from garpix_page.utils.image_variants import image_variant_service
+
+    image_variant_service.generate(name)
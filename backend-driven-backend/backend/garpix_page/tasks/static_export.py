@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+celery_app = import_string(settings.GARPIXCMS_CELERY_SETTINGS)
+
+STATIC_EXPORT_LOCK_KEY = 'garpix_page_static_export_lock'
+
+
+@celery_app.task(bind=True, max_retries=None)
+def export_static_pages(self):
+    from garpix_page.export import export_pages
+    from garpix_page.settings import STATIC_EXPORT_LOCK_TIMEOUT, STATIC_EXPORT_RETRY_COUNTDOWN, STATIC_EXPORT_ROOT
+
+    # выгрузки не должны пересекаться: обе переписывают манифест
+    if not cache.add(STATIC_EXPORT_LOCK_KEY, 1, STATIC_EXPORT_LOCK_TIMEOUT):
+        raise self.retry(countdown=STATIC_EXPORT_RETRY_COUNTDOWN)
+    try:
+        export_pages(STATIC_EXPORT_ROOT)
+    finally:
+        cache.delete(STATIC_EXPORT_LOCK_KEY)
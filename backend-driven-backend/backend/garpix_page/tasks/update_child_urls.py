@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+from garpix_page.cache import breadcrumbs_cache_service, menu_cache_service, sitemap_cache_service
 from garpix_page.utils.set_children_urls import set_children_url
 
 celery_app = import_string(settings.GARPIXCMS_CELERY_SETTINGS)
@@ -18,3 +19,6 @@ def clear_child_cache(id):
 
     BasePage.objects.bulk_update(pages_to_update, ['url'])
     BasePage.objects.rebuild()
+    breadcrumbs_cache_service.bump_version()
+    menu_cache_service.bump_version()
+    sitemap_cache_service.bump_version()
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..utils.accept_language import negotiate_language, parse_accept_language
+from ..utils.get_languages import get_languages
+from ..utils.translation_fields import get_translation_fields
+
+
+class AcceptLanguageTest(TestCase):
+
+    def test_parse(self):
+        self.assertEqual(parse_accept_language('ru-RU,ru;q=0.9,en;q=0.8,de;q=0'),
+                         [('ru-ru', 1.0), ('ru', 0.9), ('en', 0.8)])
+        self.assertEqual(parse_accept_language('fr;q=0.5, de , en;q=bad'), [('de', 1.0), ('fr', 0.5)])
+
+    def test_negotiate(self):
+        default = get_languages()[0]
+        self.assertEqual(negotiate_language('ru-RU,ru;q=0.9,en;q=0.8'), 'ru')
+        self.assertEqual(negotiate_language('fr-FR,de;q=0.7,en;q=0.3'), 'de')
+        self.assertEqual(negotiate_language('zh-CN'), 'zh-hans')
+        self.assertEqual(negotiate_language('zh-Hans-CN'), 'zh-hans')
+        self.assertEqual(negotiate_language('fr'), default)
+        self.assertEqual(negotiate_language(''), default)
+
+    def test_page_api_language(self):
+        translation.activate('ru')
+        page = baker.make(get_page_model(), title='Страница', slug='page', sites=Site.objects.all())
+        response = self.client.get(f'/{settings.API_URL}/page{page.url}', HTTP_ACCEPT_LANGUAGE='ru-RU,ru;q=0.9')
+        self.assertEqual(response.json()['init_state']['object']['title'], 'Страница')
+        self.assertIn('Accept-Language', response['Vary'])
+
+    def test_translation_fields(self):
+        self.assertEqual(get_translation_fields(BasePage)['title'],
+                         [f'title_{language.replace("-", "_")}' for language in get_languages()])
+        self.assertNotIn('url', get_translation_fields(BasePage))
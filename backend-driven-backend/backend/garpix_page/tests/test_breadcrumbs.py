@@ -0,0 +1,55 @@
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..utils.get_languages import get_languages
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class BreadcrumbsTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        model = get_page_model()
+        sites = Site.objects.all()
+        self.root = baker.make(model, title='Root', slug='root', sites=sites)
+        self.child = baker.make(model, title='Child', slug='child', parent=self.root, sites=sites)
+        self.leaf = baker.make(model, title='Leaf', slug='leaf', parent=self.child, sites=sites)
+        # baker заполняет поля mptt случайными значениями
+        BasePage.objects.rebuild()
+
+    def get_leaf(self):
+        return BasePage.objects.get(pk=self.leaf.pk)
+
+    def test_breadcrumbs(self):
+        leaf = self.get_leaf()
+        with self.assertNumQueries(1):
+            self.assertEqual([page.title for page in leaf.get_breadcrumbs()], ['Root', 'Child', 'Leaf'])
+
+        with self.assertNumQueries(1):
+            breadcrumbs = leaf.get_breadcrumbs_data()
+        self.assertEqual(breadcrumbs, [
+            {'id': self.root.pk, 'title': 'Root', 'url': '/root'},
+            {'id': self.child.pk, 'title': 'Child', 'url': '/root/child'},
+            {'id': self.leaf.pk, 'title': 'Leaf', 'url': '/root/child/leaf'},
+        ])
+        with self.assertNumQueries(0):
+            leaf.get_breadcrumbs_data()
+
+    def test_cache_is_invalidated(self):
+        self.get_leaf().get_breadcrumbs_data()
+
+        root = BasePage.objects.get(pk=self.root.pk)
+        root.title = 'New root'
+        root.slug = 'new-root'
+        root.save()
+
+        self.assertEqual(self.get_leaf().get_breadcrumbs_data()[0], {
+            'id': self.root.pk, 'title': 'New root', 'url': '/new-root',
+        })
+        self.assertEqual(self.get_leaf().get_breadcrumbs_data()[-1]['url'], '/new-root/child/leaf')
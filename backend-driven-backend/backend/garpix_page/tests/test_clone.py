@@ -0,0 +1,75 @@
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_item_relations, get_page_model
+from ..models.components.base_component import PageComponent
+from ..utils.get_garpix_page_models import get_garpix_page_component_models
+from ..utils.get_languages import get_languages
+
+
+def get_nested_component_model():
+    """
+    Компонент с элементами, у которых есть свои дочерние элементы (группы ссылок -> ссылки).
+    """
+    for model in get_garpix_page_component_models():
+        for relation in get_item_relations(model):
+            nested = [item for item in relation.related_model._meta.related_objects if item.one_to_many]
+            if nested:
+                return model, relation, nested[0]
+    return None, None, None
+
+
+class CloneMixinTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        self.sites = Site.objects.all()
+        self.page = baker.make(get_page_model(), title='Page', slug='page', sites=self.sites)
+
+    def test_clone_component_with_nested_items(self):
+        model, relation, nested_relation = get_nested_component_model()
+        if model is None:
+            self.skipTest('No component with nested items')
+        component = baker.make(model, title='Component')
+        PageComponent.objects.create(page=self.page, component=component, view_order=3)
+        items = baker.make(relation.related_model, _quantity=5, **{relation.field.name: component})
+        for item in items:
+            baker.make(nested_relation.related_model, _quantity=10, **{nested_relation.field.name: item})
+
+        with CaptureQueriesContext(connection) as context:
+            clone = model.objects.get(pk=component.pk).clone_object(title=f'Component ({component.get_clone_count()})')
+        # количество запросов не зависит от числа элементов
+        self.assertLess(len(context.captured_queries), 20)
+
+        self.assertNotEqual(clone.pk, component.pk)
+        self.assertEqual(clone.title, 'Component (1)')
+        self.assertEqual(component.get_clone_count(), 2)
+        self.assertEqual(list(PageComponent.objects.filter(component=clone).values_list('page', 'view_order')),
+                         [(self.page.pk, 3)])
+
+        item_model, nested_model = relation.related_model, nested_relation.related_model
+        clone_items = item_model.objects.filter(**{relation.field.name: clone})
+        self.assertEqual(clone_items.count(), 5)
+        self.assertFalse(clone_items.filter(pk__in=[item.pk for item in items]).exists())
+        self.assertEqual(nested_model.objects.filter(**{f'{nested_relation.field.name}__in': clone_items}).count(), 50)
+        # оригинал не изменился
+        self.assertEqual(nested_model.objects.filter(**{f'{nested_relation.field.name}__in': items}).count(), 50)
+
+    def test_clone_page(self):
+        component = baker.make(get_garpix_page_component_models()[0], title='Component')
+        PageComponent.objects.create(page=self.page, component=component, view_order=7)
+        child = baker.make(get_page_model(), title='Child', slug='child', parent=self.page, sites=self.sites)
+
+        page = self.page.__class__.objects.get(pk=self.page.pk)
+        clone = page.clone_object(title='Page (1)', slug='page-1')
+
+        self.assertEqual(set(clone.sites.all()), set(self.sites))
+        self.assertEqual(list(PageComponent.objects.filter(page=clone).values_list('component', 'view_order')),
+                         [(component.pk, 7)])
+        # дочерние страницы не копируются
+        self.assertEqual(list(clone.children.all()), [])
+        self.assertEqual(list(self.page.children.all()), [child])
@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.sites.models import Site
+from django.test import RequestFactory
+from django.utils import translation
+from model_bakery import baker, random_gen
+from model_bakery.generators import default_mapping
+from rest_framework.test import APIClient, APITestCase
+
+from ..fields.grapes_js_html import GrapesJsHtmlField
+from ..models.components.base_component import PageComponent
+from ..serializers import get_components_serializer, get_serializer, serialize_instance
+from ..utils.get_garpix_page_models import get_garpix_page_component_models, get_garpix_page_models
+from ..utils.get_languages import get_languages
+
+
+def compiled_serializers(enabled):
+    return mock.patch.multiple('garpix_page.serializers.compiled', COMPILED_SERIALIZERS=enabled)
+
+
+class CompiledSerializerTest(APITestCase):
+    """
+    Скомпилированные сериализаторы и render_json должны давать тот же ответ, что и DRF.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        default_mapping[GrapesJsHtmlField] = random_gen.gen_text
+        super().setUpClass()
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        self.client = APIClient()
+        self.request = RequestFactory().get('/')
+        sites = Site.objects.all()
+        self.pages = [baker.make(model, slug=f'page{i}', sites=sites, seo_title='Заголовок страницы')
+                      for i, model in enumerate(get_garpix_page_models())]
+        self.components = [baker.make(model, title=f'Компонент {i}')
+                           for i, model in enumerate(get_garpix_page_component_models())]
+        for i, component in enumerate(self.components):
+            if not admin.site.is_registered(component.__class__):
+                continue
+            PageComponent.objects.create(page=self.pages[0], component=component, view_order=i)
+
+    def test_serialize_instance(self):
+        with compiled_serializers(True):
+            for page in self.pages:
+                expected = get_serializer(page.__class__)(page, context={'request': self.request}).data
+                self.assertEqual(serialize_instance(page, self.request), expected)
+            for component in self.components:
+                expected = get_components_serializer(component.__class__)(
+                    component, context={'request': self.request}).data
+                self.assertEqual(serialize_instance(component, self.request, components=True), expected)
+
+    def test_page_api_response_is_identical(self):
+        for page in self.pages:
+            url = f'/{settings.API_URL}/page{page.url}'
+            with compiled_serializers(False):
+                expected = self.client.get(url)
+            with compiled_serializers(True), \
+                    mock.patch('garpix_page.views.page_api.COMPILED_SERIALIZERS', True):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, expected.status_code)
+            self.assertEqual(response['Content-Type'], expected['Content-Type'])
+            self.assertEqual(response.content, expected.content, f'Error in page api of {page}')
@@ -0,0 +1,128 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..mixins.views.page_view_mixin import PageViewMixin
+from ..models import PageDraft
+from ..models.components.base_component import PageComponent
+from ..utils.get_languages import get_languages
+from ..utils.json_patch import apply_patch, make_patch
+
+
+class JsonPatchTest(TestCase):
+
+    def test_round_trip(self):
+        source = {'a': 1, 'b': [1, 2, 3], 'c': {'d': 'x'}, 'e/f': None}
+        target = {'a': 2, 'b': [1, {'x': 1}], 'c': {}, 'g': [1], 'e/f': None}
+        patch = make_patch(source, target)
+        self.assertEqual(apply_patch(source, patch), target)
+        self.assertEqual(source['b'], [1, 2, 3])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PageDraftTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        self.page = baker.make(get_page_model(), title='Live', slug='draft-page', sites=Site.objects.all())
+        self.first = baker.make('app.PromoAdComponent', title='First')
+        self.second = baker.make('app.PromoAdComponent', title='Second')
+        self.first_link = PageComponent.objects.create(page=self.page, component=self.first, view_order=1)
+        self.second_link = PageComponent.objects.create(page=self.page, component=self.second, view_order=2)
+        self.draft_url = f'/{settings.API_URL}/admin/pages/{self.page.pk}/draft/'
+
+    def save_draft(self, title):
+        return self.client.post(self.draft_url, {'page_data': {'title': title}}, content_type='application/json')
+
+    def test_save_and_publish(self):
+        self.assertEqual(self.client.get(self.draft_url).status_code, 404)
+        self.save_draft('Draft 1')
+        response = self.save_draft('Draft 2')
+        self.assertEqual(response.json()['draft_revision'], 2)
+        self.assertEqual(self.client.get(self.draft_url).json()['title'], 'Draft 2')
+
+        # в черновике хранится только разница с опубликованной страницей
+        self.assertIn({'op': 'replace', 'path': '/page_data/title', 'value': 'Draft 2'},
+                      PageDraft.objects.get(page=self.page).patch)
+
+        response = self.client.post(f'/{settings.API_URL}/admin/pages/{self.page.pk}/publish/')
+        self.assertEqual(response.status_code, 200)
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.title, 'Draft 2')
+        self.assertFalse(PageDraft.objects.filter(page=self.page).exists())
+
+    def test_preview_is_cached_per_revision(self):
+        url = f'/{settings.API_URL}/page{self.page.url}?__garpix_page_draft=1'
+        self.save_draft('Draft 1')
+        self.assertEqual(self.client.get(url).json()['init_state']['object']['title'], 'Draft 1')
+
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(f'{url}&cold=1')
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(url)
+        self.assertEqual(response.json()['init_state']['object']['title'], 'Draft 1')
+        self.assertLess(len(warm), len(cold))
+
+        self.save_draft('Draft 2')
+        self.assertEqual(self.client.get(url).json()['init_state']['object']['title'], 'Draft 2')
+
+    def get_live_components(self, request):
+        return self.page.from_draft_document(self.page.get_draft_live_data(request))['components']
+
+    def test_component_changes_follow_component_after_reorder(self):
+        request = RequestFactory().get('/')
+        components = self.get_live_components(request)
+        components[1]['title'] = 'Second draft'
+        self.page.save_draft({'page_data': {}, 'components': components}, request)
+
+        # опубликованные компоненты переставлены и добавлен новый
+        self.first_link.view_order, self.second_link.view_order = 2, 1
+        self.first_link.save()
+        self.second_link.save()
+        PageComponent.objects.create(page=self.page, component=baker.make('app.PromoAdComponent', title='Third'),
+                                     view_order=3)
+
+        titles = {component['id']: component['title'] for component in self.page.get_draft_data(request)['components']}
+        self.assertEqual(titles[self.first.pk], 'First')
+        self.assertEqual(titles[self.second.pk], 'Second draft')
+
+    def test_preview_follows_live_changes(self):
+        request = RequestFactory().get('/')
+        self.page.save_draft({'page_data': {'title': 'Draft'}, 'components': self.get_live_components(request)},
+                             request)
+        url = f'/{settings.API_URL}/page{self.page.url}?__garpix_page_draft=1'
+        self.client.get(url)
+
+        self.first.link_url = '/live'
+        self.first.save()
+        components = self.client.get(url).json()['init_state']['components']
+        self.assertEqual([component['link_url'] for component in components], ['/live', ''])
+
+    def test_live_page_loads_draft_with_page(self):
+        self.save_draft('Draft 1')
+        page = PageViewMixin.get_instance_by_slug(self.page.url.strip('/'), get_languages())
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(page.get_draft())
+
+
+class ComponentDraftTest(TestCase):
+
+    def test_preview(self):
+        component = baker.make('app.PromoAdComponent', title='Live')
+        response = self.client.post(f'/{settings.API_URL}/admin/components/{component.pk}/draft/',
+                                    {'component_data': {'title': 'Draft'}}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f'/{settings.API_URL}/admin/components/{component.pk}/draft/').json()['title'],
+                         'Draft')
+
+        component.refresh_from_db()
+        preview = component.get_api_context_data(RequestFactory().get('/', {'__garpix_page_draft': 1}))
+        self.assertEqual(preview['title'], 'Draft')
+        self.assertNotIn('title', component.get_api_context_data(RequestFactory().get('/')))
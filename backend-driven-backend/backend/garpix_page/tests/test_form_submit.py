@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from model_bakery import baker
+
+from ..cache import form_submit_cache_service
+from ..models.components.form_component import FormComponent
+from ..models.form_submission import FormSubmission
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class FormSubmitTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.form = baker.make(FormComponent, title='Form', is_active=True, rate_limit=0, duplicate_window=0,
+                               form_config={'fields': [{'name': 'message', 'type': 'text', 'label': 'Message'}]})
+        self.url = f'/{settings.API_URL}/forms/{self.form.pk}/submit/'
+
+    def submit(self, message='Hello', key=None, ip='127.0.0.1'):
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        return self.client.post(self.url, {'message': message}, content_type='application/json',
+                                REMOTE_ADDR=ip, **headers)
+
+    def test_limits_are_disabled_by_default(self):
+        form = FormComponent.objects.create(title='New', form_title='New')
+        self.assertEqual((form.rate_limit, form.duplicate_window), (0, 0))
+        for _ in range(3):
+            self.assertEqual(self.submit().status_code, 200)
+        self.assertEqual(FormSubmission.objects.count(), 3)
+
+    def test_rate_limit(self):
+        self.form.rate_limit = 2
+        self.form.save()
+        self.assertEqual(self.submit('1').status_code, 200)
+        self.assertEqual(self.submit('2').status_code, 200)
+        response = self.submit('3')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        self.assertEqual(self.submit('4', ip='10.0.0.2').status_code, 200)
+        self.assertEqual(FormSubmission.objects.count(), 3)
+
+    def test_duplicate_is_replayed(self):
+        self.form.duplicate_window = 10
+        self.form.save()
+        first = self.submit()
+        self.assertEqual(self.submit().json(), first.json())
+        self.assertEqual(self.submit(key='abc').status_code, 200)
+        self.assertEqual(self.submit('Other', key='abc').json(), self.submit(key='abc').json())
+        self.assertEqual(FormSubmission.objects.count(), 2)
+
+    def test_idempotency_key_is_scoped_by_client(self):
+        self.form.duplicate_window = 10
+        self.form.save()
+        first = self.submit('Private', key='abc')
+        second = self.submit('Other', key='abc', ip='10.0.0.2')
+        self.assertNotEqual(second.json()['submission_id'], first.json()['submission_id'])
+        self.assertEqual(FormSubmission.objects.count(), 2)
+
+    def test_pending_submit_conflicts(self):
+        self.form.duplicate_window = 10
+        self.form.save()
+        request = RequestFactory().post(self.url, HTTP_IDEMPOTENCY_KEY='abc')
+        key = form_submit_cache_service.get_idempotency_key(request, 'ip_127.0.0.1')
+        form_submit_cache_service.start_submit(self.form, key)
+        self.assertEqual(self.submit(key='abc').status_code, 409)
+        self.assertFalse(FormSubmission.objects.exists())
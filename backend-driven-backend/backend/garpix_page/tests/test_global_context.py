@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import translation
+
+from ..contexts.global_context import global_context
+from ..contexts.providers import GlobalContextProvider, global_context_registry
+from ..utils.get_languages import get_languages
+
+
+class SiteNameProvider(GlobalContextProvider):
+    key = 'site'
+    models = ('sites.Site',)
+    calls = 0
+
+    def get_context(self, request):
+        SiteNameProvider.calls += 1
+        return {'name': Site.objects.get_current().name, 'language': translation.get_language()}
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class GlobalContextTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        Site.objects.clear_cache()
+        translation.activate(get_languages()[0])
+        SiteNameProvider.calls = 0
+        global_context_registry.register(SiteNameProvider)
+        self.request = RequestFactory().get('/')
+
+    def tearDown(self):
+        global_context_registry.unregister(SiteNameProvider.key)
+
+    def test_context_is_cached_per_scope(self):
+        site = Site.objects.get_current()
+        expected = {'site': {'name': site.name, 'language': get_languages()[0]}}
+        self.assertEqual(global_context(self.request, None), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(global_context(self.request, None), expected)
+
+        with translation.override(get_languages()[1]):
+            self.assertEqual(global_context(self.request, None)['site']['language'], get_languages()[1])
+        self.assertEqual(SiteNameProvider.calls, 2)
+
+    def test_context_is_invalidated_by_models(self):
+        global_context(self.request, None)
+        site = Site.objects.get_current()
+        site.name = 'New name'
+        site.save()
+        self.assertEqual(global_context(self.request, None)['site']['name'], 'New name')
+        self.assertEqual(SiteNameProvider.calls, 2)
+
+    def test_error_page_uses_cached_context(self):
+        global_context(self.request, None)
+        response = self.client.get(f'/{settings.API_URL}/page/missing')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['init_state']['global']['site']['name'], Site.objects.get_current().name)
+        self.assertEqual(SiteNameProvider.calls, 1)
@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage, GarpixPageSiteConfiguration
+from ..utils.get_languages import get_languages
+from ..utils.home_page import get_home_page
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class HomePageTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        self.site = Site.objects.get(pk=settings.SITE_ID)
+        self.config = GarpixPageSiteConfiguration.objects.create(site=self.site)
+        self.model = get_page_model()
+        self.page = baker.make(self.model, title='Home', slug='', sites=[self.site])
+        # baker заполняет поля mptt случайными значениями, на postgres они могут выйти за пределы integer
+        BasePage.objects.rebuild()
+        self.page.refresh_from_db()
+
+    def test_home_page_pointer(self):
+        self.config.refresh_from_db()
+        self.assertEqual(self.config.home_page_id, self.page.pk)
+
+        # указатель из кеша и одна полиморфная выборка (страница и ее таблица конкретной модели)
+        get_home_page()
+        with self.assertNumQueries(2):
+            home_page = get_home_page()
+        self.assertEqual(home_page, self.page)
+        self.assertIs(type(home_page), self.model)
+
+        # без кеша указатель читается из настроек сайта
+        cache.clear()
+        with self.assertNumQueries(3):
+            self.assertEqual(get_home_page(), self.page)
+
+    def test_pointer_is_refreshed_by_signals(self):
+        self.page.slug = 'not-home'
+        self.page.save()
+        self.assertIsNone(get_home_page())
+
+        other = baker.make(self.model, title='New home', slug='', sites=[self.site])
+        BasePage.objects.rebuild()
+        other.refresh_from_db()
+        self.assertEqual(get_home_page(), other)
+
+        other.delete()
+        self.assertIsNone(get_home_page())
+        self.config.refresh_from_db()
+        self.assertIsNone(self.config.home_page_id)
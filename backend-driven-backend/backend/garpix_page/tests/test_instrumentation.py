@@ -0,0 +1,54 @@
+import re
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..utils.get_languages import get_languages
+from ..utils.instrumentation import get_current_profile, measure
+
+
+@override_settings(MIDDLEWARE=[*settings.MIDDLEWARE, 'garpix_page.middleware.InstrumentationMiddleware'])
+class InstrumentationTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        baker.make(get_page_model(), title='Page', slug='page', sites=Site.objects.all())
+        BasePage.objects.rebuild()
+        self.url = f'/{settings.API_URL}/page/page'
+
+    def test_enabled(self):
+        with mock.patch('garpix_page.middleware.INSTRUMENTATION_ENABLED', True), \
+                self.assertLogs('garpix_page.instrumentation', 'INFO') as logs, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('page_lookup;dur=', timing)
+        self.assertEqual(int(re.search(r'"(\d+) queries"', timing).group(1)), len(queries))
+
+        profile = logs.records[0].profile
+        self.assertEqual(profile['db_queries'], len(queries))
+        self.assertEqual(profile['timings']['page_lookup']['count'], 1)
+
+    def test_disabled(self):
+        with mock.patch('garpix_page.middleware.INSTRUMENTATION_ENABLED', False), \
+                self.assertNoLogs('garpix_page.instrumentation'):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response)
+
+        self.assertIsNone(get_current_profile())
+        with measure('block'):
+            pass
+        self.assertIsNone(get_current_profile())
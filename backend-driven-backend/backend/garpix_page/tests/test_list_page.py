@@ -0,0 +1,54 @@
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+from model_bakery import baker
+
+from ..models import BaseListPage
+from ..pagination import GarpixPagePagination
+from ..utils.get_garpix_page_models import get_garpix_page_models
+from ..utils.get_languages import get_languages
+
+
+class BaseListPageTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        sites = Site.objects.all()
+        self.factory = RequestFactory()
+        page_models = get_garpix_page_models()
+        list_model = next(model for model in page_models if issubclass(model, BaseListPage))
+        child_model = next(model for model in page_models if not issubclass(model, BaseListPage))
+        self.list_page = baker.make(list_model, title='List', slug='list', sites=sites)
+        for i in range(5):
+            baker.make(child_model, title=f'Child {i}', slug=f'child-{i}', parent=self.list_page, sites=sites)
+        self.children = list(self.list_page.get_queryset().filter(is_active=True))
+        baker.make(child_model, title='Hidden', slug='hidden', parent=self.list_page, is_active=False, sites=sites)
+
+    def get_context(self, **params):
+        return self.list_page.get_context(self.factory.get('/list', params), object=self.list_page, api=True)
+
+    def test_page_mode(self):
+        context = self.get_context(page_size=2, page=2)
+        data = context['paginated_children_list']
+        self.assertEqual(data['count'], 5)
+        self.assertEqual([item['id'] for item in data['results']],
+                         [child.id for child in self.children[2:4]])
+        self.assertEqual(list(context['paginated_object_list']), self.children[2:4])
+        self.assertIn('page=3', data['next'])
+
+    def test_keyset_mode(self):
+        seen = []
+        cursor = ''
+        while cursor is not None:
+            context = self.get_context(page_size=2, after=cursor)
+            seen += context['paginated_object_list']
+            cursor = context['next_cursor']
+        self.assertEqual(seen, self.children)
+        self.assertEqual(context['paginated_children_list']['count'], 5)
+        self.assertIsNone(context['paginated_children_list']['next'])
+
+    def test_default_page_size(self):
+        request = self.factory.get('/list')
+        self.assertEqual(self.list_page.get_paginate_by(request, api=True), GarpixPagePagination.page_size)
+        self.assertEqual(self.list_page.get_paginate_by(request), self.list_page.paginate_by)
+        self.assertEqual(self.list_page.get_paginate_by(self.factory.get('/list', {'page_size': 2}), api=True), 2)
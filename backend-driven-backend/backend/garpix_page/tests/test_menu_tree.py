@@ -0,0 +1,54 @@
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
+from garpix_menu.models import MenuItem
+
+from app.models.components import CatalogMenuComponent
+from ..utils.get_languages import get_languages
+from ..utils.menu_tree import get_menu_tree
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MenuTreeTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        self.catalog = self.make_item('Catalog', url='/catalog', sort=1)
+        self.cars = self.make_item('Cars', parent=self.catalog, url='/cars', sort=2)
+        self.bikes = self.make_item('Bikes', parent=self.catalog, url='/bikes', sort=1)
+        self.make_item('Sedans', parent=self.cars, url='/sedans')
+        self.make_item('Hidden', parent=self.catalog, is_active=False)
+        self.make_item('Other menu', menu_type='footer_menu')
+
+    def make_item(self, title, menu_type='header_menu', **kwargs):
+        item = MenuItem.objects.create(title=title, menu_type=menu_type, **kwargs)
+        item.sites.set(Site.objects.all())
+        return item
+
+    def test_tree(self):
+        with self.assertNumQueries(1):
+            tree = get_menu_tree('header_menu', 2)
+        self.assertEqual([item['title'] for item in tree], ['Catalog'])
+        self.assertEqual([(item['title'], item['link'], item['children']) for item in tree[0]['children']],
+                         [('Bikes', '/bikes', []), ('Cars', '/cars', [])])
+
+        self.assertEqual(get_menu_tree('header_menu', 3)[0]['children'][1]['children'][0]['title'], 'Sedans')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_menu_tree('header_menu', 2), tree)
+
+    def test_cache_is_invalidated(self):
+        get_menu_tree('header_menu', 2)
+        self.bikes.title = 'Motorcycles'
+        self.bikes.save()
+        self.assertEqual(get_menu_tree('header_menu', 2)[0]['children'][0]['title'], 'Motorcycles')
+
+    def test_component_context(self):
+        component = CatalogMenuComponent.objects.create(title='Menu', menu_code='header_menu', max_depth=1)
+        context = component.get_api_context_data(None)
+        self.assertEqual(context['menu'], [{
+            'id': self.catalog.pk, 'title': 'Catalog', 'link': '/catalog', 'icon': None, 'target_blank': False,
+            'css_class': None, 'children': [],
+        }])
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..models.components.base_component import PageComponent
+from ..settings import PAGE_BUNDLE_MAX_SLUGS
+from ..utils.get_languages import get_languages
+
+
+class PageBundleTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        model = get_page_model()
+        sites = Site.objects.all()
+        self.first = baker.make(model, title='First', slug='first', sites=sites)
+        self.second = baker.make(model, title='Second', slug='second', sites=sites)
+        BasePage.objects.rebuild()
+        self.url = f'/{settings.API_URL}/pages/'
+
+    def test_bundle(self):
+        response = self.client.get(self.url, {'slug': ['first', 'second/', 'missing']})
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('global', data)
+        self.assertEqual(list(data['pages']), ['first', 'second', 'missing'])
+        self.assertEqual(data['pages']['first']['status'], 200)
+        self.assertEqual(data['pages']['first']['init_state']['object']['title'], 'First')
+        self.assertNotIn('global', data['pages']['first']['init_state'])
+        self.assertEqual(data['pages']['second']['init_state']['object']['title'], 'Second')
+        self.assertEqual(data['pages']['missing'], {'status': 404, 'page_model': 'Page404', 'init_state': {'object': None}})
+
+        single = self.client.get(f'/{settings.API_URL}/page/first').json()
+        self.assertEqual(single['init_state']['object'], data['pages']['first']['init_state']['object'])
+
+    def test_slug_limit(self):
+        response = self.client.get(self.url, {'slug': [f'page-{i}' for i in range(PAGE_BUNDLE_MAX_SLUGS + 1)]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_shared_components(self):
+        component = baker.make('app.PromoAdComponent', title='Shared')
+        for page in (self.first, self.second):
+            PageComponent.objects.create(page=page, component=component)
+
+        data = self.client.get(self.url, {'slug': ['first', 'second']}).json()
+        first, second = (data['pages'][slug]['init_state']['components'] for slug in ('first', 'second'))
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 1)
+
+    def test_conditional_request(self):
+        for url, params in ((self.url, {'slug': ['first', 'second']}), (f'/{settings.API_URL}/page/first', {})):
+            response = self.client.get(url, params)
+            self.assertIn('Accept-Language', response['Vary'])
+            not_modified = self.client.get(url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertIn('Accept-Language', not_modified['Vary'])
@@ -0,0 +1,45 @@
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+from model_bakery import baker
+from rest_framework.permissions import BasePermission
+
+from ..benchmark.seed import get_page_model
+from ..utils.get_languages import get_languages
+
+
+class CountingPermission(BasePermission):
+    instances = 0
+    checks = 0
+
+    def __init__(self):
+        CountingPermission.instances += 1
+
+    def has_object_permission(self, request, view, obj):
+        CountingPermission.checks += 1
+        return request.GET.get('allow') == '1'
+
+
+class PermissionTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        self.page = baker.make(get_page_model(), title='Page', slug='page', sites=Site.objects.all())
+        self.factory = RequestFactory()
+
+    def test_page_without_permissions(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(self.page.has_permission_required(self.factory.get('/page')))
+
+    def test_permissions_are_created_once_and_memoized(self):
+        CountingPermission.instances = CountingPermission.checks = 0
+        self.page.permissions = [CountingPermission]
+
+        request = self.factory.get('/page', {'allow': '1'})
+        self.assertTrue(self.page.has_permission_required(request))
+        self.assertTrue(self.page.has_permission_required(request))
+        self.assertEqual(CountingPermission.checks, 1)
+
+        self.assertFalse(self.page.has_permission_required(self.factory.get('/page')))
+        self.assertEqual(CountingPermission.checks, 2)
+        self.assertEqual(CountingPermission.instances, 1)
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from ..benchmark import seed
+from ..utils.get_garpix_page_models import get_garpix_page_component_models
+from ..utils.get_languages import get_languages
+from ..utils.query_budget import QueryBudget
+
+# полиморфный queryset догружает реальные объекты отдельным запросом на каждый тип
+COMPONENT_TYPES = len(get_garpix_page_component_models())
+
+# size - число созданных страниц, на каждой странице COMPONENTS_PER_PAGE компонентов
+QUERY_BUDGETS = {
+    # страницы, их реальный тип и сайты страниц одним prefetch, сайт по умолчанию берется из site_registry
+    'admin_pages_list_create': QueryBudget('admin_pages_list_create', lambda size: 3),
+    'admin_components_list': QueryBudget('admin_components_list', lambda size: 2 + COMPONENT_TYPES),
+    'admin_component_instances_list_create': QueryBudget(
+        'admin_component_instances_list_create', lambda size: 2 + COMPONENT_TYPES),
+    'admin_component_instances_page': QueryBudget(
+        'admin_component_instances_page', lambda size: 3 + COMPONENT_TYPES),
+    'page_api': QueryBudget('page_api', lambda size: 5 + COMPONENT_TYPES),
+}
+COMPONENTS_PER_PAGE = 2
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class QueryBudgetTest(TestCase):
+    """
+    Число запросов горячих endpoint'ов не должно расти с объемом данных сверх заявленного бюджета.
+    Замеряется повторный запрос, когда кеши уже заполнены.
+    """
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+
+    def get_urls(self, data):
+        api_url = f'/{settings.API_URL}'
+        return {
+            'admin_pages_list_create': f'{api_url}/admin/pages/',
+            'admin_components_list': f'{api_url}/admin/components/',
+            'admin_component_instances_list_create': f'{api_url}/admin/component-instances/',
+            'admin_component_instances_page': f'{api_url}/admin/component-instances/?page={data.leaf.pk}',
+            'page_api': f'{api_url}/page{data.leaf.url}',
+        }
+
+    def assert_budgets(self, size):
+        data = seed(pages=size, depth=2, components=COMPONENTS_PER_PAGE, items=2)
+        for name, url in self.get_urls(data).items():
+            with self.subTest(name):
+                self.assertEqual(self.client.get(url).status_code, 200)
+                with QUERY_BUDGETS[name].check(size):
+                    self.client.get(url)
+
+    def test_small(self):
+        self.assert_budgets(2)
+
+    def test_large(self):
+        self.assert_budgets(12)
@@ -0,0 +1,54 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.utils import translation
+from model_bakery import baker
+
+from ..models import PageSearchDocument
+from ..cache import search_cache_service
+from ..search import search_pages, rebuild_search_index, suggestion_index
+from ..utils.get_garpix_page_models import get_garpix_page_models
+from ..utils.get_languages import get_languages
+
+
+class PageSearchTest(TestCase):
+
+    def setUp(self):
+        sites = Site.objects.all()
+        self.language = get_languages()[0]
+        translation.activate(self.language)
+        self.page_model = get_garpix_page_models()[0]
+        self.found = baker.make(self.page_model, title='Red bicycle', slug='found', sites=sites)
+        self.other = baker.make(self.page_model, title='Blue scooter', slug='other', sites=sites)
+        self.inactive = baker.make(self.page_model, title='Old bicycle', slug='inactive', is_active=False,
+                                   sites=sites)
+
+    def test_documents_are_built_on_save(self):
+        self.assertEqual(PageSearchDocument.objects.filter(page=self.found).count(), len(get_languages()))
+
+        self.found.title = 'Green scooter'
+        self.found.save()
+        self.assertEqual(set(search_pages('scooter', self.language)), {self.found, self.other})
+
+    def test_search_pages(self):
+        self.assertEqual(list(search_pages('bicycle', self.language)), [self.found])
+        self.assertEqual(list(search_pages('airplane', self.language)), [])
+
+    def test_rebuild_search_index(self):
+        PageSearchDocument.objects.all().delete()
+        rebuild_search_index()
+        self.assertEqual(list(search_pages('bicycle', self.language)), [self.found])
+
+    def test_search_results_cache_is_reset_on_save(self):
+        version = search_cache_service.get_version()
+        search_cache_service.set_result_ids(1, self.language, 'bicycle', [self.found.id])
+        self.other.title = 'Blue bicycle'
+        self.other.save()
+        self.assertGreater(search_cache_service.get_version(), version)
+        self.assertIsNone(search_cache_service.get_result_ids(1, self.language, 'bicycle'))
+
+    def test_suggest(self):
+        suggestion_index.checked_at = 0
+        titles = [item['title'] for item in suggestion_index.suggest('bic', 1, self.language)]
+        self.assertEqual(titles, ['Red bicycle'])
+        titles = [item['title'] for item in suggestion_index.suggest('scoter', 1, self.language)]
+        self.assertEqual(titles, ['Blue scooter'])
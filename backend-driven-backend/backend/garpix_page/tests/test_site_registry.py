@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..utils.all_sites import get_all_sites
+from ..utils.get_languages import get_languages
+from ..utils.site_registry import site_registry
+
+
+class SiteRegistryTest(TestCase):
+
+    def setUp(self):
+        site_registry.clear()
+
+    def tearDown(self):
+        # откат транзакции теста не отправляет сигналы Site
+        site_registry.clear()
+
+    def test_sites_without_queries(self):
+        sites = list(Site.objects.all())
+        self.assertEqual(site_registry.get_all(), sites)
+        with self.assertNumQueries(0):
+            self.assertEqual(site_registry.get_current().pk, settings.SITE_ID)
+            self.assertEqual(get_all_sites(), sites)
+
+    def test_registry_is_refreshed_by_signals(self):
+        site = Site.objects.create(domain='second.example.com', name='Second')
+        self.assertEqual(site_registry.get_domain(site.pk), 'second.example.com')
+        site.domain = 'other.example.com'
+        site.save()
+        self.assertEqual(site_registry.get_domain(site.pk), 'other.example.com')
+        site.delete()
+        with self.assertRaises(Site.DoesNotExist):
+            site_registry.get(site.pk)
+
+    def test_unknown_id_reloads_registry(self):
+        site_registry.get_all()
+        # сайт, созданный другим процессом: сигналы в этом процессе не приходят
+        Site.objects.bulk_create([Site(domain='new.example.com', name='New')])
+        site = Site.objects.get(domain='new.example.com')
+        self.assertEqual(site_registry.filter_ids([settings.SITE_ID, site.pk, 'x']), [settings.SITE_ID, site.pk])
+        self.assertEqual(site_registry.get(site.pk).domain, 'new.example.com')
+        with self.assertRaises(Site.DoesNotExist):
+            site_registry.get(site.pk + 1000)
+
+    def test_page_sites(self):
+        translation.activate(get_languages()[0])
+        page = baker.make(get_page_model(), title='Page', slug='page', sites=Site.objects.all())
+        expected = ''.join(f'{site.domain} ' for site in Site.objects.all())
+        site_registry.get_all()
+        page = BasePage.objects.prefetch_related('sites').get(pk=page.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(page.get_sites, expected)
+            self.assertEqual(page._default_site.pk, settings.SITE_ID)
@@ -0,0 +1,90 @@
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import translation
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..models import BasePage
+from ..settings import SITEMAP_SECTION_SIZE
+from ..utils.get_languages import get_languages
+from ..views.sitemap import get_section_name
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class SitemapTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        sites = Site.objects.all()
+        model = get_page_model()
+        self.first = baker.make(model, title='First', slug='first', sites=sites)
+        self.second = baker.make(model, title='Second', slug='second', sites=sites)
+        baker.make(model, title='Hidden', slug='hidden', display_on_sitemap=False, sites=sites)
+        BasePage.objects.rebuild()
+        self.sections = sorted({self.get_section(page) for page in (self.first, self.second)})
+
+    def get_section(self, page):
+        content_type = ContentType.objects.get_for_model(page.get_real_instance_class())
+        return f'/sitemap-{get_section_name(content_type, page.pk // SITEMAP_SECTION_SIZE)}.xml'
+
+    def get_content(self, response):
+        if response.streaming:
+            return b''.join(response.streaming_content).decode()
+        return response.content.decode()
+
+    def test_index(self):
+        response = self.client.get('/sitemap.xml')
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode()
+        for section in self.sections:
+            self.assertIn(section, content)
+
+        self.assertEqual(self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+    def test_section(self):
+        response = self.client.get(self.sections[0])
+        self.assertEqual(response.status_code, 200)
+        content = self.get_content(response)
+        self.assertIn('/first</loc>', content)
+        self.assertNotIn('/hidden</loc>', content)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.sections[0])
+        self.assertFalse(cached.streaming)
+        self.assertEqual(cached.content.decode(), content)
+        self.assertEqual(self.client.get(self.sections[0], HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+        self.assertEqual(self.client.get('/sitemap-app-missing-0.xml').status_code, 404)
+
+    def test_section_cache_is_invalidated_on_save(self):
+        first = self.client.get(self.sections[0])
+        self.get_content(first)
+
+        self.first.slug = 'renamed'
+        self.first.save()
+        response = self.client.get(self.sections[0])
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        content = self.get_content(response)
+        self.assertIn('/renamed</loc>', content)
+        self.assertNotIn('/first</loc>', content)
+
+    def test_descendant_section_follows_parent_url(self):
+        # потомок другой модели лежит в другой секции, его url пересчитывается без изменения updated_at
+        child = baker.make('app.NewsPost', title='Child', slug='child', parent=self.first, sites=Site.objects.all())
+        BasePage.objects.rebuild()
+        section = self.get_section(child)
+        self.assertNotIn(section, self.sections)
+
+        first = self.client.get(section)
+        self.assertIn('/first/child</loc>', self.get_content(first))
+
+        self.first.slug = 'moved'
+        self.first.save()
+        response = self.client.get(section, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        content = self.get_content(response)
+        self.assertIn('/moved/child</loc>', content)
+        self.assertNotIn('/first/child</loc>', content)
@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.utils import translation
+from garpix_menu.models import MenuItem
+from model_bakery import baker
+
+from ..benchmark.seed import get_page_model
+from ..export import export_pages, get_page_versions
+from ..models import BasePage
+from ..utils.current_site import get_current_site_id
+from ..utils.get_languages import get_languages
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StaticExportTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        cache.clear()
+        self.root = tempfile.mkdtemp()
+        self.site = Site.objects.get(pk=settings.SITE_ID)
+        self.page = baker.make(get_page_model(), title='Page', slug='page', sites=[self.site])
+        BasePage.objects.rebuild()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def get_path(self, *parts):
+        return os.path.join(self.root, self.site.domain, settings.API_URL, 'page', *parts, 'index.json')
+
+    def test_export_is_incremental(self):
+        self.assertEqual(export_pages(self.root, workers=1), 1)
+        with open(self.get_path('page')) as f:
+            self.assertEqual(json.load(f)['init_state']['object']['title'], 'Page')
+        with open(self.get_path('ru', 'page')) as f:
+            self.assertEqual(json.load(f)['init_state']['object']['id'], self.page.pk)
+        with open(os.path.join(self.root, self.site.domain, 'page', 'index.html')) as f:
+            self.assertIn('<title>Page</title>', f.read())
+        self.assertFalse([name for name in os.listdir(os.path.dirname(self.get_path('page'))) if name != 'index.json'])
+
+        self.assertEqual(export_pages(self.root, workers=1), 0)
+
+        self.page.title = 'New title'
+        self.page.save()
+        self.assertEqual(export_pages(self.root, workers=1), 1)
+        with open(self.get_path('page')) as f:
+            self.assertEqual(json.load(f)['init_state']['object']['title'], 'New title')
+
+        self.page.is_active = False
+        self.page.save()
+        self.assertEqual(export_pages(self.root, workers=1), 0)
+        self.assertFalse(os.path.exists(self.get_path('page')))
+        with open(os.path.join(self.root, 'manifest.json')) as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_version_follows_dependencies(self):
+        child = baker.make(get_page_model(), title='Child', slug='child', parent=self.page, sites=[self.site])
+        BasePage.objects.rebuild()
+
+        def get_versions():
+            return {page_id: version for page_id, (url, version) in get_page_versions(self.site).items()}
+
+        versions = get_versions()
+        baker.make(get_page_model(), title='Second child', slug='second-child', parent=self.page, sites=[self.site])
+        BasePage.objects.rebuild()
+        changed = get_versions()
+        self.assertNotEqual(changed[self.page.pk], versions[self.page.pk])
+        self.assertEqual(changed[child.pk], versions[child.pk])
+
+        versions = changed
+        self.page.title = 'Renamed'
+        self.page.save()
+        self.assertNotEqual(get_versions()[child.pk], versions[child.pk])
+
+        versions = get_versions()
+        MenuItem.objects.create(title='Menu item', menu_type='header_menu')
+        self.assertNotEqual(get_versions(), versions)
+
+    def test_export_of_other_site_keeps_settings(self):
+        other = Site.objects.create(domain='other.example', name='Other')
+        baker.make(get_page_model(), title='Other page', slug='other-page', sites=[other])
+        BasePage.objects.rebuild()
+
+        seen = set()
+        client_get = Client.get
+
+        def get(client, *args, **kwargs):
+            seen.add((settings.SITE_ID, get_current_site_id()))
+            return client_get(client, *args, **kwargs)
+
+        with mock.patch.object(Client, 'get', get):
+            self.assertEqual(export_pages(self.root, sites=[other], workers=1), 1)
+        self.assertEqual(seen, {(self.site.pk, other.pk)})
+        self.assertEqual(get_current_site_id(), self.site.pk)
+        with open(os.path.join(self.root, other.domain, settings.API_URL, 'page', 'other-page', 'index.json')) as f:
+            self.assertEqual(json.load(f)['init_state']['object']['title'], 'Other page')
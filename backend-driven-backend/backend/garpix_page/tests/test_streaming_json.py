@@ -0,0 +1,41 @@
+import json
+
+from django.conf import settings
+from django.test import TestCase
+from django.utils import translation
+
+from ..benchmark import seed
+from ..utils.get_languages import get_languages
+
+
+class StreamingJsonTest(TestCase):
+
+    def setUp(self):
+        translation.activate(get_languages()[0])
+        seed(pages=4, depth=2, components=2, items=1)
+        self.urls = [f'/{settings.API_URL}/admin/{name}/' for name in ('pages', 'components', 'component-instances')]
+
+    def get_stream(self, url, **params):
+        response = self.client.get(url, {'stream': 1, **params})
+        self.assertTrue(response.streaming)
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_stream_matches_list(self):
+        for url in self.urls:
+            with self.subTest(url):
+                expected = self.client.get(url).json()
+                data = self.get_stream(url)
+                self.assertEqual(data['results'], expected)
+                self.assertEqual((data['count'], data['offset'], data['limit'], data['has_more']),
+                                 (len(expected), 0, None, False))
+
+    def test_pagination(self):
+        for url in self.urls:
+            with self.subTest(url):
+                expected = self.client.get(url).json()
+                first = self.get_stream(url, limit=3)
+                self.assertEqual(first['results'], expected[:3])
+                self.assertTrue(first['has_more'])
+                rest = self.get_stream(url, offset=3, limit=len(expected))
+                self.assertEqual(rest['results'], expected[3:])
+                self.assertFalse(rest['has_more'])
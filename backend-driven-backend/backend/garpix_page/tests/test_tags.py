@@ -0,0 +1,38 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.template import Template
+from django.test import SimpleTestCase, override_settings
+
+from ..utils import apply_string_handling
+from ..utils.tags.template_cache import template_cache
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StringHandlingTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        template_cache.clear()
+
+    def test_apply_tag_init(self):
+        string = '<p>\\1</p><render>{{ 1|add:"2" }}</render><makeup>{% if 1 %}yes{% endif %}</makeup><render>2</render>'
+        html = apply_string_handling(string)
+        self.assertEqual(
+            html, '<p>\\1</p>3<makeup><div hidden="">{#{% if 1 %}yes{% endif %}#}</div>yes</makeup>2'
+        )
+        # уже отрендеренный makeup не рендерится повторно, при сохранении возвращается исходник
+        self.assertEqual(apply_string_handling(html), html)
+        self.assertEqual(apply_string_handling(html, 'apply_tag_save'),
+                         '<p>\\1</p>3<makeup>{% if 1 %}yes{% endif %}</makeup>2')
+
+    def test_caches(self):
+        string = '<render>{{ 1|add:"2" }}</render><render>{{ 1|add:"2" }}</render>'
+        with mock.patch('garpix_page.utils.tags.template_cache.Template', wraps=Template) as template:
+            self.assertEqual(apply_string_handling(string), '33')
+            # одинаковые теги компилируются один раз
+            self.assertEqual(template.call_count, 1)
+            template_cache.clear()
+            # повторная обработка того же значения берется из кеша целиком
+            self.assertEqual(apply_string_handling(string), '33')
+            self.assertEqual(template.call_count, 1)
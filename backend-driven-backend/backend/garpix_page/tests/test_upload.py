@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from PIL import Image
+
+from app.models.components import RecommendationItem
+from app.serializers import RecommendationItemSerializer
+from ..utils.content_upload import store_upload
+from ..utils.image_variants import image_variant_service
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(width, height, color='red'):
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ImageUploadTest(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.celery_app = import_string(settings.GARPIXCMS_CELERY_SETTINGS)
+        self.always_eager = self.celery_app.conf.task_always_eager
+        self.celery_app.conf.task_always_eager = True
+        cache.clear()
+        user = get_user_model().objects.create_user('admin', password='admin', is_staff=True)
+        self.client.force_login(user)
+
+    def tearDown(self):
+        self.celery_app.conf.task_always_eager = self.always_eager
+        image_variant_service.clear()
+
+    def test_upload_deduplicates_and_creates_variants(self):
+        image = make_image(1000, 500)
+        response = self.client.post(reverse('admin:dgjs_upload'), {'files[]': [
+            SimpleUploadedFile('photo.png', image),
+            SimpleUploadedFile('copy.PNG', image),
+            SimpleUploadedFile('notes.txt', b'text'),
+        ]})
+        result = response.json()
+
+        self.assertEqual(result['data'][0], result['data'][1])
+        self.assertNotEqual(result['data'][0], result['data'][2])
+        self.assertEqual(list(result['variants'][0]), ['480', '960'])
+        self.assertEqual(result['variants'][2], {})
+
+        name = result['data'][0].split(settings.MEDIA_URL, 1)[1]
+        directory, filename = name.rsplit('/', 1)
+        self.assertEqual(default_storage.listdir(directory)[1], [filename])
+        with default_storage.open(image_variant_service.get_variant_name(name, 480)) as file, Image.open(file) as variant:
+            self.assertEqual((variant.format, variant.size), ('WEBP', (480, 240)))
+
+    def test_srcset_is_generated_on_first_request(self):
+        item = RecommendationItem(title='Item', image=SimpleUploadedFile('item.png', make_image(600, 300)))
+        item.image.save(item.image.name, item.image.file, save=False)
+
+        # варианты создаются задачей, поставленной при первом обращении
+        self.assertIsNone(RecommendationItemSerializer(item).data['image_srcset'])
+        image_variant_service.clear()
+        self.assertEqual(
+            RecommendationItemSerializer(item).data['image_srcset'],
+            f'/media/variants/{item.image.name[:-4]}_480w.webp 480w, /media/{item.image.name} 600w'
+        )
+
+    def test_upload_keeps_file_with_normalized_extension(self):
+        stored = store_upload(SimpleUploadedFile('notes.B C', b'spaced'))
+        self.assertTrue(stored.name.endswith('.b_c'))
+        self.assertTrue(default_storage.exists(stored.name))
+
+        again = store_upload(SimpleUploadedFile('copy.b c', b'spaced'))
+        self.assertEqual((again.name, again.created), (stored.name, False))
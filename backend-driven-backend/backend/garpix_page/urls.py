@@ -1,8 +1,9 @@
 from django.urls import path, re_path
 from django.conf import settings
-from garpix_page.views.page_api import PageApiView, PageApiListView
+from garpix_page.views.page_api import PageApiView, PageApiListView, PageBundleApiView
 from garpix_page.views.robots import robots_txt
-from garpix_page.views.sitemap import sitemap_view
+from garpix_page.views.sitemap import sitemap_index_view, sitemap_section_view
+from garpix_page.views.search import search_suggest
 from garpix_page.views.admin_api import (
     pages_list_create, page_detail, pages_metadata, page_layout, page_components_reorder,
     components_list, component_detail, component_metadata, component_types, components_metadata,
@@ -59,10 +60,15 @@ urlpatterns = [
     path(f'{settings.API_URL}/admin/forms/<int:form_id>/submissions/', form_submissions, name='admin_form_submissions'),
     path(f'{settings.API_URL}/admin/forms/<int:form_id>/events/<int:event_id>/logs/', form_event_logs, name='admin_form_event_logs'),
 
+    # Search
+    path(f'{settings.API_URL}/search/suggest/', search_suggest, name='search_suggest'),
+
+    path(f'{settings.API_URL}/pages/', PageBundleApiView.as_view(), name='page_bundle'),
     re_path(r'{}/page_models_list/$'.format(settings.API_URL), PageApiListView.as_view()),
     re_path(r'{}/page/(?P<slugs>.*)/$'.format(settings.API_URL), PageApiView.as_view()),
     re_path(r'{}/page/(?P<slugs>.*)$'.format(settings.API_URL), PageApiView.as_view()),
     
-    path('sitemap.xml', sitemap_view, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap.xml', sitemap_index_view, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap-<str:section>.xml', sitemap_section_view, name='sitemap_section'),
     path('robots.txt', robots_txt),
 ]
@@ -0,0 +1,69 @@
+from functools import lru_cache
+
+from garpix_page.settings import ACCEPT_LANGUAGE_CACHE_SIZE
+from .get_languages import get_languages
+
+__all__ = ('get_request_language', 'negotiate_language', 'parse_accept_language', )
+
+
+def parse_accept_language(header):
+    """
+    Языки из заголовка Accept-Language в порядке убывания q: [(язык, q), ...]. Языки с q=0 и ошибками пропускаются.
+    """
+    result = []
+    for index, item in enumerate(header.split(',')):
+        language, _, params = item.strip().partition(';')
+        language = language.strip().lower()
+        if not language:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params:
+            name, _, value = params.partition('=')
+            if name.strip() != 'q':
+                continue
+            try:
+                q = float(value)
+            except ValueError:
+                continue
+            if not 0 < q <= 1:
+                continue
+        # при равном q сохраняется порядок из заголовка
+        result.append((-q, index, language))
+    return [(language, -q) for q, index, language in sorted(result)]
+
+
+def _match_language(language, languages):
+    if language in languages:
+        return languages[language]
+    # ru-ru -> ru, zh-hans-cn -> zh-hans
+    parts = language.split('-')
+    for length in range(len(parts) - 1, 0, -1):
+        prefix = '-'.join(parts[:length])
+        if prefix in languages:
+            return languages[prefix]
+    # zh, zh-cn -> zh-hans
+    for code, supported in languages.items():
+        if code.split('-')[0] == parts[0]:
+            return supported
+    return None
+
+
+@lru_cache(maxsize=ACCEPT_LANGUAGE_CACHE_SIZE)
+def negotiate_language(header):
+    """
+    Язык из settings.LANGUAGES, наиболее подходящий заголовку Accept-Language, или первый язык из LANGUAGES.
+    """
+    supported = get_languages()
+    languages = {code.lower(): code for code in supported}
+    for language, q in parse_accept_language(header):
+        if language == '*':
+            break
+        match = _match_language(language, languages)
+        if match is not None:
+            return match
+    return supported[0]
+
+
+def get_request_language(request):
+    return negotiate_language(request.META.get('HTTP_ACCEPT_LANGUAGE', ''))
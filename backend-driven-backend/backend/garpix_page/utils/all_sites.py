@@ -1,5 +1,5 @@
-from django.contrib.sites.models import Site
+from garpix_page.utils.site_registry import site_registry
 
 
 def get_all_sites():
-    return Site.objects.all()
+    return site_registry.get_all()
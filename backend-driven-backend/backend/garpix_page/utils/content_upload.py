@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+from django.core.files.storage import default_storage
+
+from garpix_page.settings import UPLOAD_CONTENT_DIR
+from garpix_page.utils.image_variants import get_image_size, image_variant_service
+
+
+class StoredUpload:
+    def __init__(self, name, digest, created, size=None):
+        self.name = name
+        self.digest = digest
+        self.created = created
+        # (ширина, высота) для растровых изображений, иначе None
+        self.size = size
+
+    def get_variant_names(self):
+        """
+        Ширина -> путь webp варианта. Пути детерминированы, файлы появляются после задачи generate_image_variants.
+        """
+        return image_variant_service.get_variant_names(self.name, self.size)
+
+
+def hash_file(file):
+    """
+    sha256 содержимого, файл читается частями.
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def get_content_name(digest, filename, storage=default_storage):
+    # расширение приводится к виду, в котором его сохранит storage, иначе save вернет другое имя
+    ext = os.path.splitext(filename)[1].lower()
+    return f'{UPLOAD_CONTENT_DIR}/{digest[:2]}/{storage.get_valid_name(f"{digest}{ext}")}'
+
+
+def store_upload(file, storage=default_storage):
+    """
+    Сохраняет файл под именем от хеша содержимого. Файл с таким же содержимым повторно не записывается.
+    """
+    digest = hash_file(file)
+    name = get_content_name(digest, file.name, storage)
+    size = get_image_size(file)
+    if storage.exists(name):
+        return StoredUpload(name, digest, False, size)
+
+    saved_name = storage.save(name, file)
+    if saved_name != name:
+        if not storage.exists(name):
+            # storage изменил имя по своим правилам, сохраненный файл единственный
+            return StoredUpload(saved_name, digest, True, size)
+        # тот же файл успели сохранить параллельно, storage выбрал другое имя
+        storage.delete(saved_name)
+    return StoredUpload(name, digest, True, size)
@@ -0,0 +1,28 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_current_site_id = ContextVar('garpix_page_site_id', default=None)
+
+
+def get_current_site_id():
+    """
+    id сайта, для которого строятся страницы: заданный через override_site или settings.SITE_ID.
+    """
+    site_id = _current_site_id.get()
+    if site_id is None:
+        return getattr(settings, 'SITE_ID', 1)
+    return site_id
+
+
+@contextmanager
+def override_site(site_id):
+    """
+    Сайт для кода внутри блока в текущем потоке (контексте), settings.SITE_ID не меняется.
+    """
+    token = _current_site_id.set(site_id)
+    try:
+        yield
+    finally:
+        _current_site_id.reset(token)
@@ -1,28 +1,87 @@
-import django.apps
+import re
 
-from ..models import BasePage, BaseComponent  # noqa
+import django.apps
+from django.urls.resolvers import RoutePattern, _route_to_regex
+from django.utils.functional import cached_property
 
-model_list = []
-components_list = []
 
-for model in django.apps.apps.get_models():
+def _is_registered_model(model, method_name):
+    method = getattr(model, method_name, None)
+    if method is None:
+        return False
     try:
-        if model.is_for_page_view() and model is not BasePage:
-            model_list.append(model)
-    except:  # noqa
-        pass
+        return bool(method())
+    except Exception:
+        return False
 
-for model in django.apps.apps.get_models():
-    try:
-        if model.is_for_component_view() and model is not BaseComponent:
-            components_list.append(model)
-    except:  # noqa
-        pass
+
+class GarpixPageModelRegistry:
+    """
+    Реестр моделей страниц и компонентов. Заполняется при первом обращении после загрузки приложений
+    и дальше не меняется, поэтому импорт views и urls не перебирает модели.
+    """
+
+    @staticmethod
+    def _get_models(method_name, base_model):
+        django.apps.apps.check_models_ready()
+        models = [model for model in django.apps.apps.get_models()
+                  if model is not base_model and _is_registered_model(model, method_name)]
+        return tuple(sorted(models, key=lambda x: x._meta.verbose_name))
+
+    @cached_property
+    def page_models(self):
+        from ..models import BasePage
+        return self._get_models('is_for_page_view', BasePage)
+
+    @cached_property
+    def component_models(self):
+        from ..models import BaseComponent
+        return self._get_models('is_for_component_view', BaseComponent)
+
+    @cached_property
+    def page_models_by_name(self):
+        return {model.__name__: model for model in self.page_models}
+
+    @cached_property
+    def component_models_by_name(self):
+        return {model.__name__: model for model in self.component_models}
+
+    @cached_property
+    def url_patterns(self):
+        """
+        Скомпилированные url_patterns() всех моделей страниц в порядке page_models.
+        """
+        patterns = []
+        for model in self.page_models:
+            for key, value in model.url_patterns().items():
+                pattern = RoutePattern(r'(<url>){}'.format(value['pattern']))
+                pattern.regex = re.compile(
+                    '^/(?P<url>.*){}$'.format(_route_to_regex(value['pattern'], pattern._is_endpoint)[0][1:])
+                )
+                patterns.append({
+                    'model': model,
+                    'key': key,
+                    'value': value,
+                    'pattern': pattern,
+                    'permissions': value.get('permissions', model.permissions),
+                })
+        return tuple(patterns)
+
+
+registry = GarpixPageModelRegistry()
 
 
 def get_garpix_page_models():
-    return sorted(model_list, key=lambda x: x._meta.verbose_name)
+    return list(registry.page_models)
 
 
 def get_garpix_page_component_models():
-    return sorted(components_list, key=lambda x: x._meta.verbose_name)
+    return list(registry.component_models)
+
+
+def get_garpix_page_model(name, default=None):
+    return registry.page_models_by_name.get(name, default)
+
+
+def get_garpix_page_component_model(name, default=None):
+    return registry.component_models_by_name.get(name, default)
@@ -0,0 +1,73 @@
+from django.core.cache import cache
+
+from garpix_page.cache import cache_service
+from garpix_page.utils.current_site import get_current_site_id
+
+
+def find_home_page_id(site_id):
+    """
+    Поиск главной страницы сайта одним запросом по всем моделям страниц.
+    """
+    from garpix_page.models import BasePage
+
+    return BasePage.objects.non_polymorphic().filter(
+        slug='', is_active=True, sites__id=site_id
+    ).order_by('level', 'id').values_list('id', flat=True).first()
+
+
+def update_home_page(site_id):
+    """
+    Заново находит главную страницу сайта и сохраняет указатель в настройках сайта и в кеше.
+    """
+    from garpix_page.models import GarpixPageSiteConfiguration
+
+    home_page_id = find_home_page_id(site_id)
+    if GarpixPageSiteConfiguration.objects.filter(site_id=site_id).update(home_page_id=home_page_id):
+        cache.delete(f'{GarpixPageSiteConfiguration.cache_name}_{site_id}')
+    cache_service.set_home_page_id(site_id, home_page_id)
+    return home_page_id
+
+
+def get_home_page_id(site_id):
+    home_page_id = cache_service.get_home_page_id(site_id)
+    if home_page_id is None:
+        from garpix_page.models import GarpixPageSiteConfiguration
+
+        home_page_id = GarpixPageSiteConfiguration.objects.filter(
+            site_id=site_id, home_page__isnull=False
+        ).values_list('home_page_id', flat=True).first()
+        if home_page_id is None:
+            return update_home_page(site_id)
+        cache_service.set_home_page_id(site_id, home_page_id)
+    return home_page_id or None
+
+
+def get_home_page(site_id=None):
+    """
+    Главная страница сайта (экземпляр конкретной модели) или None.
+    """
+    from garpix_page.models import BasePage
+
+    site_id = site_id or get_current_site_id()
+    home_page_id = get_home_page_id(site_id)
+    if home_page_id is None:
+        return None
+
+    home_pages = BasePage.objects.filter(slug='', is_active=True, sites__id=site_id)
+    home_page = home_pages.filter(pk=home_page_id).first()
+    if home_page is None:
+        # указатель устарел: страницу изменили в обход сигналов
+        home_page_id = update_home_page(site_id)
+        home_page = home_pages.filter(pk=home_page_id).first() if home_page_id else None
+    return home_page
+
+
+def refresh_home_pages(page):
+    """
+    Обновляет указатели сайтов, для которых page является или может стать главной страницей.
+    """
+    from garpix_page.utils.all_sites import get_all_sites
+
+    for site in get_all_sites():
+        if page.slug == '' or cache_service.get_home_page_id(site.pk) == page.pk:
+            update_home_page(site.pk)
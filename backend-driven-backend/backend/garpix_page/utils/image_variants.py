@@ -0,0 +1,160 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, UnidentifiedImageError
+
+from garpix_page.cache import image_variant_cache_service
+from garpix_page.settings import (
+    IMAGE_VARIANT_DIR, IMAGE_VARIANT_MANIFEST_CACHE_SIZE, IMAGE_VARIANT_QUALITY, IMAGE_VARIANT_WIDTHS,
+)
+
+__all__ = ('get_image_size', 'image_variant_service', 'ImageVariantService', )
+
+logger = logging.getLogger(__name__)
+
+# форматы, для которых генерируются webp варианты (svg и анимации отдаются как есть)
+VARIANT_SOURCE_FORMATS = ('JPEG', 'PNG', 'WEBP', 'BMP', 'TIFF')
+
+
+def get_image_size(file):
+    """
+    Размер растрового изображения по заголовку файла, без декодирования. None для остальных файлов.
+    """
+    try:
+        with Image.open(file) as image:
+            if image.format not in VARIANT_SOURCE_FORMATS or getattr(image, 'is_animated', False):
+                return None
+            return image.size
+    except (UnidentifiedImageError, OSError):
+        return None
+    finally:
+        file.seek(0)
+
+
+class ImageVariantService:
+    """
+    Webp варианты изображений по ширине для srcset.
+
+    Пути вариантов вычисляются из имени оригинала, после генерации сохраняется манифест
+    {'width': ..., 'height': ..., 'variants': {ширина: путь}}. Манифесты держатся в памяти процесса,
+    поэтому при сериализации файловое хранилище не читается. Если манифеста нет, генерация ставится
+    в celery, а srcset появится в следующих ответах.
+    """
+
+    def __init__(self, storage=default_storage, maxsize=IMAGE_VARIANT_MANIFEST_CACHE_SIZE):
+        self.storage = storage
+        self.maxsize = maxsize
+        self._manifests = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_variant_name(name, width):
+        return f'{IMAGE_VARIANT_DIR}/{os.path.splitext(name)[0]}_{width}w.webp'
+
+    @staticmethod
+    def get_widths(size):
+        if size is None:
+            return []
+        return [width for width in IMAGE_VARIANT_WIDTHS if width < size[0]]
+
+    def get_variant_names(self, name, size):
+        """
+        Ширина -> путь варианта для изображения размера size. Файлы могут быть еще не созданы.
+        """
+        return {width: self.get_variant_name(name, width) for width in self.get_widths(size)}
+
+    def get_manifest(self, name):
+        """
+        Манифест вариантов или None, если варианты еще не готовы (тогда генерация ставится в очередь).
+        """
+        with self._lock:
+            manifest = self._manifests.get(name)
+            if manifest is not None:
+                self._manifests.move_to_end(name)
+                return manifest
+
+        manifest = image_variant_cache_service.get_manifest(name)
+        if manifest is None:
+            self.schedule(name)
+            return None
+        self._remember(name, manifest)
+        return manifest
+
+    def _remember(self, name, manifest):
+        with self._lock:
+            self._manifests[name] = manifest
+            if len(self._manifests) > self.maxsize:
+                self._manifests.popitem(last=False)
+
+    def schedule(self, name):
+        from garpix_page.tasks import generate_image_variants
+
+        if not image_variant_cache_service.add_pending(name):
+            return
+        try:
+            generate_image_variants.delay(name)
+        except Exception:
+            # без брокера отдаем оригинал, повторная попытка - после IMAGE_VARIANT_PENDING_TIMEOUT
+            logger.exception('Cannot schedule image variants for %s', name)
+
+    def generate(self, name):
+        """
+        Создает недостающие варианты и сохраняет манифест.
+        """
+        try:
+            with self.storage.open(name) as file, Image.open(file) as image:
+                manifest = self._generate(name, image)
+        except (UnidentifiedImageError, OSError):
+            manifest = {'width': None, 'height': None, 'variants': {}}
+        image_variant_cache_service.set_manifest(name, manifest)
+        self._remember(name, manifest)
+        return manifest
+
+    def _generate(self, name, image):
+        manifest = {'width': image.width, 'height': image.height, 'variants': {}}
+        if image.format not in VARIANT_SOURCE_FORMATS or getattr(image, 'is_animated', False):
+            return manifest
+
+        variant_names = self.get_variant_names(name, image.size)
+        missing = [width for width, variant_name in variant_names.items() if not self.storage.exists(variant_name)]
+        if missing:
+            image.load()
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if image.mode in ('P', 'LA') or 'transparency' in image.info else 'RGB')
+            for width in missing:
+                variant = image.copy()
+                variant.thumbnail((width, image.height), Image.LANCZOS)
+                buffer = BytesIO()
+                variant.save(buffer, 'WEBP', quality=IMAGE_VARIANT_QUALITY)
+                self.storage.save(variant_names[width], ContentFile(buffer.getvalue()))
+
+        manifest['variants'] = {str(width): variant_name for width, variant_name in variant_names.items()}
+        return manifest
+
+    def get_srcset(self, name, build_url=None):
+        """
+        Строка srcset из вариантов и оригинала или None, если вариантов нет.
+        build_url - функция, превращающая url хранилища в абсолютный (например, request.build_absolute_uri).
+        """
+        manifest = self.get_manifest(name) if name else None
+        if not manifest or not manifest['variants']:
+            return None
+        build_url = build_url or (lambda url: url)
+        sources = [
+            f'{build_url(self.storage.url(variant_name))} {width}w'
+            for width, variant_name in manifest['variants'].items()
+        ]
+        sources.append(f"{build_url(self.storage.url(name))} {manifest['width']}w")
+        return ', '.join(sources)
+
+    def clear(self):
+        with self._lock:
+            self._manifests.clear()
+
+
+image_variant_service = ImageVariantService()
@@ -0,0 +1,96 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current_profile = ContextVar('garpix_page_profile', default=None)
+
+
+class RequestProfile:
+    """
+    Метрики одного запроса: запросы к БД, время участков рендеринга и попадания в кеш.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.queries_time = 0.0
+        self.timings = {}
+        self.cache = {}
+
+    def add_timing(self, name, duration):
+        timing = self.timings.setdefault(name, [0.0, 0])
+        timing[0] += duration
+        timing[1] += 1
+
+    def add_cache(self, method, hit):
+        counters = self.cache.setdefault(method, {'hit': 0, 'miss': 0})
+        counters['hit' if hit else 'miss'] += 1
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.queries_time += time.perf_counter() - started_at
+
+    @property
+    def total_time(self):
+        return time.perf_counter() - self.started_at
+
+    def get_server_timing(self):
+        metrics = [
+            f'total;dur={self.total_time * 1000:.1f}',
+            f'db;dur={self.queries_time * 1000:.1f};desc="{self.queries} queries"',
+        ]
+        for name, (duration, count) in self.timings.items():
+            metrics.append(f'{name};dur={duration * 1000:.1f};desc="x{count}"')
+        for method, counters in self.cache.items():
+            metrics.append(f'cache.{method};desc="hit {counters["hit"]} miss {counters["miss"]}"')
+        return ', '.join(metrics)
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total_time * 1000, 2),
+            'db_queries': self.queries,
+            'db_ms': round(self.queries_time * 1000, 2),
+            'timings': {name: {'ms': round(duration * 1000, 2), 'count': count}
+                        for name, (duration, count) in self.timings.items()},
+            'cache': self.cache,
+        }
+
+
+def get_current_profile():
+    return _current_profile.get()
+
+
+@contextmanager
+def start_profile():
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextmanager
+def measure(name):
+    """
+    Замеряет время блока, если для текущего запроса включена инструментация.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_timing(name, time.perf_counter() - started_at)
+
+
+def record_cache(method, hit):
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_cache(method, hit)
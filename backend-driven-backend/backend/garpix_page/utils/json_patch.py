@@ -0,0 +1,113 @@
+"""
+Минимальная реализация JSON Patch (RFC 6902) для хранения черновиков: операции add, remove и replace.
+"""
+
+__all__ = ('make_patch', 'apply_patch')
+
+
+def _escape(key):
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _split(path):
+    return [_unescape(token) for token in path.split('/')[1:]] if path else []
+
+
+def make_patch(source, target, path=''):
+    """
+    Операции, превращающие source в target. Словари сравниваются по ключам, списки - по позициям.
+    """
+    if isinstance(source, dict) and isinstance(target, dict):
+        return _make_dict_patch(source, target, path)
+    if isinstance(source, list) and isinstance(target, list):
+        return _make_list_patch(source, target, path)
+    if source == target and type(source) is type(target):
+        return []
+    return [{'op': 'replace', 'path': path, 'value': target}]
+
+
+def _make_dict_patch(source, target, path):
+    ops = [{'op': 'remove', 'path': f'{path}/{_escape(key)}'} for key in source if key not in target]
+    for key, value in target.items():
+        key_path = f'{path}/{_escape(key)}'
+        if key not in source:
+            ops.append({'op': 'add', 'path': key_path, 'value': value})
+        else:
+            ops.extend(make_patch(source[key], value, key_path))
+    return ops
+
+
+def _make_list_patch(source, target, path):
+    ops = []
+    common = min(len(source), len(target))
+    for i in range(common):
+        ops.extend(make_patch(source[i], target[i], f'{path}/{i}'))
+    for i in range(common, len(target)):
+        ops.append({'op': 'add', 'path': f'{path}/{i}', 'value': target[i]})
+    # лишние элементы удаляются с конца, чтобы индексы оставшихся не сдвигались
+    for i in range(len(source) - 1, common - 1, -1):
+        ops.append({'op': 'remove', 'path': f'{path}/{i}'})
+    return ops
+
+
+def apply_patch(document, patch):
+    """
+    Применяет операции к копии document.
+    Документ мог измениться после построения patch, поэтому операции применяются мягко:
+    replace несуществующего ключа добавляет его, remove несуществующего ключа пропускается.
+    """
+    root = {'': _copy(document)}
+    for op in patch:
+        tokens = ['', *_split(op['path'])]
+        parent = root
+        for token in tokens[:-1]:
+            parent = _get_child(parent, token)
+            if parent is None:
+                break
+        if not isinstance(parent, (dict, list)):
+            continue
+        _apply_op(parent, tokens[-1], op)
+    return root['']
+
+
+def _apply_op(parent, token, op):
+    if isinstance(parent, dict):
+        if op['op'] == 'remove':
+            parent.pop(token, None)
+        else:
+            parent[token] = _copy(op['value'])
+        return
+
+    if token == '-':
+        index = len(parent)
+    elif token.isdigit():
+        index = int(token)
+    else:
+        return
+    if op['op'] == 'remove':
+        if index < len(parent):
+            del parent[index]
+    elif op['op'] == 'add' or index >= len(parent):
+        parent.insert(index, _copy(op['value']))
+    else:
+        parent[index] = _copy(op['value'])
+
+
+def _get_child(node, token):
+    if isinstance(node, dict):
+        return node.get(token)
+    if isinstance(node, list) and token.isdigit() and int(token) < len(node):
+        return node[int(token)]
+    return None
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
@@ -0,0 +1,59 @@
+from django.utils.translation import get_language
+
+from garpix_page.cache import menu_cache_service
+from garpix_page.utils.current_site import get_current_site_id
+
+
+def get_menu_item_data(item):
+    try:
+        icon = item.icon.url if item.icon else None
+    except ValueError:
+        icon = None
+    return {
+        'id': item.pk,
+        'title': item.title,
+        'link': item.get_link(),
+        'icon': icon,
+        'target_blank': item.target_blank,
+        'css_class': item.css_class,
+        'children': [],
+    }
+
+
+def build_menu_tree(menu_code, max_depth):
+    """
+    Дерево меню garpix-menu с корневыми пунктами типа menu_code до глубины max_depth (1 - только корни).
+    Все уровни загружаются одним запросом и собираются в памяти; пункты выключенных родителей пропускаются.
+    """
+    from garpix_menu.models import MenuItem
+
+    roots = MenuItem.objects.filter(parent=None, menu_type=menu_code).values('tree_id')
+    items = MenuItem.objects.filter(
+        sites__id=get_current_site_id(), is_active=True, tree_id__in=roots, level__lt=max(max_depth, 1)
+    ).select_related('page').order_by('level', 'sort', 'title')
+
+    tree = []
+    nodes = {}
+    for item in items:
+        if item.parent_id is None:
+            siblings = tree
+        elif item.parent_id in nodes:
+            siblings = nodes[item.parent_id]['children']
+        else:
+            continue
+        nodes[item.pk] = get_menu_item_data(item)
+        siblings.append(nodes[item.pk])
+    return tree
+
+
+def get_menu_tree(menu_code, max_depth):
+    """
+    Готовое для JSON дерево меню из кеша (по коду, глубине, языку и сайту).
+    """
+    language = get_language()
+    site_id = get_current_site_id()
+    tree = menu_cache_service.get_tree(menu_code, max_depth, language, site_id)
+    if tree is None:
+        tree = build_menu_tree(menu_code, max_depth)
+        menu_cache_service.set_tree(menu_code, max_depth, language, site_id, tree)
+    return tree
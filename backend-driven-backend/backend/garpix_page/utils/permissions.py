@@ -0,0 +1,55 @@
+from functools import lru_cache
+
+from django.utils.functional import cached_property
+from rest_framework.views import APIView
+
+
+class PageObjectView(APIView):
+    """
+    View, которую получают классы прав. queryset из одной страницы строится, только если он нужен классу прав.
+    """
+
+    def __init__(self, obj, **kwargs):
+        super().__init__(**kwargs)
+        self.obj = obj
+
+    @cached_property
+    def queryset(self):
+        return type(self.obj).objects.filter(id=self.obj.id)
+
+
+@lru_cache(maxsize=None)
+def get_permission_instances(permission_classes):
+    """
+    Экземпляры классов прав создаются один раз на набор классов. Классы прав DRF не хранят состояние запроса,
+    поэтому экземпляры можно использовать во всех запросах и потоках.
+    """
+    return tuple(permission() for permission in permission_classes)
+
+
+def _check_object_permissions(obj, request, permission_classes):
+    view = PageObjectView(obj)
+    return all(
+        permission.has_object_permission(request, view, obj) and permission.has_permission(request, view)
+        for permission in get_permission_instances(permission_classes)
+    )
+
+
+def has_object_permissions(obj, request, permission_classes):
+    """
+    Проверка прав DRF для объекта страницы. Результат запоминается в запросе,
+    повторная проверка того же объекта в рамках запроса бесплатна.
+    """
+    permission_classes = tuple(permission_classes)
+    if request is None:
+        return _check_object_permissions(obj, request, permission_classes)
+
+    # у rest_framework.request.Request и исходного HttpRequest общая память проверок
+    http_request = getattr(request, '_request', request)
+    memo = getattr(http_request, '_garpix_page_permissions', None)
+    if memo is None:
+        memo = http_request._garpix_page_permissions = {}
+    key = (type(obj), obj.pk, permission_classes)
+    if key not in memo:
+        memo[key] = _check_object_permissions(obj, request, permission_classes)
+    return memo[key]
@@ -0,0 +1,122 @@
+import os
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+# кадры из этих каталогов не считаются местом вызова запроса
+IGNORED_PATHS = ('site-packages', 'dist-packages', 'manage.py', os.path.join('garpix_page', 'tests'), __file__)
+
+
+def get_project_stack():
+    """
+    Стек вызова без кадров Django, сторонних библиотек и тестов: от внешнего вызова к месту запроса.
+    """
+    base_dir = str(settings.BASE_DIR)
+    return [
+        frame for frame in traceback.extract_stack()[:-1]
+        if frame.filename.startswith(base_dir) and not any(path in frame.filename for path in IGNORED_PATHS)
+    ]
+
+
+class CapturedQuery:
+    def __init__(self, sql, stack):
+        self.sql = sql
+        self.stack = stack
+
+    @property
+    def call_site(self):
+        """
+        Ближайший к запросу кадр проекта.
+        """
+        if not self.stack:
+            return '<unknown>'
+        frame = self.stack[-1]
+        return f'{frame.filename}:{frame.lineno} in {frame.name}'
+
+
+class QueryRecorder:
+    """
+    Записывает запросы ко всем базам данных вместе со стеком вызова.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(CapturedQuery(sql, get_project_stack()))
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+
+    def __len__(self):
+        return len(self.queries)
+
+    def get_call_sites(self):
+        """
+        Места вызова, отсортированные по числу запросов.
+        """
+        return Counter(query.call_site for query in self.queries).most_common()
+
+    def get_report(self, stack_limit=3):
+        lines = []
+        for call_site, count in self.get_call_sites():
+            query = next(query for query in self.queries if query.call_site == call_site)
+            lines.append(f'{count} x {call_site}')
+            lines.append(f'    {query.sql[:200]}')
+            for frame in query.stack[-stack_limit - 1:-1][::-1]:
+                lines.append(f'    from {frame.filename}:{frame.lineno} in {frame.name}')
+        return '\n'.join(lines)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudget:
+    """
+    Допустимое число запросов для view в зависимости от объема данных.
+    budget - число или функция от size (количества созданных страниц, компонентов и т.п.).
+
+        budget = QueryBudget('admin_components_list', lambda size: 2)
+        with budget.check(size=len(components)):
+            client.get(url)
+    """
+
+    def __init__(self, name, budget):
+        self.name = name
+        self.budget = budget
+
+    def get_limit(self, size):
+        return self.budget(size) if callable(self.budget) else self.budget
+
+    def check(self, size):
+        return _BudgetCheck(self, size)
+
+
+class _BudgetCheck(QueryRecorder):
+
+    def __init__(self, budget, size):
+        super().__init__()
+        self.budget = budget
+        self.size = size
+
+    def __exit__(self, exc_type, *exc_info):
+        super().__exit__(exc_type, *exc_info)
+        limit = self.budget.get_limit(self.size)
+        if exc_type is None and len(self) > limit:
+            raise QueryBudgetExceeded(
+                f'{self.budget.name}: {len(self)} queries for size {self.size}, budget is {limit}\n'
+                f'{self.get_report()}'
+            )
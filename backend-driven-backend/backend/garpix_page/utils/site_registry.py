@@ -0,0 +1,86 @@
+import threading
+import time
+
+from django.contrib.sites.models import Site
+
+from garpix_page.settings import SITE_REGISTRY_TIMEOUT
+from garpix_page.utils.current_site import get_current_site_id
+
+
+class SiteRegistry:
+    """
+    Сайты в памяти процесса: объекты Site, id и домены без запросов к БД.
+    Сбрасывается сигналами сохранения и удаления Site в этом процессе; другие процессы
+    перечитывают сайты не позже чем через SITE_REGISTRY_TIMEOUT секунд, а при обращении
+    к неизвестному id - сразу, чтобы новый сайт был виден до истечения таймаута.
+    """
+
+    def __init__(self):
+        self._sites = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    @property
+    def sites(self):
+        """
+        {id: Site} в порядке Site.objects.all() (по домену).
+        """
+        sites = self._sites
+        if sites is None or time.monotonic() - self._loaded_at > SITE_REGISTRY_TIMEOUT:
+            sites = self.reload()
+        return sites
+
+    def reload(self):
+        with self._lock:
+            sites = {site.pk: site for site in Site.objects.all()}
+            self._sites, self._loaded_at = sites, time.monotonic()
+        return sites
+
+    def clear(self):
+        self._sites = None
+
+    def get_all(self):
+        return list(self.sites.values())
+
+    def get_ids(self):
+        return list(self.sites)
+
+    def first(self):
+        return next(iter(self.sites.values()), None)
+
+    def get(self, pk):
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise Site.DoesNotExist(f'Site matching id {pk!r} does not exist.')
+        sites = self.sites
+        if pk not in sites:
+            sites = self.reload()
+        try:
+            return sites[pk]
+        except KeyError:
+            raise Site.DoesNotExist(f'Site matching id {pk!r} does not exist.')
+
+    def get_domain(self, pk):
+        return self.get(pk).domain
+
+    def get_current(self):
+        return self.get(get_current_site_id())
+
+    def filter_ids(self, ids):
+        """
+        Существующие id сайтов из переданных (в исходном порядке).
+        """
+        pks = []
+        for pk in ids:
+            try:
+                pks.append(int(pk))
+            except (TypeError, ValueError):
+                continue
+        sites = self.sites
+        if any(pk not in sites for pk in pks):
+            sites = self.reload()
+        return [pk for pk in pks if pk in sites]
+
+
+site_registry = SiteRegistry()
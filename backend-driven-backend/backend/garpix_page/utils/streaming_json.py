@@ -0,0 +1,68 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+
+from garpix_page.serializers import render_json
+from garpix_page.settings import STREAMING_JSON_BATCH_SIZE
+
+
+def is_streaming_request(request):
+    """
+    Потоковый режим списков включается параметром ?stream=1.
+    """
+    return request.GET.get('stream') in ('1', 'true', 'True')
+
+
+def get_stream_pagination(request):
+    """
+    (offset, limit) из параметров запроса, limit=None - без ограничения.
+    """
+    try:
+        offset = max(int(request.GET.get('offset', 0)), 0)
+    except ValueError:
+        offset = 0
+    try:
+        limit = max(int(request.GET['limit']), 0)
+    except (KeyError, ValueError):
+        limit = None
+    return offset, limit
+
+
+def iter_json_list(queryset, serialize_batch, offset=0, limit=None, batch_size=STREAMING_JSON_BATCH_SIZE):
+    """
+    Байты JSON {"results": [...], "count": ..., "offset": ..., "limit": ..., "has_more": ...}.
+    id строк читаются из queryset порциями через .iterator(), serialize_batch(ids) возвращает
+    данные пачки в том же порядке, и каждая пачка отдается сразу после сериализации.
+    Метаданные пагинации известны только после последней пачки и пишутся в конце.
+    """
+    ids = queryset.values_list('pk', flat=True)
+    # одна лишняя строка показывает, есть ли продолжение
+    ids = ids[offset:offset + limit + 1] if limit is not None else ids[offset:]
+    ids = ids.iterator(chunk_size=batch_size)
+
+    yield b'{"results":['
+    count = 0
+    seen = 0
+    has_more = False
+    while True:
+        batch = list(islice(ids, batch_size))
+        if limit is not None and seen + len(batch) > limit:
+            batch = batch[:limit - seen]
+            has_more = True
+        if not batch:
+            break
+        seen += len(batch)
+        rows = serialize_batch(batch)
+        if rows:
+            yield (b',' if count else b'') + b','.join(render_json(row) for row in rows)
+            count += len(rows)
+        if has_more:
+            break
+    metadata = render_json({'count': count, 'offset': offset, 'limit': limit, 'has_more': has_more})
+    yield b'],' + metadata[1:]
+
+
+def streaming_json_list_response(request, queryset, serialize_batch):
+    offset, limit = get_stream_pagination(request)
+    return StreamingHttpResponse(iter_json_list(queryset, serialize_batch, offset, limit),
+                                 content_type='application/json')
@@ -1,3 +1,4 @@
+from garpix_page.cache.string_handling import string_handling_cache_service
 from garpix_page.settings import STRING_HANDLERS as s_h
 from importlib import import_module as i_m
 from functools import reduce
@@ -5,8 +6,19 @@ from functools import reduce
 __all__ = ('apply_string_handling', )
 
 
-obj_init = [getattr(i_m(s[:s.rfind('.')]), s[s.rfind('.') + 1:]) for s in set(s_h)]
+# обработчики создаются один раз, порядок как в STRING_HANDLERS без повторов
+obj_init = [getattr(i_m(s[:s.rfind('.')]), s[s.rfind('.') + 1:])() for s in dict.fromkeys(s_h)]
+
+# результат этих методов зависит только от строки и кешируется
+CACHED_METHODS = ('apply_tag_init', )
 
 
 def apply_string_handling(string, method='apply_tag_init'):
-    return reduce(lambda s, C: getattr(C(), method)(s), obj_init, string)
+    if method not in CACHED_METHODS or not string:
+        return reduce(lambda s, obj: getattr(obj, method)(s), obj_init, string)
+
+    html = string_handling_cache_service.get_html(string, method)
+    if html is None:
+        html = reduce(lambda s, obj: getattr(obj, method)(s), obj_init, string)
+        string_handling_cache_service.set_html(string, method, html)
+    return html
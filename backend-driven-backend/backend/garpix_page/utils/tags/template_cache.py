@@ -0,0 +1,45 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.template import Context, Template
+from garpix_page.settings import TAG_TEMPLATE_CACHE_SIZE
+
+__all__ = ('render_source', 'template_cache', )
+
+
+class TemplateCache(object):
+    """
+    LRU скомпилированных шаблонов тегов, ключ - хеш исходника.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_template(self, source):
+        key = hashlib.md5(source.encode()).digest()
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        template = Template(source)
+        with self._lock:
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = TemplateCache(TAG_TEMPLATE_CACHE_SIZE)
+
+
+def render_source(source):
+    return template_cache.get_template(source).render(Context({}))
@@ -0,0 +1,47 @@
+from django.apps import apps
+
+from .get_languages import get_languages
+
+__all__ = ('build_translation_fields', 'get_translation_fields', 'get_translated_field_variants', )
+
+# модель -> {поле: [поле_язык, ...]}, строится один раз при запуске (GarpixPageConfig.ready)
+_translation_fields = {}
+
+
+def get_localized_field_name(field_name, language):
+    return f'{field_name}_{language.replace("-", "_")}'
+
+
+def _build_model_translation_fields(model):
+    # поле считается переводимым, если у модели есть его варианты для всех языков, в том числе унаследованные
+    # от зарегистрированного в modeltranslation родителя
+    languages = get_languages()
+    model_fields = {field.name for field in model._meta.get_fields()}
+    translation_fields = {}
+    for field in model._meta.get_fields():
+        localized = [get_localized_field_name(field.name, language) for language in languages]
+        if all(name in model_fields for name in localized):
+            translation_fields[field.name] = localized
+    return translation_fields
+
+
+def get_translation_fields(model):
+    """
+    Переводимые поля модели: {поле: [поле_язык, ...]} в порядке settings.LANGUAGES.
+    """
+    translation_fields = _translation_fields.get(model)
+    if translation_fields is None:
+        translation_fields = _translation_fields[model] = _build_model_translation_fields(model)
+    return translation_fields
+
+
+def get_translated_field_variants(model):
+    """
+    Имена всех языковых вариантов переводимых полей модели.
+    """
+    return [name for localized in get_translation_fields(model).values() for name in localized]
+
+
+def build_translation_fields():
+    for model in apps.get_models():
+        get_translation_fields(model)
@@ -9,15 +9,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.conf import settings
 import json
 from datetime import datetime
 
+from ..export import schedule_static_export
 from ..models import BasePage, BaseComponent
 from ..models.components.base_component import PageComponent
 from ..serializers.serializer import get_serializer
+from ..utils.site_registry import site_registry
+from ..utils.streaming_json import is_streaming_request, streaming_json_list_response
+from ..utils.translation_fields import get_translated_field_variants, get_translation_fields
 
 
 def safe_isoformat(date_value):
@@ -41,8 +46,6 @@ def add_model_fields_to_data(data_dict, model_instance, exclude_fields=None):
     """
     Добавляет поля модели в словарь данных, исключая несериализуемые поля, включая переводы
     """
-    from modeltranslation.translator import translator
-
     if exclude_fields is None:
         exclude_fields = set()
 
@@ -53,11 +56,8 @@ def add_model_fields_to_data(data_dict, model_instance, exclude_fields=None):
     }
     non_serializable_fields.update(exclude_fields)
 
-    # Получаем информацию о переводах
-    translation_options = translator.get_options_for_model(model_instance.__class__)
-    translated_fields = []
-    if translation_options:
-        translated_fields = translation_options.get_field_names()
+    # Переводимые поля и их языковые варианты
+    translation_fields = get_translation_fields(model_instance.__class__)
 
     for field in model_instance._meta.fields:
         if field.name not in data_dict and field.name not in non_serializable_fields:
@@ -77,11 +77,8 @@ def add_model_fields_to_data(data_dict, model_instance, exclude_fields=None):
             data_dict[field.name] = field_value
 
             # Добавляем переводы для переводимых полей
-            if field.name in translated_fields:
-                from ..utils.get_languages import get_languages
-                languages = get_languages()
-                for lang in languages:
-                    lang_field_name = f"{field.name}_{lang.replace('-', '_')}"
+            if field.name in translation_fields:
+                for lang_field_name in translation_fields[field.name]:
                     if hasattr(model_instance, lang_field_name):
                         lang_value = getattr(model_instance, lang_field_name, None)
                         if lang_value is not None:
@@ -100,12 +97,7 @@ def get_model_fields_metadata(model):
     """
     Получает метаданные полей модели для API
     """
-    from ..utils.get_languages import get_languages
-    from modeltranslation.translator import translator
-
     fields = []
-    translated_fields = []
-    languages = get_languages()
 
     # Исключаем служебные поля Django и технические поля
     # - id: первичный ключ
@@ -125,23 +117,15 @@ def get_model_fields_metadata(model):
     potential_exclude_fields = {
         'id', 'polymorphic_ctype', 'lft', 'rght', 'tree_id', 'level',
         'sites', 'basepage_ptr', 'ptr', 'basecomponent_ptr', 'url',
-        'created_at', 'updated_at', 'draft_data', 'form_config'  # Исключаем поля дат, черновиков и JSON конфигурацию из формы редактирования
+        'created_at', 'updated_at', 'form_config'  # Исключаем поля дат и JSON конфигурацию из формы редактирования
     }
 
     # Исключаем только те поля, которые действительно существуют в модели
     exclude_fields = {field for field in potential_exclude_fields if field in model_fields}
 
-    # Получаем информацию о переводах для модели
-    translation_options = translator.get_options_for_model(model)
-    if translation_options:
-        translated_fields = translation_options.get_field_names()
-
-    # Создаем список полей переводов для исключения
-    translated_field_variants = set()
-    if translated_fields:
-        for base_field in translated_fields:
-            for lang in languages:
-                translated_field_variants.add(f"{base_field}_{lang.replace('-', '_')}")
+    # Переводимые поля и их языковые варианты (title_en, title_de и т.п.) для исключения
+    translated_fields = get_translation_fields(model)
+    translated_field_variants = set(get_translated_field_variants(model))
 
     for field in model._meta.fields:
         if field.name in exclude_fields:
@@ -192,20 +176,17 @@ def get_translation_info(model):
     Получает информацию о переводах для модели
     """
     from ..utils.get_languages import get_languages
-    from modeltranslation.translator import translator
 
     languages = get_languages()
-    translation_options = translator.get_options_for_model(model)
+    translated_fields = list(get_translation_fields(model))
 
-    if not translation_options:
+    if not translated_fields:
         return {
             "has_translations": False,
             "languages": [],
             "translated_fields": []
         }
 
-    translated_fields = translation_options.get_field_names()
-
     return {
         "has_translations": len(translated_fields) > 0,
         "languages": [{"code": lang, "name": dict(settings.LANGUAGES).get(lang, lang)} for lang in languages],
@@ -260,6 +241,43 @@ def components_metadata(request):
     return Response({'components_metadata': results})
 
 
+def get_ordered_by_ids(queryset, ids, *prefetch):
+    """
+    Объекты пачки id (реальные экземпляры для полиморфных моделей) в порядке ids.
+    """
+    objects = queryset.model.objects.filter(pk__in=ids).prefetch_related(*prefetch).in_bulk()
+    return [objects[pk] for pk in ids if pk in objects]
+
+
+def get_pages_list_data(pages, request):
+    # Обрабатываем каждую страницу с учетом её полиморфного типа
+    pages_data = []
+    for page in pages:
+        # Получаем реальный тип страницы
+        real_page = page.get_real_instance()
+        serializer_class = get_serializer(real_page.__class__)
+        serializer = serializer_class(real_page, context={'request': request})
+
+        page_data = serializer.data.copy()
+
+        # Добавляем специфичные поля для разных типов страниц
+        page_data.update({
+            'page_type': real_page.__class__.__name__,  # Тип страницы
+            'is_published': page_data.get('is_active', False),
+            'meta_title': page_data.get('seo_title', ''),
+            'meta_description': page_data.get('seo_description', ''),
+            'meta_keywords': page_data.get('seo_keywords', ''),
+            'template': getattr(real_page, 'template', 'default'),
+        })
+
+        # Добавляем все специфичные поля модели динамически
+        add_model_fields_to_data(page_data, real_page)
+
+        pages_data.append(page_data)
+
+    return pages_data
+
+
 @api_view(['GET', 'POST'])
 # @permission_classes([IsAuthenticated])  # TODO: Включить авторизацию после тестирования
 def pages_list_create(request):
@@ -283,32 +301,11 @@ def pages_list_create(request):
             except ValueError:
                 pass
 
-        # Обрабатываем каждую страницу с учетом её полиморфного типа
-        pages_data = []
-        for page in pages:
-            # Получаем реальный тип страницы
-            real_page = page.get_real_instance()
-            serializer_class = get_serializer(real_page.__class__)
-            serializer = serializer_class(real_page, context={'request': request})
-
-            page_data = serializer.data.copy()
-
-            # Добавляем специфичные поля для разных типов страниц
-            page_data.update({
-                'page_type': real_page.__class__.__name__,  # Тип страницы
-                'is_published': page_data.get('is_active', False),
-                'meta_title': page_data.get('seo_title', ''),
-                'meta_description': page_data.get('seo_description', ''),
-                'meta_keywords': page_data.get('seo_keywords', ''),
-                'template': getattr(real_page, 'template', 'default'),
-            })
-
-            # Добавляем все специфичные поля модели динамически
-            add_model_fields_to_data(page_data, real_page)
-
-            pages_data.append(page_data)
-
-        return Response(pages_data)
+        if is_streaming_request(request):
+            return streaming_json_list_response(
+                request, pages, lambda ids: get_pages_list_data(get_ordered_by_ids(pages, ids, 'sites'), request)
+            )
+        return Response(get_pages_list_data(pages.prefetch_related('sites'), request))
 
     elif request.method == 'POST':
         try:
@@ -330,15 +327,10 @@ def pages_list_create(request):
                 data['seo_keywords'] = data.pop('meta_keywords')
 
             # Получаем модель для создания страницы
-            from ..utils.get_garpix_page_models import get_garpix_page_models
-            page_models = get_garpix_page_models()
+            from ..utils.get_garpix_page_models import get_garpix_page_model
 
             # Находим нужную модель по типу
-            target_model = BasePage
-            for model in page_models:
-                if model.__name__ == page_type:
-                    target_model = model
-                    break
+            target_model = get_garpix_page_model(page_type, BasePage)
 
             # Используем сериализатор для конкретного типа страницы
             serializer_class = get_serializer(target_model)
@@ -349,8 +341,7 @@ def pages_list_create(request):
 
                 # Если поле sites не передано, добавляем первый сайт
                 if 'sites' not in data or not data.get('sites'):
-                    from django.contrib.sites.models import Site
-                    first_site = Site.objects.first()
+                    first_site = site_registry.first()
                     if first_site:
                         page.sites.add(first_site)
 
@@ -445,19 +436,9 @@ def page_detail(request, page_id):
 
                 # Дополнительно применяем поля, которые сериализатор мог проигнорировать (SEO, переводы и пр.)
                 try:
-                    from modeltranslation.translator import translator as _translator
-                    from ..utils.get_languages import get_languages as _get_languages
                     model_fields = {f.name for f in updated_page._meta.get_fields()}
-                    # Собираем переводные варианты полей
-                    translated_variants = set()
-                    try:
-                        tr_opts = _translator.get_options_for_model(updated_page.__class__)
-                        base_translated = tr_opts.get_field_names() if tr_opts else []
-                        for base in base_translated:
-                            for lang in _get_languages():
-                                translated_variants.add(f"{base}_{lang.replace('-', '_')}")
-                    except Exception:
-                        pass
+                    # Переводные варианты полей
+                    translated_variants = set(get_translated_field_variants(updated_page.__class__))
 
                     # Поля, которые можно обновлять напрямую
                     updatable = set(model_fields) | translated_variants | {
@@ -480,7 +461,7 @@ def page_detail(request, page_id):
 
                     # Применяем простые поля
                     for field_name, field_value in data.items():
-                        if field_name in {'id', 'pk', 'created_at', 'updated_at', 'layout', 'draft_data'}:
+                        if field_name in {'id', 'pk', 'created_at', 'updated_at', 'layout'}:
                             continue
                         if field_name in {'sites', 'parent'}:
                             continue  # обработаны отдельно
@@ -493,10 +474,9 @@ def page_detail(request, page_id):
                     # Обновляем сайты, если переданы
                     if 'sites' in data:
                         try:
-                            from django.contrib.sites.models import Site
                             site_ids = data.get('sites') or []
                             if isinstance(site_ids, list):
-                                updated_page.sites.set(Site.objects.filter(id__in=site_ids))
+                                updated_page.sites.set(site_registry.filter_ids(site_ids))
                         except Exception:
                             pass
 
@@ -507,8 +487,7 @@ def page_detail(request, page_id):
 
                 # Если поле sites не передано, добавляем первый сайт
                 if 'sites' not in data or not data.get('sites'):
-                    from django.contrib.sites.models import Site
-                    first_site = Site.objects.first()
+                    first_site = site_registry.first()
                     if first_site and not updated_page.sites.exists():
                         updated_page.sites.add(first_site)
 
@@ -555,7 +534,8 @@ def page_draft(request, page_id):
     real_page = page.get_real_instance()
 
     if request.method == 'GET':
-        if not real_page.draft_data:
+        draft_data = real_page.get_draft_data(request)
+        if draft_data is None:
             return Response({'detail': 'Draft not found'}, status=status.HTTP_404_NOT_FOUND)
 
         # Возвращаем данные черновика, подменяя оригинальные данные
@@ -563,14 +543,14 @@ def page_draft(request, page_id):
         data = serializer_class(real_page, context={'request': request}).data
 
         # Подменяем данные страницы данными из черновика
-        if 'page_data' in real_page.draft_data:
-            data.update(real_page.draft_data['page_data'])
+        if 'page_data' in draft_data:
+            data.update(draft_data['page_data'])
 
         # Подменяем компоненты данными из черновика
-        if 'components' in real_page.draft_data:
-            data['components'] = real_page.draft_data['components']
+        if 'components' in draft_data:
+            data['components'] = draft_data['components']
 
-        data.update({'is_draft': True, 'has_draft': True})
+        data.update({'is_draft': True, 'has_draft': True, 'draft_revision': real_page.get_draft().revision})
         return Response(data)
 
     # POST - создание или обновление черновика
@@ -579,16 +559,8 @@ def page_draft(request, page_id):
         page_data = request.data.get('page_data', {})
         components_data = request.data.get('components', [])
 
-        # Сохраняем черновик в JSON поле
-        draft_data = {
-            'page_data': page_data,
-            'components': components_data,
-            'created_at': timezone.now().isoformat(),
-            'updated_at': timezone.now().isoformat()
-        }
-
-        real_page.draft_data = draft_data
-        real_page.save()
+        # Сохраняем черновик как разницу с опубликованной страницей
+        draft = real_page.save_draft({'page_data': page_data, 'components': components_data}, request)
 
         # Возвращаем данные с подменой черновика
         serializer_class = get_serializer(real_page.__class__)
@@ -602,7 +574,7 @@ def page_draft(request, page_id):
         if components_data:
             data['components'] = components_data
 
-        data.update({'is_draft': True, 'has_draft': True})
+        data.update({'is_draft': True, 'has_draft': True, 'draft_revision': draft.revision})
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -610,21 +582,22 @@ def page_draft(request, page_id):
 def page_publish(request, page_id):
     """
     POST /api/pages/{id}/publish/ — опубликовать черновик для страницы {id}
-    Применяет данные из draft_data к оригинальной странице
+    Применяет данные черновика к оригинальной странице
     """
-    from ..utils.get_garpix_page_models import get_garpix_page_component_models
+    from ..utils.get_garpix_page_models import get_garpix_page_component_model
 
     page = get_object_or_404(BasePage, id=page_id)
     real_page = page.get_real_instance()
 
-    if not real_page.draft_data:
+    draft_data = real_page.get_draft_data(request)
+    if draft_data is None:
         return Response({'detail': 'Draft not found'}, status=status.HTTP_404_NOT_FOUND)
 
     with transaction.atomic():
         # Применяем данные страницы из черновика
-        if 'page_data' in real_page.draft_data:
-            page_data = real_page.draft_data['page_data']
-            exclude_fields = {'id', 'pk', 'created_at', 'updated_at', 'draft_data'}
+        if 'page_data' in draft_data:
+            page_data = draft_data['page_data']
+            exclude_fields = {'id', 'pk', 'created_at', 'updated_at'}
 
             for field_name, value in page_data.items():
                 if field_name in exclude_fields:
@@ -636,8 +609,8 @@ def page_publish(request, page_id):
                         pass
 
         # Применяем компоненты из черновика
-        if 'components' in real_page.draft_data:
-            components_data = real_page.draft_data['components']
+        if 'components' in draft_data:
+            components_data = draft_data['components']
 
             # Удаляем все существующие компоненты страницы
             PageComponent.objects.filter(page=real_page).delete()
@@ -664,13 +637,8 @@ def page_publish(request, page_id):
                     else:
                         # Создаем новый компонент
                         component_type = component_data.get('component_type', 'BaseComponent')
-                        component_class = BaseComponent
-
                         # Ищем конкретный класс компонента
-                        for model_class in get_garpix_page_component_models():
-                            if model_class.__name__ == component_type:
-                                component_class = model_class
-                                break
+                        component_class = get_garpix_page_component_model(component_type, BaseComponent)
 
                         # Создаем компонент
                         component = component_class()
@@ -699,9 +667,10 @@ def page_publish(request, page_id):
                     print(f"Error processing component: {e}")
                     continue
 
-        # Очищаем черновик после публикации
-        real_page.draft_data = None
+        # Удаляем черновик после публикации
+        real_page.delete_draft()
         real_page.save()
+        schedule_static_export()
 
         serializer_class = get_serializer(real_page.__class__)
         data = serializer_class(real_page, context={'request': request}).data
@@ -861,6 +830,44 @@ def page_layout(request, page_id):
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+def get_component_pages_prefetch():
+    # Для связи со страницами нужны только id, полиморфная загрузка страниц не требуется
+    return Prefetch('pages', queryset=BasePage.objects.non_polymorphic().only('id'))
+
+
+def get_components_list_data(components, request):
+    # Полиморфный queryset сразу возвращает реальные экземпляры, сериализатор и метаданные полей
+    # собираются один раз на каждый тип компонента
+    serializers = {}
+    fields_metadata = {}
+    components_data = []
+    for component in components:
+        component_class = component.__class__
+        if component_class not in serializers:
+            serializers[component_class] = get_serializer(component_class)
+            fields_metadata[component_class] = get_model_fields_metadata(component_class)
+        serializer = serializers[component_class](component, context={'request': request})
+
+        comp_data = serializer.data.copy()
+
+        # Добавляем информацию о типе компонента
+        comp_data.update({
+            'name': comp_data.get('title', ''),
+            'type': component_class.__name__.lower().replace('component', ''),
+            'component_type': component_class.__name__,
+            'template': getattr(component, 'template', 'default'),
+            'config': {
+                'editable': True,
+                'template': getattr(component, 'template', 'default'),
+                'is_active': comp_data.get('is_active', True)
+            },
+            'fields': fields_metadata[component_class]
+        })
+
+        components_data.append(comp_data)
+    return components_data
+
+
 @api_view(['GET', 'POST'])
 # @permission_classes([IsAuthenticated])  # TODO: Включить авторизацию после тестирования
 def components_list(request):
@@ -870,34 +877,14 @@ def components_list(request):
     """
     if request.method == 'GET':
         components = BaseComponent.objects.filter(is_deleted=False).order_by('-created_at')
-
-        # Обрабатываем каждый компонент с учетом его полиморфного типа
-        components_data = []
-        for component in components:
-            # Получаем реальный тип компонента
-            real_component = component.get_real_instance()
-            serializer_class = get_serializer(real_component.__class__)
-            serializer = serializer_class(real_component, context={'request': request})
-
-            comp_data = serializer.data.copy()
-
-            # Добавляем информацию о типе компонента
-            comp_data.update({
-                'name': comp_data.get('title', ''),
-                'type': real_component.__class__.__name__.lower().replace('component', ''),
-                'component_type': real_component.__class__.__name__,
-                'template': getattr(real_component, 'template', 'default'),
-                'config': {
-                    'editable': True,
-                    'template': getattr(real_component, 'template', 'default'),
-                    'is_active': comp_data.get('is_active', True)
-                },
-                'fields': get_model_fields_metadata(real_component.__class__)
-            })
-
-            components_data.append(comp_data)
-
-        return Response(components_data)
+        if is_streaming_request(request):
+            return streaming_json_list_response(
+                request, components,
+                lambda ids: get_components_list_data(
+                    get_ordered_by_ids(components, ids, get_component_pages_prefetch()), request
+                )
+            )
+        return Response(get_components_list_data(components.prefetch_related(get_component_pages_prefetch()), request))
 
     elif request.method == 'POST':
         try:
@@ -909,15 +896,10 @@ def components_list(request):
             component_type = data.get('component_type', 'TextComponent')  # По умолчанию создаем TextComponent
 
             # Получаем модель для создания компонента
-            from ..utils.get_garpix_page_models import get_garpix_page_models
-            component_models = get_garpix_page_models()
+            from ..utils.get_garpix_page_models import get_garpix_page_component_model
 
             # Находим нужную модель по типу
-            target_model = BaseComponent
-            for model in component_models:
-                if model.__name__ == component_type:
-                    target_model = model
-                    break
+            target_model = get_garpix_page_component_model(component_type, BaseComponent)
 
             # Используем сериализатор для конкретного типа компонента
             serializer_class = get_serializer(target_model)
@@ -1027,6 +1009,37 @@ def component_metadata(request, component_id):
     return Response(metadata)
 
 
+def get_component_instances_data(page_components, request):
+    # Реальные (дочерние) экземпляры компонентов загружаются одним запросом на каждый тип
+    components = BaseComponent.objects.in_bulk({pc.component_id for pc in page_components})
+
+    instances = []
+    for pc in page_components:
+        component = components[pc.component_id]
+        instance = {
+            'id': component.id,
+            'component_id': component.id,
+            'component': {
+                'id': component.id,
+                'title': component.title,
+                'type': component.__class__.__name__,
+                'config': {
+                    'template': component.template,
+                    'html_id': component.html_id,
+                    'is_active': component.is_active
+                }
+            },
+            'data': component.get_api_context_data(request),
+            'page_id': pc.page_id,
+            'view_order': pc.view_order,
+            'created_at': safe_isoformat(component.created_at),
+            'updated_at': safe_isoformat(component.updated_at)
+        }
+        instances.append(instance)
+
+    return instances
+
+
 @api_view(['GET', 'POST'])
 # @permission_classes([IsAuthenticated])  # TODO: Включить авторизацию после тестирования
 def component_instances_list_create(request):
@@ -1041,74 +1054,21 @@ def component_instances_list_create(request):
 
         if page_id:
             # Если передан page_id, получаем экземпляры компонентов конкретной страницы
-            try:
-                page = get_object_or_404(BasePage, id=page_id)
-                # Получаем компоненты страницы через связующую таблицу PageComponent
-                page_components = PageComponent.objects.filter(page=page).select_related('component').order_by('view_order')
-
-                instances = []
-                for pc in page_components:
-                    if pc.component is None or getattr(pc.component, 'is_deleted', False):
-                        continue
-
-                    instance = {
-                        'id': pc.component.id,
-                        'component_id': pc.component.id,
-                        'component': {
-                            'id': pc.component.id,
-                            'title': pc.component.title,
-                            'type': real_component.__class__.__name__,
-                            'config': {
-                                'template': pc.component.template,
-                                'html_id': pc.component.html_id,
-                                'is_active': pc.component.is_active
-                            }
-                        },
-                        'data': pc.component.get_api_context_data(request),
-                        'page_id': pc.page.id,
-                        'view_order': pc.view_order,
-                        'created_at': safe_isoformat(pc.component.created_at),
-                        'updated_at': safe_isoformat(pc.component.updated_at)
-                    }
-                    instances.append(instance)
-
-                return Response(instances)
-
-            except BasePage.DoesNotExist:
-                return Response({'error': 'Page not found'}, status=status.HTTP_404_NOT_FOUND)
-
+            page = get_object_or_404(BasePage.objects.non_polymorphic(), id=page_id)
+            # Получаем компоненты страницы через связующую таблицу PageComponent
+            page_components = PageComponent.objects.filter(page=page).order_by('view_order')
         else:
             # Если page_id не передан, возвращаем все экземпляры компонентов (оригинальное поведение)
             # Получаем все связи страниц с компонентами как экземпляры
-            page_components = PageComponent.objects.select_related('component', 'page').order_by('-component__created_at')
+            page_components = PageComponent.objects.order_by('-component__created_at')
 
-            instances = []
-            for pc in page_components:
-                if pc.component is None or getattr(pc.component, 'is_deleted', False):
-                    continue
-
-                instance = {
-                    'id': pc.component.id,
-                    'component_id': pc.component.id,
-                    'component': {
-                        'id': pc.component.id,
-                        'title': pc.component.title,
-                        'type': real_component.__class__.__name__,
-                        'config': {
-                            'template': pc.component.template,
-                            'html_id': pc.component.html_id,
-                            'is_active': pc.component.is_active
-                        }
-                    },
-                    'data': pc.component.get_api_context_data(request),
-                    'page_id': pc.page.id,
-                    'view_order': pc.view_order,
-                    'created_at': safe_isoformat(pc.component.created_at),
-                    'updated_at': safe_isoformat(pc.component.updated_at)
-                }
-                instances.append(instance)
-
-            return Response(instances)
+        page_components = page_components.filter(component__is_deleted=False)
+        if not page_id and is_streaming_request(request):
+            return streaming_json_list_response(
+                request, page_components,
+                lambda ids: get_component_instances_data(get_ordered_by_ids(page_components, ids), request)
+            )
+        return Response(get_component_instances_data(list(page_components), request))
 
     elif request.method == 'POST':
         try:
@@ -1129,7 +1089,7 @@ def component_instances_list_create(request):
             target_component = None
             if copy_flag in [True, 'true', 'True', '1', 1]:
                 # Клонируем объект с сохранением дочернего типа
-                existing_count = real_component.__class__.objects.filter(title__icontains=real_component.title).count()
+                existing_count = real_component.get_clone_count()
                 new_title = f"{real_component.title} ({existing_count})" if existing_count > 0 else real_component.title
                 target_component = real_component.clone_object(title=new_title)
                 # Убираем привязки страниц у клона (если скопировались)
@@ -1566,12 +1526,11 @@ def site_base_url(request):
     """
     GET /api/site/base-url/ - Получить базовый URL сайта
     """
-    from django.contrib.sites.models import Site
     from django.conf import settings
 
     try:
         # Получаем текущий сайт
-        current_site = Site.objects.get_current()
+        current_site = site_registry.get_current()
         base_url = f"https://{current_site.domain}"
 
         # Если в настройках указан порт, добавляем его
@@ -1597,7 +1556,8 @@ def component_draft(request, component_id):
     real_component = component.get_real_instance()
 
     if request.method == 'GET':
-        if not real_component.draft_data:
+        draft_data = real_component.get_draft_data(request)
+        if draft_data is None:
             return Response({'detail': 'Draft not found'}, status=status.HTTP_404_NOT_FOUND)
 
         # Возвращаем данные черновика, подменяя оригинальные данные
@@ -1605,10 +1565,10 @@ def component_draft(request, component_id):
         data = serializer_class(real_component, context={'request': request}).data
 
         # Подменяем данные компонента данными из черновика
-        if 'component_data' in real_component.draft_data:
-            data.update(real_component.draft_data['component_data'])
+        if 'component_data' in draft_data:
+            data.update(draft_data['component_data'])
 
-        data.update({'is_draft': True, 'has_draft': True})
+        data.update({'is_draft': True, 'has_draft': True, 'draft_revision': real_component.get_draft().revision})
         return Response(data)
 
     # POST - создание или обновление черновика
@@ -1616,15 +1576,8 @@ def component_draft(request, component_id):
         # Получаем данные компонента из запроса
         component_data = request.data.get('component_data', {})
 
-        # Сохраняем черновик в JSON поле
-        draft_data = {
-            'component_data': component_data,
-            'created_at': timezone.now().isoformat(),
-            'updated_at': timezone.now().isoformat()
-        }
-
-        real_component.draft_data = draft_data
-        real_component.save()
+        # Сохраняем черновик как разницу с опубликованным компонентом
+        draft = real_component.save_draft({'component_data': component_data}, request)
 
         # Возвращаем данные с подменой черновика
         serializer_class = get_serializer(real_component.__class__)
@@ -1634,7 +1587,7 @@ def component_draft(request, component_id):
         if component_data:
             data.update(component_data)
 
-        data.update({'is_draft': True, 'has_draft': True})
+        data.update({'is_draft': True, 'has_draft': True, 'draft_revision': draft.revision})
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -1642,19 +1595,20 @@ def component_draft(request, component_id):
 def component_publish(request, component_id):
     """
     POST /api/components/{id}/publish/ — опубликовать черновик для компонента {id}
-    Применяет данные из draft_data к оригинальному компоненту
+    Применяет данные черновика к оригинальному компоненту
     """
     component = get_object_or_404(BaseComponent, id=component_id)
     real_component = component.get_real_instance()
 
-    if not real_component.draft_data:
+    draft_data = real_component.get_draft_data(request)
+    if draft_data is None:
         return Response({'detail': 'Draft not found'}, status=status.HTTP_404_NOT_FOUND)
 
     with transaction.atomic():
         # Применяем данные компонента из черновика
-        if 'component_data' in real_component.draft_data:
-            component_data = real_component.draft_data['component_data']
-            exclude_fields = {'id', 'pk', 'created_at', 'updated_at', 'draft_data'}
+        if 'component_data' in draft_data:
+            component_data = draft_data['component_data']
+            exclude_fields = {'id', 'pk', 'created_at', 'updated_at'}
 
             for field_name, value in component_data.items():
                 if field_name in exclude_fields:
@@ -1665,9 +1619,10 @@ def component_publish(request, component_id):
                     except Exception:
                         pass
 
-        # Очищаем черновик после публикации
-        real_component.draft_data = None
+        # Удаляем черновик после публикации
+        real_component.delete_draft()
         real_component.save()
+        schedule_static_export()
 
         serializer_class = get_serializer(real_component.__class__)
         data = serializer_class(real_component, context={'request': request}).data
@@ -19,6 +19,7 @@ from ..models.components.form_component import FormComponent
 from ..models.form_submission import FormSubmission
 from ..models.form_event import FormEvent, FormEventLog
 from ..handlers.form_event_handlers import EVENT_HANDLERS
+from ..cache import form_submit_cache_service
 from ..serializers.serializer import get_serializer
 
 
@@ -43,6 +44,9 @@ def form_builder_config(request, form_id=None):
                 'email_notifications': form.email_notifications,
                 'notification_emails': form.notification_emails,
                 'save_submissions': form.save_submissions,
+                'rate_limit': form.rate_limit,
+                'rate_limit_period': form.rate_limit_period,
+                'duplicate_window': form.duplicate_window,
                 'is_active': form.is_active,
                 'created_at': form.created_at,
                 'updated_at': form.updated_at,
@@ -74,6 +78,9 @@ def form_builder_config(request, form_id=None):
             form.email_notifications = data.get('email_notifications', form.email_notifications)
             form.notification_emails = data.get('notification_emails', form.notification_emails)
             form.save_submissions = data.get('save_submissions', form.save_submissions)
+            form.rate_limit = data.get('rate_limit', form.rate_limit)
+            form.rate_limit_period = data.get('rate_limit_period', form.rate_limit_period)
+            form.duplicate_window = data.get('duplicate_window', form.duplicate_window)
             form.is_active = data.get('is_active', form.is_active)
             form.save()
         else:
@@ -88,6 +95,9 @@ def form_builder_config(request, form_id=None):
                 email_notifications=data.get('email_notifications', False),
                 notification_emails=data.get('notification_emails', ''),
                 save_submissions=data.get('save_submissions', True),
+                rate_limit=data.get('rate_limit', 0),
+                rate_limit_period=data.get('rate_limit_period', 60),
+                duplicate_window=data.get('duplicate_window', 0),
                 is_active=data.get('is_active', True),
             )
         
@@ -102,6 +112,9 @@ def form_builder_config(request, form_id=None):
             'email_notifications': form.email_notifications,
             'notification_emails': form.notification_emails,
             'save_submissions': form.save_submissions,
+            'rate_limit': form.rate_limit,
+            'rate_limit_period': form.rate_limit_period,
+            'duplicate_window': form.duplicate_window,
             'is_active': form.is_active,
             'created_at': form.created_at,
             'updated_at': form.updated_at,
@@ -114,7 +127,24 @@ def form_submit(request, form_id):
     POST /api/forms/{id}/submit/ - Отправка формы с обработкой событий
     """
     form = get_object_or_404(FormComponent, id=form_id, is_active=True)
-    
+
+    # Защита от дублей: повторная отправка в окне возвращает исходный ответ без записи в БД
+    client_key = form_submit_cache_service.get_client_key(request)
+    idempotency_key = form_submit_cache_service.get_idempotency_key(request, client_key)
+    previous_response = form_submit_cache_service.start_submit(form, idempotency_key)
+    if previous_response == form_submit_cache_service.pending:
+        return Response({'error': 'Отправка уже обрабатывается'}, status=status.HTTP_409_CONFLICT)
+    if previous_response is not None:
+        return Response(previous_response)
+
+    # Ограничение частоты отправок
+    retry_after = form_submit_cache_service.consume_token(form, client_key)
+    if retry_after:
+        form_submit_cache_service.cancel_submit(form, idempotency_key)
+        return Response({'error': 'Слишком много отправок, попробуйте позже'},
+                        status=status.HTTP_429_TOO_MANY_REQUESTS,
+                        headers={'Retry-After': str(retry_after)})
+
     # Валидация данных формы
     form_config = form.form_config
     validation_errors = {}
@@ -137,9 +167,24 @@ def form_submit(request, form_id):
                 validation_errors[field_name] = 'Введите корректный email адрес'
     
     if validation_errors:
+        form_submit_cache_service.cancel_submit(form, idempotency_key)
         return Response({'errors': validation_errors}, status=status.HTTP_400_BAD_REQUEST)
     
     # Сохранение отправки и выполнение событий
+    try:
+        response_data = _process_submission(form, request)
+    except Exception:
+        form_submit_cache_service.cancel_submit(form, idempotency_key)
+        raise
+
+    form_submit_cache_service.finish_submit(form, idempotency_key, response_data)
+    return Response(response_data)
+
+
+def _process_submission(form, request):
+    """
+    Сохраняет отправку и выполняет события формы, возвращает данные ответа
+    """
     with transaction.atomic():
         # Создание записи об отправке
         submission = FormSubmission.objects.create(
@@ -199,7 +244,7 @@ def form_submit(request, form_id):
     if redirect_url:
         response_data['redirect_url'] = redirect_url
     
-    return Response(response_data)
+    return response_data
 
 
 @api_view(['GET', 'POST'])
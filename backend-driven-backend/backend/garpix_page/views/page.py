@@ -2,7 +2,7 @@ from django.conf import settings
 from django.http import Http404
 
 from garpix_page.mixins.views import PageViewMixin
-from ..utils.get_garpix_page_models import get_garpix_page_models
+from ..utils.home_page import get_home_page
 from ..utils.check_redirect import check_redirect
 from django.shortcuts import redirect
 from django.views.generic import DetailView
@@ -30,11 +30,10 @@ class PageView(PageViewMixin, DetailView):
         return context
 
     def _get_home_page(self):
-        for Model in get_garpix_page_models():
-            home_page = Model.on_site.filter(slug='', is_active=True).first()
-            if home_page is not None:
-                return home_page
-        raise Http404
+        home_page = get_home_page()
+        if home_page is None:
+            raise Http404
+        return home_page
 
     def get_object(self, queryset=None):
         """
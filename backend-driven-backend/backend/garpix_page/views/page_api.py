@@ -1,30 +1,41 @@
 from rest_framework import status
-from django.utils.translation import activate
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, set_response_etag
+from django.utils.translation import activate, get_language
 from rest_framework import views
 from rest_framework.response import Response
-import django.apps
+from django.http import HttpResponse
 from django.utils.module_loading import import_string
 from django.conf import settings
 
+from garpix_page.mixins import is_draft_preview
+from garpix_page.mixins.models.draft_mixin import to_json_data
 from garpix_page.mixins.views import PageViewMixin
+from ..cache import draft_cache_service
 from ..models import BasePage
-from ..serializers.serializer import get_serializer
+from ..serializers import can_render_json, render_json, serialize_instance
+from ..settings import COMPILED_SERIALIZERS, PAGE_BUNDLE_MAX_SLUGS
+from ..utils.accept_language import get_request_language
+from ..utils.instrumentation import measure
 from ..utils.get_languages import get_languages
 
-model_list = []
-for model in django.apps.apps.get_models():
-    try:
-        if model.is_for_page_view():
-            model_list.append(model)
-    except:  # noqa
-        pass
-
-
 languages_list = get_languages()
 
 
 class PageApiView(PageViewMixin, views.APIView):
 
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # ответ зависит от языка из заголовка
+        patch_vary_headers(response, ('Accept-Language',))
+        if request.method in ('GET', 'HEAD') and response.status_code == status.HTTP_200_OK:
+            # etag по содержимому ответа, повторный запрос с If-None-Match получает 304
+            if isinstance(response, SimpleTemplateResponse):
+                response.render()
+            set_response_etag(response)
+            response = get_conditional_response(request, etag=response['ETag'], response=response)
+        return response
+
     @staticmethod
     def get_error_page_response_data(page, request, page_name):
         return {
@@ -35,72 +46,61 @@ class PageApiView(PageViewMixin, views.APIView):
             }
         }
 
-    def check_errors(self, page, request):
+    @staticmethod
+    def get_error(page, request):
+        """
+        Страница ошибки для запрошенной страницы: (page_model, status) или None.
+        """
         if page is None:
-            return Response(self.get_error_page_response_data(page, request, 'Page404'),
-                            status=status.HTTP_404_NOT_FOUND)
+            return 'Page404', status.HTTP_404_NOT_FOUND
 
         if getattr(page, 'login_required', False):
             if not request.user.is_authenticated:
-                return Response(self.get_error_page_response_data(page, request, 'Page401'), status=status.HTTP_401_UNAUTHORIZED)
+                return 'Page401', status.HTTP_401_UNAUTHORIZED
 
         if not page.has_permission_required(request):
-            return Response(self.get_error_page_response_data(page, request, 'Page403'), status=status.HTTP_403_FORBIDDEN)
+            return 'Page403', status.HTTP_403_FORBIDDEN
 
         if getattr(page, 'query_parameters_required', None) is not None:
             request_get = set(request.GET.keys())
             parameters = set(page.query_parameters_required)
             if request_get != parameters:
-                return Response(self.get_error_page_response_data(page, request, 'Page404'), status=status.HTTP_404_NOT_FOUND)
+                return 'Page404', status.HTTP_404_NOT_FOUND
 
         return None
 
-    def get_object(self, slugs):
-
-        obj = self.get_instance_by_slug(slugs, languages_list)
-        return obj
-
-    def get(self, request, slugs):  # noqa
-
-        language = languages_list[0]
-        if 'HTTP_ACCEPT_LANGUAGE' in request.META and request.META['HTTP_ACCEPT_LANGUAGE'] in languages_list:
-            language = request.META['HTTP_ACCEPT_LANGUAGE']
-        activate(language)
-
-        # Получаем страницу
-        page = self.get_object(slugs)
-        
-        # Проверяем, нужно ли показывать черновик
-        show_draft = request.GET.get('__garpix_page_draft', '').lower() in ['true', '1', 'yes']
-
-        errors = self.check_errors(page, request)
-        if errors is not None:
-            return errors
-
-        page_context = page.get_context(request, object=page, user=request.user, api=True)
+    def check_errors(self, page, request):
+        error = self.get_error(page, request)
+        if error is None:
+            return None
+        page_name, error_status = error
+        return Response(self.get_error_page_response_data(page, request, page_name), status=error_status)
+
+    def get_page_data(self, request, page, show_draft=False, with_global=True):
+        with measure('page_context'):
+            page_context = page.get_context(request, object=page, user=request.user, api=True)
         
         # Если нужно показать черновик, подменяем данные
-        if show_draft and page.draft_data:
+        draft_data = page.get_draft_data(request) if show_draft else None
+        if draft_data is not None:
             # Подменяем данные страницы данными из черновика
-            if 'page_data' in page.draft_data:
-                page_data = page.draft_data['page_data']
+            if 'page_data' in draft_data:
+                page_data = draft_data['page_data']
                 for field_name, value in page_data.items():
                     if hasattr(page, field_name):
                         setattr(page, field_name, value)
-            
+
             # Подменяем компоненты данными из черновика
-            if 'components' in page.draft_data:
-                page_context['components'] = page.draft_data['components']
-        
+            if 'components' in draft_data:
+                page_context['components'] = draft_data['components']
+
         for k, v in page_context.items():
             if hasattr(v, 'is_for_page_view'):
-                model_serializer_class = get_serializer(v.__class__)
-                page_context[k] = model_serializer_class(v, context={"request": request}).data
+                page_context[k] = serialize_instance(v, request)
         if 'paginated_object_list' in page_context:
             try:
-                serializer_class = get_serializer(page_context['paginated_object_list'][0].__class__)
-                page_context['paginated_object_list'] = serializer_class(page_context['paginated_object_list'],
-                                                                         context={"request": request}, many=True).data
+                page_context['paginated_object_list'] = serialize_instance(list(page_context['paginated_object_list']),
+                                                                           request, many=True)
             except Exception:
                 page_context['paginated_object_list'] = list(
                     {'id': x.id, 'title': x.title, 'get_absolute_url': x.get_absolute_url()} for x in
@@ -110,7 +110,9 @@ class PageApiView(PageViewMixin, views.APIView):
             page_context['per_page'] = page_context['paginator'].per_page
             page_context.pop('paginator')
 
-        page_context['global'] = import_string(settings.GARPIX_PAGE_GLOBAL_CONTEXT)(request, page)
+        if with_global:
+            with measure('global_context'):
+                page_context['global'] = import_string(settings.GARPIX_PAGE_GLOBAL_CONTEXT)(request, page)
         # page_context['object'].update({
         #     'components': page.get_components_context(request, api=True)
         # })
@@ -120,22 +122,106 @@ class PageApiView(PageViewMixin, views.APIView):
         }
         
         # Добавляем информацию о том, показывается ли черновик
-        if show_draft and page.draft_data:
+        if draft_data is not None:
             data['is_draft'] = True
             data['has_draft'] = True
         else:
             data['is_draft'] = False
-            data['has_draft'] = bool(page.draft_data)
+            # черновик загружается вместе со страницей (select_related в PageViewMixin)
+            data['has_draft'] = page.get_draft() is not None
+        return data
+
+    def get_object(self, slugs):
+
+        obj = self.get_instance_by_slug(slugs, languages_list)
+        return obj
+
+    def get(self, request, slugs):  # noqa
+
+        activate(get_request_language(request))
+
+        # Получаем страницу
+        with measure('page_lookup'):
+            page = self.get_object(slugs)
+        # префикс языка в url важнее заголовка, ключи кешей строятся по итоговому языку
+        language = get_language()
         
+        # Проверяем, нужно ли показывать черновик
+        show_draft = is_draft_preview(request)
+
+        errors = self.check_errors(page, request)
+        if errors is not None:
+            return errors
+
+        if show_draft:
+            # предпросмотр собирается один раз на каждую версию черновика
+            version = page.get_draft_preview_version()
+            data = draft_cache_service.get_preview(page.pk, version, language, request.user.pk, request.get_full_path())
+            if data is None:
+                data = to_json_data(self.get_page_data(request, page, show_draft))
+                draft_cache_service.set_preview(page.pk, version, language, request.user.pk, request.get_full_path(),
+                                                data)
+        else:
+            data = self.get_page_data(request, page, show_draft)
+
+        if COMPILED_SERIALIZERS and can_render_json(request):
+            with measure('render'):
+                content = render_json(data)
+            return HttpResponse(content, content_type=request.accepted_media_type)
+        return Response(data)
+
+
+class PageBundleApiView(PageApiView):
+    """
+    Несколько страниц одним запросом: ?slug=a&slug=b/c.
+    Пути разбираются за один проход по url_patterns, страницы и их компоненты загружаются пачкой,
+    общий контекст собирается один раз, компоненты нескольких страниц - один раз на компонент.
+    Ответ: {"global": ..., "pages": {slug: {"status": ..., "page_model": ..., "init_state": ...}}}.
+    """
+
+    def get(self, request):  # noqa
+        slugs_list = list(dict.fromkeys(slugs.strip('/') for slugs in request.GET.getlist('slug')))
+        if not slugs_list:
+            return Response({'slug': 'Не указаны страницы'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(slugs_list) > PAGE_BUNDLE_MAX_SLUGS:
+            return Response({'slug': f'Не более {PAGE_BUNDLE_MAX_SLUGS} страниц за запрос'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        language = get_request_language(request)
+        activate(language)
+
+        with measure('page_lookup'):
+            instances = self.get_instances_by_slugs(slugs_list, languages_list)
+            BasePage.prefetch_components([page for lang, page in instances.values() if page is not None])
+
+        with measure('global_context'):
+            global_context = import_string(settings.GARPIX_PAGE_GLOBAL_CONTEXT)(request, None)
+
+        pages = {}
+        for slugs, (lang, page) in instances.items():
+            # префикс языка в пути важнее заголовка
+            activate(lang or language)
+            error = self.get_error(page, request)
+            if error is not None:
+                page_name, error_status = error
+                pages[slugs] = {'status': error_status, 'page_model': page_name, 'init_state': {'object': None}}
+                continue
+            pages[slugs] = {'status': status.HTTP_200_OK, **self.get_page_data(request, page, with_global=False)}
+        activate(language)
+
+        data = {'global': global_context, 'pages': pages}
+        if COMPILED_SERIALIZERS and can_render_json(request):
+            with measure('render'):
+                content = render_json(data)
+            return HttpResponse(content, content_type=request.accepted_media_type)
         return Response(data)
 
 
 class PageApiListView(views.APIView):
     def get(self, request):  # noqa
-        from garpix_page.utils.get_garpix_page_models import get_garpix_page_models
-        models_list = get_garpix_page_models()
+        from garpix_page.utils.get_garpix_page_models import registry
         data = {}
-        for model in models_list:
-            for key, value in model.url_patterns().items():
-                data.update({str(key).format(model_name=model.__name__): str(value['verbose_name']).format(model_title=model._meta.verbose_name)})
+        for url_pattern in registry.url_patterns:
+            model, key, value = url_pattern['model'], url_pattern['key'], url_pattern['value']
+            data.update({str(key).format(model_name=model.__name__): str(value['verbose_name']).format(model_title=model._meta.verbose_name)})
         return Response(data)
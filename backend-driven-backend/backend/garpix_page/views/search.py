@@ -0,0 +1,27 @@
+from django.utils import translation
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..search import suggestion_index
+from ..utils.current_site import get_current_site_id
+from ..utils.get_languages import get_languages
+
+
+@api_view(['GET'])
+def search_suggest(request):
+    """
+    GET /api/search/suggest/?q=... - Подсказки по заголовкам страниц для поисковой строки
+    """
+    query = request.GET.get('q', '')
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+
+    languages = get_languages()
+    language = translation.get_language()
+    if language not in languages:
+        language = languages[0]
+
+    results = suggestion_index.suggest(query, get_current_site_id(), language, limit)
+    return Response({'results': results})
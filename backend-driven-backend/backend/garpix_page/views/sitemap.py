@@ -1,31 +1,151 @@
+import hashlib
+from xml.sax.saxutils import escape
+
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.shortcuts import get_current_site
+from django.db.models import Count, F, Max
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.decorators.http import require_GET
+
+from garpix_page.cache import sitemap_cache_service
 from garpix_page.models import GarpixPageSiteConfiguration
-from django.contrib.sitemaps import GenericSitemap
 from garpix_page.models.base_page import BasePage
-from django.contrib.sitemaps.views import sitemap
+from garpix_page.settings import SITEMAP_SECTION_SIZE
+from garpix_page.utils.get_current_language_code_url_prefix import get_current_language_code_url_prefix
+
+SITEMAP_INDEX_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n' \
+                       '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_INDEX_FOOTER = '</sitemapindex>\n'
+SITEMAP_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n' \
+                 '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_FOOTER = '</urlset>\n'
 
 
-def sitemap_view(request, section=None,
-            template_name='sitemap.xml', content_type='application/xml'):
+def get_sitemap_queryset():
+    return BasePage.on_site.filter(is_active=True, display_on_sitemap=True)
 
-    pages = {
-        'queryset': BasePage.on_site.filter(is_active=True, display_on_sitemap=True).order_by('title'),
-        'date_field': 'created_at'
-    }
-    extra_data = {
-        'priority': 1.0
-    }
+
+def get_changefreq():
     try:
-        config = GarpixPageSiteConfiguration.get_solo()
-        extra_data.update({
-            'changefreq': config.sitemap_frequency
-        })
+        return GarpixPageSiteConfiguration.get_solo().sitemap_frequency
     except Exception:
-        pass
-
-    sitemaps = {
-            'pages': GenericSitemap(
-                pages,
-                **extra_data
-            ),
-    }
-    return sitemap(request, sitemaps, section, template_name, content_type)
+        return None
+
+
+def get_section_name(content_type, bucket):
+    return f'{content_type.app_label}-{content_type.model}-{bucket}'
+
+
+def get_section_queryset(section):
+    """
+    Страницы секции: одна модель и диапазон id [bucket * SITEMAP_SECTION_SIZE, (bucket + 1) * SITEMAP_SECTION_SIZE).
+    """
+    try:
+        app_label, model, bucket = section.split('-')
+        bucket = int(bucket)
+        content_type = ContentType.objects.get_by_natural_key(app_label, model)
+    except (ValueError, ContentType.DoesNotExist):
+        raise Http404('No sitemap section named %r' % section)
+    return get_sitemap_queryset().filter(
+        polymorphic_ctype=content_type,
+        id__gte=bucket * SITEMAP_SECTION_SIZE,
+        id__lt=(bucket + 1) * SITEMAP_SECTION_SIZE,
+    )
+
+
+@require_GET
+def sitemap_index_view(request):
+    """
+    Индекс карты сайта: по одной секции на модель и диапазон id, lastmod - последнее изменение в секции.
+    """
+    sections = get_sitemap_queryset().annotate(
+        bucket=F('id') / SITEMAP_SECTION_SIZE
+    ).values('polymorphic_ctype', 'bucket').annotate(
+        lastmod=Max('updated_at')
+    ).order_by('polymorphic_ctype', 'bucket')
+    sections = list(sections)
+
+    # etag меняется и при удалении страниц, когда lastmod секций остается прежним
+    etag = '"%s"' % hashlib.md5(f'{sitemap_cache_service.get_version()}_{sections!r}'.encode()).hexdigest()
+    response_lastmod = max((section['lastmod'] for section in sections), default=None)
+    last_modified = int(response_lastmod.timestamp()) if response_lastmod is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return response
+
+    base_url = f'{request.scheme}://{get_current_site(request).domain}'
+    content = [SITEMAP_INDEX_HEADER]
+    for section in sections:
+        content_type = ContentType.objects.get_for_id(section['polymorphic_ctype'])
+        section_name = get_section_name(content_type, section['bucket'])
+        location = base_url + reverse('garpix_page:sitemap_section', kwargs={'section': section_name})
+        content.append(f'<sitemap><loc>{escape(location)}</loc>'
+                       f'<lastmod>{section["lastmod"].isoformat()}</lastmod></sitemap>\n')
+    content.append(SITEMAP_INDEX_FOOTER)
+
+    response = HttpResponse(''.join(content), content_type='application/xml')
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+@require_GET
+def sitemap_section_view(request, section):
+    """
+    Секция карты сайта. Строится потоково по values() без создания объектов страниц
+    и кешируется с валидатором из max(updated_at) и количества страниц секции.
+    """
+    queryset = get_section_queryset(section)
+    stats = queryset.aggregate(lastmod=Max('updated_at'), count=Count('id'))
+    if not stats['count']:
+        raise Http404('No sitemap section named %r' % section)
+
+    changefreq = get_changefreq()
+    language = translation.get_language()
+    version = sitemap_cache_service.get_version()
+    validator = hashlib.md5(
+        f'{stats["lastmod"].isoformat()}_{stats["count"]}_{changefreq}_{version}'.encode()
+    ).hexdigest()
+    last_modified = int(stats['lastmod'].timestamp())
+
+    response = get_conditional_response(request, etag=f'"{validator}"', last_modified=last_modified)
+    if response is not None:
+        return response
+
+    content = sitemap_cache_service.get_section(section, language, request.scheme, validator)
+    if content is not None:
+        response = HttpResponse(content, content_type='application/xml')
+    else:
+        base_url = f'{request.scheme}://{get_current_site(request).domain}{get_current_language_code_url_prefix()}'
+        response = StreamingHttpResponse(
+            _generate_section(queryset, base_url, changefreq, (section, language, request.scheme, validator)),
+            content_type='application/xml',
+        )
+    response.headers['ETag'] = f'"{validator}"'
+    response.headers['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def _generate_section(queryset, base_url, changefreq, cache_key):
+    changefreq = f'<changefreq>{changefreq}</changefreq>' if changefreq else ''
+    parts = [SITEMAP_HEADER]
+    yield parts[0]
+
+    chunk = []
+    for url, updated_at in queryset.order_by('id').values_list('url', 'updated_at').iterator(chunk_size=2000):
+        chunk.append(f'<url><loc>{escape(base_url + url)}</loc><lastmod>{updated_at.isoformat()}</lastmod>'
+                     f'{changefreq}<priority>1.0</priority></url>\n')
+        if len(chunk) >= 2000:
+            parts.append(''.join(chunk))
+            chunk = []
+            yield parts[-1]
+    parts.append(''.join(chunk) + SITEMAP_FOOTER)
+    yield parts[-1]
+
+    # в кеш попадает только полностью сформированная секция
+    sitemap_cache_service.set_section(*cache_key, ''.join(parts))
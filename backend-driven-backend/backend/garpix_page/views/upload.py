@@ -1,21 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.storage import default_storage
 from django.views.generic import View
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.http import JsonResponse
-from django.core.files.storage import FileSystemStorage
+
+from ..settings import UPLOAD_WORKERS
+from ..utils.content_upload import store_upload
+from ..utils.image_variants import image_variant_service
 
 
 @method_decorator(csrf_exempt, name='dispatch')
 class DgjsUpload(View):
+    """
+    Загрузка файлов из редактора grapesjs.
+    Файлы сохраняются по хешу содержимого (одинаковые файлы хранятся один раз), webp варианты изображений
+    создаются в celery. В variants для каждого файла возвращаются будущие url вариантов по ширине.
+    """
+
     def post(self, request, *args, **kwargs):
         user = request.user
         if user.is_staff:
             files = request.FILES.getlist('files[]')
-            data = []
-            fs = FileSystemStorage()
-            for file in files:
-                filename = fs.save(file.name, file)
-                file_url = fs.url(filename)
-                data.append(request.build_absolute_uri(file_url))
-            return JsonResponse({'data': data})
+            with ThreadPoolExecutor(max_workers=max(1, min(UPLOAD_WORKERS, len(files)))) as executor:
+                uploads = list(executor.map(store_upload, files))
+
+            data, variants = [], []
+            for upload in uploads:
+                variant_names = upload.get_variant_names()
+                if variant_names:
+                    image_variant_service.schedule(upload.name)
+                data.append(request.build_absolute_uri(default_storage.url(upload.name)))
+                variants.append({
+                    width: request.build_absolute_uri(default_storage.url(name))
+                    for width, name in variant_names.items()
+                })
+            return JsonResponse({'data': data, 'variants': variants})
         return JsonResponse({'data': []})